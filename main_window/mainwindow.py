@@ -12,6 +12,7 @@ from enum import Enum
 from pathlib import Path
 from typing import ClassVar
 
+import numpy as np
 import QCustomPlot_PyQt6 as qcp
 from PyQt6 import uic
 from PyQt6.QtCore import QSize, Qt, QTimer
@@ -26,10 +27,7 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
 )
 
-from core.circle import Circle
-from core.line import Line
 from core.point import Point
-from core.polygon import Polygon
 from dialog_window.circle_edit_dialog import CircleEditDialogWindow
 from dialog_window.line_edit_dialog import LineEditDialogWindow
 from dialog_window.point_edit_dialog import PointEditDialogWindow
@@ -42,8 +40,13 @@ from draw.point_drawer import PointDrawer
 from draw.polygon_drawer import PolygonDrawer
 from draw.trajectory_drawer import TrajectoryDrawer
 from pathfinding.pathfinding import Route, matrix_calculation, route_calculation
+from planner.map_loader import MapFormatError, load_map_objects
+from planner.planning import remap_tours
 from tsp_algorithms.brute_force import BruteForceSolver
+from tsp_algorithms.cache import CachedSolver, SolutionCache
 from tsp_algorithms.little_algorithm import LittleAlgorithm
+from tsp_algorithms.local_search import LocalSearchSolver
+from tsp_algorithms.selection import choose_solver
 
 
 class Algorithm(Enum):
@@ -53,6 +56,8 @@ class Algorithm(Enum):
 
     LITTLE = 0
     BRUTE_FORCE = 1
+    LOCAL_SEARCH = 2
+    AUTO = 3
 
 
 class MainWindow(QMainWindow):
@@ -66,6 +71,7 @@ class MainWindow(QMainWindow):
         "Line": LineEditDialogWindow,
         "Polygon": PolygonEditDialogWindow
     }
+    solve_time_limit: ClassVar[float] = 10.0
 
     def __init__(self) -> None:
         """
@@ -74,7 +80,9 @@ class MainWindow(QMainWindow):
         super().__init__()
         self.geo_objects: list[ABCDrawer] = []
         self.points_polygon: list[Point] = []
-        self.algorithm: Algorithm = Algorithm.LITTLE
+        self.algorithm: Algorithm = Algorithm.AUTO
+        self.solution_cache = SolutionCache()
+        self.previous_solution: tuple[list[Point], list[list[int]]] | None = None
         self.trajectory_drawers: list[TrajectoryDrawer] = []
         self.ui_timer: QTimer = None
         self.start_point: PointDrawer = None
@@ -116,6 +124,8 @@ class MainWindow(QMainWindow):
         self.algo_group.setExclusive(True)
         self.algo_group.addAction(self.algoLittle)
         self.algo_group.addAction(self.algoBruteForce)
+        self.algo_group.addAction(self.algoLocalSearch)
+        self.algo_group.addAction(self.algoAuto)
         self.algo_group.triggered.connect(self.chooseAlgorithm)
 
         self.setupAnimation()
@@ -315,39 +325,28 @@ class MainWindow(QMainWindow):
         if file_path:
             self.geo_objects = []
             self.trajectory_drawers = []
-            with Path(file_path).open("r", encoding="utf-8") as file:
-                obj_list = file.readlines()
-                for obj in obj_list:
-                    params = obj.split("|")
-                    len_of_start_point_line = 4
-                    if len(params) == len_of_start_point_line:
-                        start_point_params = params[1]
-                        start_point_name = params[2]
-                        start_point = Point.load(start_point_params)
-                        self.start_point = PointDrawer(start_point.x, start_point.y, start_point_name)
-                        self.start_point.is_start_point = True
-                        self.geo_objects.append(self.start_point)
-                        continue
-                    obj_type = params[0]
-                    obj_params = params[1]
-                    obj_name = params[2].replace("\n", "")
-
-                    if obj_type == "Point":
-                        point = Point.load(obj_params)
-                        point_draw = PointDrawer(point.x, point.y, obj_name)
-                        self.geo_objects.append(point_draw)
-                    elif obj_type == "Line":
-                        line = Line.load(obj_params)
-                        line_draw = LineDrawer(line.start, line.end, obj_name)
-                        self.geo_objects.append(line_draw)
-                    elif obj_type == "Circle":
-                        circle = Circle.load(obj_params)
-                        circle_draw = CircleDrawer(circle.center, circle.radius, obj_name)
-                        self.geo_objects.append(circle_draw)
-                    elif obj_type == "Polygon":
-                        polygon = Polygon.load(obj_params)
-                        polygon_draw = PolygonDrawer(polygon.points, obj_name)
-                        self.geo_objects.append(polygon_draw)
+            try:
+                map_objects = load_map_objects(file_path)
+            except (MapFormatError, ValueError) as error:
+                QMessageBox.information(self, "Траектория БПЛА", str(error))
+                return
+
+            for obj_type, geo_object, obj_name, is_start_point in map_objects:
+                if obj_type == "Point":
+                    point_draw = PointDrawer(geo_object.x, geo_object.y, obj_name)
+                    if is_start_point:
+                        point_draw.is_start_point = True
+                        self.start_point = point_draw
+                    self.geo_objects.append(point_draw)
+                elif obj_type == "Line":
+                    line_draw = LineDrawer(geo_object.start, geo_object.end, obj_name)
+                    self.geo_objects.append(line_draw)
+                elif obj_type == "Circle":
+                    circle_draw = CircleDrawer(geo_object.center, geo_object.radius, obj_name)
+                    self.geo_objects.append(circle_draw)
+                elif obj_type == "Polygon":
+                    polygon_draw = PolygonDrawer(geo_object.points, obj_name)
+                    self.geo_objects.append(polygon_draw)
 
             self.updateObjectList()
             self.redraw()
@@ -416,15 +415,45 @@ class MainWindow(QMainWindow):
                 "Ha карте нет контрольных точек")
             return
 
-        routes = route_calculation(control_points, obstacles)
+        def show_progress(done: int, total: int) -> None:
+            self.statusBar.showMessage(f"Расчет маршрутов: {done}/{total}")
+            QApplication.processEvents()
+
+        routes = route_calculation(control_points, obstacles, progress=show_progress)
         matrix = matrix_calculation(routes)
-        if self.algorithm == Algorithm.LITTLE:
-            solver = LittleAlgorithm()
-            path, _ = solver.solve(matrix, 0, self.bpla_count)
-        else:
-            solver = BruteForceSolver()
-            path, _ = solver.solve(matrix, 0, self.bpla_count)
+        path, gap = self.solve_tours(matrix, control_points)
+
+        if not path:
+            QMessageBox.information(self, "Траектория БПЛА",
+                "He удалось найти маршрут за отведенное время")
+            return
 
+        self.set_trajectory_drawers(path, routes, control_points_for_drawer)
+        self.update_animation_duration()
+        self.set_animation_buttons_state(enabled=True)
+        if gap > 0:
+            QMessageBox.information(self, "Траектория БПЛА",
+                f"Маршрут посчитан, оптимальность не доказана "
+                f"(отклонение от оптимума не более {gap:.1%})")
+            return
+        QMessageBox.information(self, "Траектория БПЛА",
+                "Оптимальный маршрут посчитан")
+
+    def set_trajectory_drawers(
+            self,
+            path: list[list[int]],
+            routes: list[list[Route]],
+            control_points: list[Point]
+        ) -> None:
+        """
+        Create drawer of trajectory of every drone.
+
+        Args:
+            path: tours of every drone
+            routes: matrix of routes between every pair of control points
+            control_points: control points without start point
+
+        """
         self.trajectory_drawers = []
 
         for j in range(len(path)):
@@ -435,13 +464,54 @@ class MainWindow(QMainWindow):
 
             total_path = Route(total_path_list)
             self.trajectory_drawers.append(
-                TrajectoryDrawer(total_path, self.custom_plot, control_points_for_drawer)
+                TrajectoryDrawer(total_path, self.custom_plot, control_points)
             )
 
-        self.update_animation_duration()
-        self.set_animation_buttons_state(enabled=True)
-        QMessageBox.information(self, "Траектория БПЛА",
-                "Оптимальный маршрут посчитан")
+    def solve_tours(
+            self,
+            matrix: np.ndarray,
+            control_points: list[Point]
+        ) -> tuple[list[list[int]], float]:
+        """
+        Solve TSP with chosen algorithm, cache of solutions and previous solution as hint.
+
+        Args:
+            matrix: matrix of distances between control points
+            control_points: control points, start point is the first one
+
+        Returns:
+            tours of every drone (empty if no route was found in time limit)
+            and relative gap between found length and lower bound
+
+        """
+        self.statusBar.showMessage("Расчет оптимального маршрута")
+        QApplication.processEvents()
+        if self.algorithm == Algorithm.AUTO:
+            choice = choose_solver(matrix, self.bpla_count, MainWindow.solve_time_limit)
+            solver = choice.create()
+            self.statusBar.showMessage(
+                f"Расчет оптимального маршрута: {choice.name}, "
+                f"ожидаемое время {choice.expected_time:.1f} сек"
+            )
+            QApplication.processEvents()
+        elif self.algorithm == Algorithm.LITTLE:
+            solver = LittleAlgorithm()
+        elif self.algorithm == Algorithm.LOCAL_SEARCH:
+            solver = LocalSearchSolver()
+        else:
+            solver = BruteForceSolver()
+        solver = CachedSolver(solver, self.solution_cache)
+        initial_routes = None
+        if self.previous_solution is not None:
+            initial_routes = remap_tours(self.previous_solution[1], self.previous_solution[0],
+                                         control_points)
+        path, _ = solver.solve(
+            matrix, 0, self.bpla_count, time_limit=MainWindow.solve_time_limit,
+            initial_routes=initial_routes
+        )
+        if path:
+            self.previous_solution = ([Point(point.x, point.y) for point in control_points], path)
+        return path, solver.gap
 
     def chooseAlgorithm(self, action: QAction) -> None:
         """
@@ -454,6 +524,12 @@ class MainWindow(QMainWindow):
         if action == self.algoLittle:
             self.algorithm = Algorithm.LITTLE
             self.statusBar.showMessage("Выбран алгоритм Литтла")
+        elif action == self.algoLocalSearch:
+            self.algorithm = Algorithm.LOCAL_SEARCH
+            self.statusBar.showMessage("Выбран алгоритм локального поиска")
+        elif action == self.algoAuto:
+            self.algorithm = Algorithm.AUTO
+            self.statusBar.showMessage("Алгоритм выбирается автоматически")
         else:
             self.algorithm = Algorithm.BRUTE_FORCE
             self.statusBar.showMessage("Выбран переборный алгоритм")
@@ -1,6 +1,7 @@
 """Module for route calculation logic."""
 
-from itertools import product
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 import numpy as np
 from core.arc import Arc
@@ -23,6 +24,10 @@ except (ImportError, AttributeError):
     )
 
 
+class CalculationCancelledError(Exception):
+    """Custom exception for route calculation cancelled by progress callback."""
+
+
 class Route:
     """Class representing a calculated route."""
 
@@ -37,16 +42,18 @@ class Route:
 
 
 def point_to_point(
-    start: Point, end: Point, obstacles: list[Circle | Line | Polygon]
+    start: Point, end: Point, obstacles: list[Circle | Line | Polygon], workers: int = 1
 ) -> Route:
     """
     Find shortest path using Tangent Graph (supporting Arcs).
+
+    Visibility graph is built on thread pool of given workers count.
     """
     # 1. Собираем узлы и маппинг "узел -> круг"
     nodes, node_to_circle = collect_nodes(start, end, obstacles)
     
     # 2. Строим матрицу (где ребра по кругу имеют вес дуги)
-    matrix = build_visibility_matrix(nodes, obstacles, node_to_circle)
+    matrix = build_visibility_matrix(nodes, obstacles, node_to_circle, workers)
     
     # 3. Индексы старта и финиша (они всегда первые)
     start_idx = 0
@@ -92,26 +99,114 @@ def point_to_point(
     return Route(path_segments)
 
 
+def _row_calculation(
+    row: int, points: list[Point], obstacles: list[Circle | Line | Polygon]
+) -> list[Route]:
+    """Calculate routes from one control point to every control point."""
+    return [
+        Route([]) if row == j else point_to_point(points[row], points[j], obstacles)
+        for j in range(len(points))
+    ]
+
+
+def iter_routes(
+    points: list[Point],
+    obstacles: list[Circle | Line | Polygon],
+    workers: int = 1,
+    progress: Callable[[int, int], bool | None] | None = None,
+) -> Iterator[tuple[int, int, Route]]:
+    """
+    Calculate routes between all pairs of control points one by one.
+
+    Routes are yielded as soon as they are calculated. In several processes
+    whole rows are calculated at once and rows may come in arbitrary order.
+
+    Args:
+        points: control points
+        obstacles: obstacles on the map
+        workers: count of processes used for calculation,
+            routes are calculated in the current process if workers <= 1
+        progress: callback called with (calculated routes count, total routes count)
+            after every calculated route (row for several processes),
+            calculation stops if callback returns False
+
+    Yields:
+        tuples (i, j, route from i-th control point to j-th)
+
+    """
+    n = len(points)
+    total = n * n
+    done = 0
+
+    if workers <= 1 or n <= 1:
+        for i in range(n):
+            for j in range(n):
+                route = Route([]) if i == j else point_to_point(points[i], points[j], obstacles)
+                yield i, j, route
+                done += 1
+                if progress is not None and progress(done, total) is False:
+                    return
+        return
+
+    executor = ProcessPoolExecutor(max_workers=min(workers, n))
+    try:
+        futures = {
+            executor.submit(_row_calculation, i, points, obstacles): i for i in range(n)
+        }
+        for future in as_completed(futures):
+            i = futures[future]
+            for j, route in enumerate(future.result()):
+                yield i, j, route
+            done += n
+            if progress is not None and progress(done, total) is False:
+                return
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def route_calculation(
-    points: list[Point], obstacles: list[Circle | Line | Polygon]
+    points: list[Point],
+    obstacles: list[Circle | Line | Polygon],
+    workers: int = 1,
+    progress: Callable[[int, int], bool | None] | None = None,
 ) -> list[list[Route]]:
-    """Calculate routes between all pairs of control points."""
+    """
+    Calculate routes between all pairs of control points.
+
+    Args:
+        points: control points
+        obstacles: obstacles on the map
+        workers: count of processes used for calculation,
+            routes are calculated in the current process if workers <= 1
+        progress: callback called with (calculated routes count, total routes count),
+            calculation is cancelled if callback returns False
+
+    Returns:
+        matrix of routes, where matrix[i][j] is route from i-th control point to j-th
+
+    Raises:
+        CalculationCancelledError if calculation was cancelled by progress callback
+
+    """
     n = len(points)
     matrix = [[None for _ in range(n)] for _ in range(n)]
+    calculated = 0
 
-    for i, j in product(range(n), range(n)):
-        if i == j:
-            matrix[i][j] = Route([])
-        else:
-            matrix[i][j] = point_to_point(points[i], points[j], obstacles)
+    for i, j, route in iter_routes(points, obstacles, workers, progress):
+        matrix[i][j] = route
+        calculated += 1
+
+    if calculated < n * n:
+        error_msg = f"route calculation cancelled after {calculated} of {n * n} routes"
+        raise CalculationCancelledError(error_msg)
 
     return matrix
 
 
-def matrix_calculation(routes: list[list[Route]]) -> np.ndarray:
-    """Convert Route objects to distance matrix for TSP solver."""
+def matrix_calculation(routes: list[list[Route]], dtype: np.dtype = np.float64) -> np.ndarray:
+    """Convert Route objects to distance matrix for TSP solver (float32 halves its memory)."""
     n = len(routes)
-    dist_matrix = np.zeros((n, n))
+    dist_matrix = np.zeros((n, n), dtype=dtype)
 
     for i in range(n):
         for j in range(n):
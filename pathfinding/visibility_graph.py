@@ -1,7 +1,8 @@
 """Module for building tangent visibility graph for precise circular pathfinding."""
 
 import math
-from itertools import product
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 
 import numpy as np
 from core.circle import Circle
@@ -164,41 +165,177 @@ def collect_nodes(start: Point, end: Point, obstacles: list) -> tuple[list[Point
     return nodes, node_to_circle
 
 
+def _obstacle_arrays(obstacles: list) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pack obstacles into arrays for vectorized visibility checks.
+
+    Returns:
+        tuple (segment starts, segment ends, circle centers, circle radii),
+        where segments are lines and sides of polygons
+
+    """
+    seg_starts = []
+    seg_ends = []
+    centers = []
+    radii = []
+    for obs in obstacles:
+        if isinstance(obs, Line):
+            seg_starts.append((obs.start.x, obs.start.y))
+            seg_ends.append((obs.end.x, obs.end.y))
+        elif isinstance(obs, Polygon):
+            points = obs.points
+            for i in range(len(points) - 1):
+                seg_starts.append((points[i].x, points[i].y))
+                seg_ends.append((points[i + 1].x, points[i + 1].y))
+        elif isinstance(obs, Circle):
+            centers.append((obs.center.x, obs.center.y))
+            radii.append(obs.radius)
+
+    return (
+        np.array(seg_starts, dtype=float).reshape(-1, 2),
+        np.array(seg_ends, dtype=float).reshape(-1, 2),
+        np.array(centers, dtype=float).reshape(-1, 2),
+        np.array(radii, dtype=float),
+    )
+
+
+def _isclose(a: np.ndarray, b: np.ndarray, abs_tol: float) -> np.ndarray:
+    """Vectorized math.isclose with default relative tolerance."""
+    return np.abs(a - b) <= np.maximum(1e-9 * np.maximum(np.abs(a), np.abs(b)), abs_tol)
+
+
+def _blocked_from_point(
+    x1: float,
+    y1: float,
+    xs: np.ndarray,
+    ys: np.ndarray,
+    obstacle_arrays: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+) -> np.ndarray:
+    """
+    Check straight lines from one point to every target point, see is_path_blocked.
+
+    Args:
+        x1: x coordinate of source point
+        y1: y coordinate of source point
+        xs: x coordinates of target points
+        ys: y coordinates of target points
+        obstacle_arrays: obstacles packed by _obstacle_arrays
+
+    Returns:
+        boolean array, True if line to target point intersects any obstacle
+
+    """
+    seg_starts, seg_ends, centers, radii = obstacle_arrays
+    blocked = np.zeros(xs.shape[0], dtype=bool)
+
+    if seg_starts.shape[0]:
+        ax, ay = seg_starts[:, 0], seg_starts[:, 1]
+        bx, by = seg_ends[:, 0], seg_ends[:, 1]
+        px = xs[:, np.newaxis]
+        py = ys[:, np.newaxis]
+        d1 = (bx - ax) * (y1 - ay) - (by - ay) * (x1 - ax)
+        d2 = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+        d3 = (px - x1) * (ay - y1) - (py - y1) * (ax - x1)
+        d4 = (px - x1) * (by - y1) - (py - y1) * (bx - x1)
+        intersect = (((d1 > 0) & (d2 < 0)) | ((d1 < 0) & (d2 > 0))) & \
+                    (((d3 > 0) & (d4 < 0)) | ((d3 < 0) & (d4 > 0)))
+        blocked |= intersect.any(axis=1)
+
+    if centers.shape[0]:
+        cx, cy = centers[:, 0], centers[:, 1]
+        px = xs[:, np.newaxis]
+        py = ys[:, np.newaxis]
+        dist_source = np.sqrt((x1 - cx) ** 2 + (y1 - cy) ** 2)
+        dist_target = np.sqrt((px - cx) ** 2 + (py - cy) ** 2)
+        on_circle = _isclose(dist_source, radii, 1e-3) & _isclose(dist_target, radii, 1e-3)
+
+        dx = px - x1
+        dy = py - y1
+        length = dx * dx + dy * dy
+        degenerate = length == 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            t = ((cx - x1) * dx + (cy - y1) * dy) / length
+        t = np.clip(np.where(degenerate, 0, t), 0, 1)
+        dist_to_center = np.sqrt((x1 + t * dx - cx) ** 2 + (y1 + t * dy - cy) ** 2)
+        intersect = ~degenerate & (dist_to_center < radii - 1e-4)
+        blocked |= (~on_circle & intersect).any(axis=1)
+
+    return blocked
+
+
+def _fill_visibility_rows(
+    rows: np.ndarray,
+    matrix: np.ndarray,
+    nodes: list[Point],
+    circle_ids: np.ndarray,
+    circles: list[Circle],
+    obstacle_arrays: tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+) -> None:
+    """
+    Fill given rows of adjacency matrix, see build_visibility_matrix.
+    """
+    xs = np.array([node.x for node in nodes], dtype=float)
+    ys = np.array([node.y for node in nodes], dtype=float)
+
+    for i in rows:
+        blocked = _blocked_from_point(xs[i], ys[i], xs, ys, obstacle_arrays)
+        dist = np.sqrt((xs[i] - xs) ** 2 + (ys[i] - ys) ** 2)
+        row = np.where(blocked, np.inf, dist)
+
+        if circle_ids[i] >= 0:
+            # Движение по поверхности круга (Дуга)
+            circle = circles[circle_ids[i]]
+            for j in np.flatnonzero(circle_ids == circle_ids[i]):
+                row[j] = get_arc_length(nodes[i], nodes[j], circle)
+
+        row[i] = 0
+        matrix[i] = row
+
+
 def build_visibility_matrix(
-    nodes: list[Point], 
-    obstacles: list, 
-    node_to_circle: dict
+    nodes: list[Point],
+    obstacles: list,
+    node_to_circle: dict,
+    workers: int = 1,
 ) -> np.ndarray:
     """
     Build adjacency matrix.
     Logic:
     - If points on SAME circle -> Weight is Arc Length
     - Else -> Weight is Line Length (if visible)
+
+    Rows are checked against all obstacles at once with NumPy.
+    If workers > 1, blocks of rows are filled on thread pool,
+    result is the same as for one worker.
     """
     n = len(nodes)
     matrix = np.full((n, n), np.inf)
 
-    for i, j in product(range(n), range(n)):
-        if i == j:
-            matrix[i][j] = 0
-            continue
-
-        p1 = nodes[i]
-        p2 = nodes[j]
+    circles = []
+    circle_index = {}
+    circle_ids = np.full(n, -1)
+    for node, circle in node_to_circle.items():
+        if id(circle) not in circle_index:
+            circle_index[id(circle)] = len(circles)
+            circles.append(circle)
+        circle_ids[node] = circle_index[id(circle)]
+
+    obstacle_arrays = _obstacle_arrays(obstacles)
+    fill = partial(
+        _fill_visibility_rows,
+        matrix=matrix,
+        nodes=nodes,
+        circle_ids=circle_ids,
+        circles=circles,
+        obstacle_arrays=obstacle_arrays,
+    )
 
-        # Проверяем, лежат ли обе точки на ОДНОМ круге
-        circle_i = node_to_circle.get(i)
-        circle_j = node_to_circle.get(j)
+    if workers <= 1 or n <= 1:
+        fill(np.arange(n))
+        return matrix
 
-        if circle_i and circle_j and circle_i == circle_j:
-            # Движение по поверхности круга (Дуга)
-            # (Для простоты считаем, что по поверхности можно двигаться всегда)
-            dist = get_arc_length(p1, p2, circle_i)
-            matrix[i][j] = dist
-            
-        else:
-            # Движение по воздуху (Прямая)
-            if not is_path_blocked(p1, p2, obstacles):
-                matrix[i][j] = get_distance(p1, p2)
+    blocks = np.array_split(np.arange(n), min(n, workers * 4))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(fill, blocks))
 
-    return matrix
\ No newline at end of file
+    return matrix
@@ -0,0 +1,5 @@
+"""
+Headless planning module.
+
+This package provides map loading and route planning without GUI dependencies.
+"""
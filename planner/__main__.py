@@ -0,0 +1,126 @@
+"""
+Command line entry point for headless planning.
+
+Usage:
+    python -m planner map.txt --solver little --drones 2 --workers 4
+
+"""
+
+import argparse
+import json
+import math
+import sys
+import time
+from pathlib import Path
+
+from core.point import Point
+from planner.map_loader import MapFormatError, load_map
+from planner.planning import AUTO, SOLVERS, plan, remap_tours
+from planner.result_io import save_plan
+from tsp_algorithms.abstract_solver import SolutionExceptionError
+from tsp_algorithms.cache import SolutionCache
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """
+    Parse command line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m planner",
+        description="Plan drone routes for map file and print result as JSON.",
+    )
+    parser.add_argument("map", help="path to map file")
+    parser.add_argument(
+        "--solver", choices=[*SOLVERS, AUTO], default="little",
+        help=f"TSP solver, '{AUTO}' chooses it by count of points, symmetry and time limit"
+    )
+    parser.add_argument("--drones", type=int, default=1, help="count of drones")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="count of processes for route calculation"
+    )
+    parser.add_argument(
+        "--time-limit", type=float, default=None,
+        help="limit of TSP solution time in seconds, the best route found is printed"
+    )
+    parser.add_argument(
+        "--cache-dir", default=None,
+        help="directory of TSP solution cache, the same problem is not solved twice"
+    )
+    parser.add_argument(
+        "--warm-start", default=None,
+        help="JSON output of previous planning, its routes are hint of TSP solver"
+    )
+    parser.add_argument(
+        "--dtype", choices=["float64", "float32"], default="float64",
+        help="type of distances, float32 halves memory of TSP solver for large maps"
+    )
+    parser.add_argument("--indent", type=int, default=None, help="indent of JSON output")
+    parser.add_argument(
+        "--output", default=None, help="path to binary file for planning result, see planner.result_io"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Run planning and print JSON result.
+
+    Returns:
+        exit code of the program.
+
+    """
+    args = parse_args(argv)
+
+    load_start = time.perf_counter()
+    try:
+        _, points, obstacles = load_map(args.map)
+    except (OSError, MapFormatError, ValueError) as error:
+        sys.stderr.write(f"error: {error}\n")
+        return 2
+    load_time = time.perf_counter() - load_start
+
+    initial_tours = None
+    if args.warm_start is not None:
+        try:
+            with Path(args.warm_start).open(encoding="utf-8") as file:
+                previous = json.load(file)
+            old_points = [Point(x, y) for x, y in previous["points"]]
+            tours = [route["points"] for route in previous["routes"]]
+            initial_tours = remap_tours(tours, old_points, points)
+        except (OSError, ValueError, KeyError, TypeError, IndexError) as error:
+            sys.stderr.write(f"error: {error}\n")
+            return 2
+
+    try:
+        cache = None if args.cache_dir is None else SolutionCache(directory=args.cache_dir)
+        result = plan(
+            points, obstacles, args.solver, args.drones, args.workers,
+            time_limit=args.time_limit, cache=cache, initial_tours=initial_tours,
+            matrix_dtype=args.dtype,
+        )
+    except (OSError, ValueError, SolutionExceptionError) as error:
+        sys.stderr.write(f"error: {error}\n")
+        return 1
+    if math.isinf(result.length):
+        sys.stderr.write("error: no route was found within time limit\n")
+        return 1
+
+    if args.output is not None:
+        save_plan(result, args.output)
+
+    output = result.to_dict()
+    output["timings"] = {"load": load_time, **output["timings"]}
+    output["map"] = args.map
+    output["solver"] = args.solver
+    if result.choice is not None:
+        sys.stderr.write(
+            f"auto: {result.choice.name} (expected {result.choice.expected_time:.2g} s), "
+            f"{result.choice.reason}\n"
+        )
+    output["drones"] = args.drones
+    sys.stdout.write(json.dumps(output, indent=args.indent, ensure_ascii=False) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+Asyncio facade for route planning.
+
+This module provides:
+- AsyncPlanner: class for planning in asyncio applications.
+
+"""
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor
+
+import numpy as np
+
+from core.circle import Circle
+from core.line import Line
+from core.point import Point
+from core.polygon import Polygon
+from planner.planning import PlanResult, plan
+from tsp_algorithms.cache import SolutionCache
+
+
+class AsyncPlanner:
+    """
+    Class for route planning in asyncio applications.
+
+    CPU stages of planning run in executor, so event loop is not blocked.
+    Concurrent requests with the same map and parameters share one calculation.
+    Calculation is cancelled when every request waiting for it is cancelled
+    or timed out: route calculation stops at the next calculated route,
+    TSP solution stops at the next step of search (see TSPSolver.set_cancel_event).
+    """
+
+    def __init__(self, executor: Executor | None = None, workers: int = 1) -> None:
+        """
+        Initialize planner.
+
+        Args:
+            executor: executor for planning, default executor of event loop if None.
+                Executor must run callables in the same process (e.g. ThreadPoolExecutor)
+            workers: count of processes for route calculation
+
+        """
+        self._executor = executor
+        self._workers = workers
+        self._in_flight: dict[tuple, tuple[asyncio.Task, list[int]]] = {}
+
+    @staticmethod
+    def _plan_key(
+            points: list[Point],
+            obstacles: list[Circle | Line | Polygon],
+            solver: str,
+            drones: int,
+            options: dict
+        ) -> tuple:
+        """
+        Return key which identifies planning request.
+
+        Cache of solutions is identified by object, so requests with
+        different caches do not share calculation.
+        """
+        initial_tours = options["initial_tours"]
+        return (
+            tuple(point.save() for point in points),
+            tuple((type(obstacle).__name__, obstacle.save()) for obstacle in obstacles),
+            solver,
+            drones,
+            options["time_limit"],
+            np.dtype(options["matrix_dtype"]).str,
+            None if options["cache"] is None else id(options["cache"]),
+            None if initial_tours is None else tuple(tuple(tour) for tour in initial_tours),
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """
+        Return count of calculations which are running now.
+        """
+        return len(self._in_flight)
+
+    async def _run(
+            self,
+            points: list[Point],
+            obstacles: list[Circle | Line | Polygon],
+            solver: str,
+            drones: int,
+            options: dict
+        ) -> PlanResult:
+        """
+        Run planning in executor.
+        """
+        cancelled = threading.Event()
+        loop = asyncio.get_running_loop()
+        job = functools.partial(
+            plan,
+            points,
+            obstacles,
+            solver=solver,
+            drones=drones,
+            workers=self._workers,
+            progress=lambda _done, _total: not cancelled.is_set(),
+            cancel_event=cancelled,
+            **options,
+        )
+        try:
+            return await loop.run_in_executor(self._executor, job)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    # options of planner.planning.plan are forwarded as they are
+    async def plan(  # noqa: PLR0913
+            self,
+            points: list[Point],
+            obstacles: list[Circle | Line | Polygon],
+            solver: str = "little",
+            drones: int = 1,
+            *,
+            time_limit: float | None = None,
+            matrix_dtype: np.dtype = np.float64,
+            cache: SolutionCache | None = None,
+            initial_tours: list[list[int]] | None = None
+        ) -> PlanResult:
+        """
+        Plan routes of drones through every control point.
+
+        Time of request is limited by asyncio.timeout() of caller,
+        timed out request is cancelled as any other one.
+
+        Args:
+            points: control points, start point is the first one
+            obstacles: obstacles on the map
+            solver: name of TSP solver
+            drones: count of drones
+            time_limit: limit of TSP solution time in seconds, no limit if None
+            matrix_dtype: type of distances
+            cache: cache of TSP solutions, solution is always searched if None
+            initial_tours: tours of previous plan as hint of TSP solver, no hint if None
+
+        Returns:
+            PlanResult with tours and timings of planning stages.
+
+        Raises:
+            asyncio.CancelledError if request is cancelled
+            exceptions of planner.planning.plan
+
+        """
+        options = {
+            "time_limit": time_limit,
+            "matrix_dtype": matrix_dtype,
+            "cache": cache,
+            "initial_tours": initial_tours,
+        }
+        key = self._plan_key(points, obstacles, solver, drones, options)
+        if key not in self._in_flight:
+            task = asyncio.get_running_loop().create_task(
+                self._run(points, obstacles, solver, drones, options)
+            )
+            self._in_flight[key] = (task, [0])
+            task.add_done_callback(functools.partial(self._forget, key))
+        task, waiters = self._in_flight[key]
+
+        waiters[0] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            waiters[0] -= 1
+            if waiters[0] == 0 and not task.done():
+                task.cancel()
+                self._forget(key, task)
+
+    def _forget(self, key: tuple, task: asyncio.Task) -> None:
+        """
+        Remove finished or cancelled calculation from running ones.
+        """
+        if key in self._in_flight and self._in_flight[key][0] is task:
+            del self._in_flight[key]
@@ -0,0 +1,98 @@
+"""
+Map file loading.
+
+This module provides:
+- load_map_objects: parse map file into core geometry objects.
+- load_map: split parsed map into start point, control points and obstacles.
+
+"""
+
+from pathlib import Path
+
+from core.abstract_geometry import ABCGeo
+from core.circle import Circle
+from core.line import Line
+from core.point import Point
+from core.polygon import Polygon
+
+GEO_TYPES: dict[str, type[ABCGeo]] = {
+    "Point": Point,
+    "Line": Line,
+    "Circle": Circle,
+    "Polygon": Polygon,
+}
+
+
+class MapFormatError(Exception):
+    """
+    Custom exception for incorrect map files.
+    """
+
+
+def load_map_objects(file_path: str | Path) -> list[tuple[str, ABCGeo, str, bool]]:
+    """
+    Parse map file.
+
+    Every line of map file has format "type|params|name" and
+    start point line has additional "|Start" suffix.
+
+    Args:
+        file_path: path to map file
+
+    Returns:
+        list of tuples (object type, geometry object, object name, is start point)
+
+    Raises:
+        MapFormatError if line of map file can not be parsed
+
+    """
+    objects = []
+    len_of_start_point_line = 4
+    with Path(file_path).open("r", encoding="utf-8") as file:
+        for line_number, obj in enumerate(file.readlines(), start=1):
+            if not obj.strip():
+                continue
+            params = obj.rstrip("\n").split("|")
+            obj_type = params[0]
+            if len(params) < len_of_start_point_line - 1 or obj_type not in GEO_TYPES:
+                error_msg = f"line {line_number}: can't parse map object '{obj.strip()}'"
+                raise MapFormatError(error_msg)
+
+            is_start_point = len(params) == len_of_start_point_line and obj_type == "Point"
+            geo_object = GEO_TYPES[obj_type].load(params[1])
+            objects.append((obj_type, geo_object, params[2], is_start_point))
+
+    return objects
+
+
+def load_map(file_path: str | Path) -> tuple[Point, list[Point], list[Circle | Line | Polygon]]:
+    """
+    Load map file for route planning.
+
+    Args:
+        file_path: path to map file
+
+    Returns:
+        tuple (start point, control points, obstacles),
+        where control points list starts with start point
+
+    Raises:
+        MapFormatError if map has no start point
+
+    """
+    start_point = None
+    control_points = []
+    obstacles = []
+    for obj_type, geo_object, _, is_start_point in load_map_objects(file_path):
+        if obj_type != "Point":
+            obstacles.append(geo_object)
+        elif is_start_point:
+            start_point = geo_object
+        else:
+            control_points.append(geo_object)
+
+    if start_point is None:
+        error_msg = f"map {file_path} has no start point"
+        raise MapFormatError(error_msg)
+
+    return start_point, [start_point, *control_points], obstacles
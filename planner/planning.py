@@ -0,0 +1,255 @@
+"""
+Route planning without GUI.
+
+This module provides:
+- SOLVERS: mapping from solver name to TSP solver class (see tsp_algorithms.selection).
+- PlanResult: result of route planning.
+- plan: route calculation and TSP solution for control points.
+- remap_tours: tours of previous plan in indices of changed control points.
+
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from core.arc import Arc
+from core.circle import Circle
+from core.line import Line
+from core.point import Point
+from core.polygon import Polygon
+from pathfinding.pathfinding import (
+    CalculationCancelledError,
+    Route,
+    matrix_calculation,
+    route_calculation,
+)
+from tsp_algorithms.abstract_solver import SolverStats
+from tsp_algorithms.cache import CachedSolver, SolutionCache
+from tsp_algorithms.selection import AUTO, SOLVERS, SolverChoice, choose_solver
+
+
+class PlanResult:
+    """
+    Result of route planning.
+    """
+
+    # every argument is a field of result, so result is built in one call
+    def __init__(  # noqa: PLR0913
+            self,
+            points: list[Point],
+            routes: list[list[Route]],
+            matrix: np.ndarray,
+            tours: list[list[int]],
+            length: float,
+            timings: dict[str, float],
+            lower_bound: float | None = None,
+            choice: SolverChoice | None = None,
+            stats: SolverStats | None = None
+        ) -> None:
+        """
+        Initialize planning result.
+
+        Args:
+            points: control points, start point is the first one
+            routes: matrix of routes between every pair of control points
+            matrix: matrix of distances
+            tours: list of tours (indices of control points) for each drone
+            length: summary length of all tours
+            timings: duration of each planning stage in seconds
+            lower_bound: proven lower bound of summary length, equal to length if None
+            choice: automatic choice of TSP solver, None if solver was given by name
+            stats: counters and timings of TSP solver, None if solver was not run
+
+        """
+        self.points = points
+        self.routes = routes
+        self.matrix = matrix
+        self.tours = tours
+        self.length = length
+        self.timings = timings
+        self.lower_bound = length if lower_bound is None else lower_bound
+        self.choice = choice
+        self.stats = stats
+
+    def tour_route(self, tour: list[int]) -> Route:
+        """
+        Join routes between consecutive points of tour.
+
+        Args:
+            tour: indices of control points
+
+        Returns:
+            Route through every point of tour.
+
+        """
+        segments = []
+        for i in range(len(tour) - 1):
+            segments.extend(self.routes[tour[i]][tour[i + 1]].route)
+        return Route(segments)
+
+    @staticmethod
+    def _segment_to_dict(segment: Line | Arc) -> dict:
+        """
+        Return JSON-compatible representation of route segment.
+        """
+        if isinstance(segment, Arc):
+            return {
+                "type": "Arc",
+                "center": [segment.center.x, segment.center.y],
+                "start": [segment.p_start.x, segment.p_start.y],
+                "end": [segment.p_end.x, segment.p_end.y],
+            }
+        return {
+            "type": "Line",
+            "start": [segment.start.x, segment.start.y],
+            "end": [segment.end.x, segment.end.y],
+        }
+
+    def to_dict(self) -> dict:
+        """
+        Return JSON-compatible representation of result.
+        """
+        tours = []
+        for tour in self.tours:
+            route = self.tour_route(tour)
+            tours.append({
+                "points": tour,
+                "length": route.length,
+                "segments": [self._segment_to_dict(segment) for segment in route.route],
+            })
+
+        result = {
+            "points": [[point.x, point.y] for point in self.points],
+            "length": self.length,
+            "lower_bound": self.lower_bound,
+            "routes": tours,
+            "timings": self.timings,
+        }
+        if self.choice is not None:
+            result["choice"] = self.choice.to_dict()
+        if self.stats is not None:
+            result["stats"] = self.stats.to_dict()
+        return result
+
+
+def remap_tours(
+        tours: list[list[int]],
+        old_points: list[Point],
+        new_points: list[Point]
+    ) -> list[list[int]]:
+    """
+    Express tours of previous plan in indices of changed list of control points.
+
+    Points are matched by coordinates, removed points are skipped.
+
+    Args:
+        tours: tours (indices of old_points) for each drone
+        old_points: control points of previous plan
+        new_points: current control points
+
+    Returns:
+        tours of indices of new_points, they may miss new points
+
+    """
+    indices = {}
+    for i, point in enumerate(new_points):
+        indices.setdefault(point, i)
+    return [
+        [indices[old_points[vertex]] for vertex in tour if old_points[vertex] in indices]
+        for tour in tours
+    ]
+
+
+# planning options are passed by CLI, GUI and asyncio facade as they are,
+# so they are kept in signature instead of options object
+def plan(  # noqa: PLR0913
+        points: list[Point],
+        obstacles: list[Circle | Line | Polygon],
+        solver: str = "little",
+        drones: int = 1,
+        workers: int = 1,
+        progress: Callable[[int, int], bool | None] | None = None,
+        time_limit: float | None = None,
+        cache: SolutionCache | None = None,
+        initial_tours: list[list[int]] | None = None,
+        matrix_dtype: np.dtype = np.float64,
+        cancel_event: threading.Event | None = None
+    ) -> PlanResult:
+    """
+    Plan routes of drones through every control point.
+
+    Args:
+        points: control points, start point is the first one
+        obstacles: obstacles on the map
+        solver: name of TSP solver from SOLVERS or AUTO to choose it by matrix and time limit
+        drones: count of drones
+        workers: count of processes for route calculation
+        progress: callback of route calculation progress, see route_calculation
+        time_limit: limit of TSP solution time in seconds, no limit if None
+        cache: cache of TSP solutions, solution is always searched if None
+        initial_tours: tours of previous plan as hint of TSP solver (see remap_tours),
+            no hint if None
+        matrix_dtype: type of distances, float32 halves memory of TSP solver,
+            see precision contract of TSPSolver
+        cancel_event: event which stops TSP solution when it is set (route calculation
+            is stopped by progress callback), planning is not cancelled if None
+
+    Returns:
+        PlanResult with tours and timings of planning stages.
+
+    Raises:
+        ValueError if solver name is unknown or drones count is not positive
+        SolutionExceptionError if there is no route through every control point
+        CalculationCancelledError if route calculation was cancelled by progress callback
+            or TSP solution was cancelled by cancel event
+
+    """
+    if solver not in SOLVERS and solver != AUTO:
+        error_msg = f"unknown solver '{solver}', expected one of: {', '.join([*SOLVERS, AUTO])}"
+        raise ValueError(error_msg)
+    if drones <= 0:
+        error_msg = f"drones count must be positive, got {drones}"
+        raise ValueError(error_msg)
+
+    timings = {}
+
+    stage_start = time.perf_counter()
+    routes = route_calculation(points, obstacles, workers, progress)
+    timings["routes"] = time.perf_counter() - stage_start
+
+    stage_start = time.perf_counter()
+    matrix = matrix_calculation(routes, matrix_dtype)
+    timings["matrix"] = time.perf_counter() - stage_start
+
+    tours = []
+    length = 0.0
+    lower_bound = 0.0
+    choice = None
+    stats = None
+    stage_start = time.perf_counter()
+    if len(points) > 1:
+        if solver == AUTO:
+            choice = choose_solver(matrix, drones, time_limit)
+            tsp_solver = choice.create()
+            solver_name = choice.name
+        else:
+            tsp_solver = SOLVERS[solver]()
+            solver_name = solver
+        if cache is not None:
+            tsp_solver = CachedSolver(tsp_solver, cache, solver_name)
+        tsp_solver.set_cancel_event(cancel_event)
+        tours, length = tsp_solver.solve(
+            matrix.copy(), 0, drones, time_limit=time_limit, initial_routes=initial_tours
+        )
+        if tsp_solver.cancelled:
+            raise CalculationCancelledError
+        lower_bound = tsp_solver.lower_bound
+        stats = tsp_solver.stats
+    timings["solve"] = time.perf_counter() - stage_start
+
+    return PlanResult(
+        points, routes, matrix, tours, float(length), timings, float(lower_bound), choice, stats
+    )
@@ -0,0 +1,255 @@
+"""
+Binary storage of planning results.
+
+This module provides:
+- save_plan: write PlanResult to binary file.
+- load_plan: open binary file through memory mapping.
+- PlanArchive: read-only view of stored planning result.
+
+File layout (little-endian), every section starts at 8-byte aligned offset:
+    header: magic b"RPLN", format version, points count, segments count,
+        tours count, tour vertices count, summary length
+    points: float64 array (n, 2) of control points coordinates
+    matrix: float64 array (n, n) of distances
+    leg offsets: int64 array (n * n + 1), segments of route from i to j
+        are segments[leg_offsets[i * n + j]:leg_offsets[i * n + j + 1]]
+    segments: packed records of kind (uint8) and 6 float64 coordinates,
+        line is (start x, start y, end x, end y, 0, 0),
+        arc is (center x, center y, start x, start y, end x, end y)
+    tour offsets: int64 array (tours count + 1)
+    tour vertices: int32 array of indices of control points of every tour
+
+"""
+
+import math
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from core.arc import Arc
+from core.line import Line
+from core.point import Point
+from pathfinding.pathfinding import Route
+from planner.planning import PlanResult
+
+MAGIC = b"RPLN"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHxxQQQQd")
+LINE_SEGMENT = 0
+ARC_SEGMENT = 1
+SEGMENT_DTYPE = np.dtype([("kind", "u1"), ("coords", "<f8", (6,))])
+
+
+class PlanFormatError(Exception):
+    """
+    Custom exception for incorrect plan files.
+    """
+
+
+def _aligned(offset: int) -> int:
+    """
+    Return offset rounded up to multiple of 8.
+    """
+    return (offset + 7) // 8 * 8
+
+
+def _sections(
+        points_count: int,
+        segments_count: int,
+        tours_count: int,
+        tour_vertices_count: int
+    ) -> list[tuple[str, np.dtype, tuple[int, ...], int]]:
+    """
+    Return name, dtype, shape and offset of every section of file.
+    """
+    layout = [
+        ("points", np.dtype("<f8"), (points_count, 2)),
+        ("matrix", np.dtype("<f8"), (points_count, points_count)),
+        ("leg_offsets", np.dtype("<i8"), (points_count * points_count + 1,)),
+        ("segments", SEGMENT_DTYPE, (segments_count,)),
+        ("tour_offsets", np.dtype("<i8"), (tours_count + 1,)),
+        ("tour_vertices", np.dtype("<i4"), (tour_vertices_count,)),
+    ]
+    sections = []
+    offset = HEADER.size
+    for name, dtype, shape in layout:
+        offset = _aligned(offset)
+        sections.append((name, dtype, shape, offset))
+        offset += dtype.itemsize * math.prod(shape)
+    return sections
+
+
+def _pack_segments(routes: list[list[Route]]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pack segments of every route into records.
+
+    Returns:
+        tuple (leg offsets, segments)
+
+    """
+    n = len(routes)
+    leg_offsets = np.zeros(n * n + 1, dtype="<i8")
+    records = []
+    for i in range(n):
+        for j in range(n):
+            for segment in routes[i][j].route:
+                if isinstance(segment, Arc):
+                    records.append((ARC_SEGMENT, (
+                        segment.center.x, segment.center.y,
+                        segment.p_start.x, segment.p_start.y,
+                        segment.p_end.x, segment.p_end.y,
+                    )))
+                else:
+                    records.append((LINE_SEGMENT, (
+                        segment.start.x, segment.start.y,
+                        segment.end.x, segment.end.y,
+                        0.0, 0.0,
+                    )))
+            leg_offsets[i * n + j + 1] = len(records)
+    return leg_offsets, np.array(records, dtype=SEGMENT_DTYPE)
+
+
+def save_plan(result: PlanResult, file_path: str | Path) -> None:
+    """
+    Write planning result to binary file.
+
+    Args:
+        result: planning result
+        file_path: path to file
+
+    """
+    leg_offsets, segments = _pack_segments(result.routes)
+    tour_offsets = np.zeros(len(result.tours) + 1, dtype="<i8")
+    tour_offsets[1:] = np.cumsum([len(tour) for tour in result.tours])
+    tour_vertices = np.array(
+        [vertex for tour in result.tours for vertex in tour], dtype="<i4"
+    )
+
+    arrays = {
+        "points": np.array([[point.x, point.y] for point in result.points], dtype="<f8"),
+        "matrix": np.asarray(result.matrix, dtype="<f8"),
+        "leg_offsets": leg_offsets,
+        "segments": segments,
+        "tour_offsets": tour_offsets,
+        "tour_vertices": tour_vertices,
+    }
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(result.points),
+        segments.shape[0],
+        len(result.tours),
+        tour_vertices.shape[0],
+        result.length,
+    )
+
+    with Path(file_path).open("wb") as file:
+        file.write(header)
+        for name, dtype, shape, offset in _sections(
+            len(result.points), segments.shape[0], len(result.tours), tour_vertices.shape[0]
+        ):
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(arrays[name].astype(dtype, copy=False).reshape(shape).tobytes())
+
+
+class PlanArchive:
+    """
+    Read-only planning result stored in binary file.
+
+    Arrays are memory mapped, so only accessed parts of file are read.
+    """
+
+    def __init__(self, file_path: str | Path) -> None:
+        """
+        Open binary file of planning result.
+
+        Args:
+            file_path: path to file written by save_plan
+
+        Raises:
+            PlanFormatError if file is not a planning result or it is truncated
+
+        """
+        file_size = Path(file_path).stat().st_size
+        with Path(file_path).open("rb") as file:
+            header = file.read(HEADER.size)
+        if len(header) < HEADER.size:
+            error_msg = f"{file_path} is too short for planning result"
+            raise PlanFormatError(error_msg)
+
+        magic, version, points_count, segments_count, tours_count, vertices_count, length = (
+            HEADER.unpack(header)
+        )
+        if magic != MAGIC or version != FORMAT_VERSION:
+            error_msg = f"{file_path} is not a planning result of version {FORMAT_VERSION}"
+            raise PlanFormatError(error_msg)
+
+        sections = _sections(points_count, segments_count, tours_count, vertices_count)
+        _, dtype, shape, offset = sections[-1]
+        expected_size = offset + dtype.itemsize * math.prod(shape)
+        if file_size < expected_size:
+            error_msg = (f"{file_path} is truncated: {file_size} bytes, "
+                         f"header describes {expected_size} bytes")
+            raise PlanFormatError(error_msg)
+
+        self.length = length
+        self._points_count = points_count
+        for name, dtype, shape, offset in sections:
+            if math.prod(shape) == 0:
+                array = np.zeros(shape, dtype=dtype)
+            else:
+                array = np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=shape)
+            setattr(self, name, array)
+
+    @property
+    def tours(self) -> list[list[int]]:
+        """
+        Return tours (indices of control points) for each drone.
+        """
+        return [
+            self.tour_vertices[start:end].tolist()
+            for start, end in zip(self.tour_offsets[:-1], self.tour_offsets[1:], strict=True)
+        ]
+
+    def leg_segments(self, i: int, j: int) -> np.ndarray:
+        """
+        Return packed segments of route from i-th control point to j-th.
+        """
+        leg = i * self._points_count + j
+        return self.segments[self.leg_offsets[leg]:self.leg_offsets[leg + 1]]
+
+    def leg_route(self, i: int, j: int) -> Route:
+        """
+        Return route from i-th control point to j-th.
+        """
+        route = []
+        for kind, coords in self.leg_segments(i, j).tolist():
+            if kind == ARC_SEGMENT:
+                route.append(Arc(Point(*coords[0:2]), Point(*coords[2:4]), Point(*coords[4:6])))
+            else:
+                route.append(Line(Point(*coords[0:2]), Point(*coords[2:4])))
+        return Route(route)
+
+    def tour_route(self, tour: list[int]) -> Route:
+        """
+        Join routes between consecutive points of tour.
+        """
+        segments = []
+        for i in range(len(tour) - 1):
+            segments.extend(self.leg_route(tour[i], tour[i + 1]).route)
+        return Route(segments)
+
+
+def load_plan(file_path: str | Path) -> PlanArchive:
+    """
+    Open planning result written by save_plan.
+
+    Args:
+        file_path: path to file
+
+    Returns:
+        PlanArchive with memory mapped arrays.
+
+    """
+    return PlanArchive(file_path)
@@ -0,0 +1,192 @@
+"""Tests for asyncio planning facade."""
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pytest
+
+from pathfinding.pathfinding import CalculationCancelledError
+from planner import async_planning
+from planner.async_planning import AsyncPlanner
+from planner.map_loader import load_map
+from tsp_algorithms.local_search import LocalSearchSolver
+from tsp_algorithms.selection import SOLVERS
+
+
+class SlowSolver(LocalSearchSolver):
+    """
+    Local search which starts only after its search budget is exhausted.
+    """
+
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
+        """
+        Wait for exhaustion of budget and solve problem by local search.
+        """
+        budget = self._search_budget(time_limit, node_limit)
+        self.started.set()
+        while not budget.spend():
+            time.sleep(0.01)
+        self.stopped.set()
+        return super().solve(
+            matrix, start, salesmen_count,
+            time_limit=time_limit, node_limit=node_limit, initial_routes=initial_routes,
+        )
+
+
+@pytest.fixture
+def sample_map() -> tuple:
+    """
+    Fixture for control points and obstacles of map.
+    """
+    _, points, obstacles = load_map("map.txt")
+    return points, obstacles
+
+
+@pytest.mark.fast
+def test_plan(sample_map: tuple) -> None:
+    """
+    Test that async planning gives the same result as blocking one.
+    """
+    points, obstacles = sample_map
+    result = asyncio.run(AsyncPlanner().plan(points, obstacles, drones=2))
+    expected = async_planning.plan(points, obstacles, drones=2)
+    assert result.tours == expected.tours
+    assert result.length == expected.length
+
+
+@pytest.mark.fast
+def test_concurrent_requests_are_coalesced(
+        sample_map: tuple,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+    """
+    Test that concurrent requests with the same map share one calculation.
+    """
+    points, obstacles = sample_map
+    calls = []
+    original_plan = async_planning.plan
+
+    def counting_plan(*args: object, **kwargs: object) -> object:
+        calls.append(kwargs)
+        time.sleep(0.05)
+        return original_plan(*args, **kwargs)
+
+    monkeypatch.setattr(async_planning, "plan", counting_plan)
+
+    async def run() -> list:
+        planner = AsyncPlanner()
+        results = await asyncio.gather(
+            planner.plan(points, obstacles),
+            planner.plan(points, obstacles),
+            planner.plan(points, obstacles, drones=2),
+            planner.plan(points, obstacles, time_limit=10),
+            planner.plan(points, obstacles, time_limit=10),
+        )
+        assert planner.in_flight == 0
+        return results
+
+    first, second, third, fourth, fifth = asyncio.run(run())
+    assert len(calls) == 3
+    assert first is second
+    assert third is not first
+    assert fourth is fifth
+    assert fourth is not first
+    assert [call["time_limit"] for call in calls] == [None, None, 10]
+
+
+@pytest.mark.fast
+def test_timeout_cancels_calculation(
+        sample_map: tuple,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+    """
+    Test that timed out request stops route calculation.
+    """
+    points, obstacles = sample_map
+    stopped = threading.Event()
+
+    def slow_plan(*_args: object, progress: Callable, **_kwargs: object) -> object:
+        while progress(0, 1) is not False:
+            time.sleep(0.01)
+        stopped.set()
+        raise CalculationCancelledError
+
+    monkeypatch.setattr(async_planning, "plan", slow_plan)
+
+    async def run() -> AsyncPlanner:
+        planner = AsyncPlanner()
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                await planner.plan(points, obstacles)
+        return planner
+
+    planner = asyncio.run(run())
+    assert stopped.wait(1)
+    assert planner.in_flight == 0
+
+
+@pytest.mark.fast
+def test_calculation_continues_while_someone_waits(
+        sample_map: tuple,
+        monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+    """
+    Test that cancellation of one request does not affect other waiting requests.
+    """
+    points, obstacles = sample_map
+    original_plan = async_planning.plan
+
+    def slow_plan(*args: object, **kwargs: object) -> object:
+        time.sleep(0.1)
+        return original_plan(*args, **kwargs)
+
+    monkeypatch.setattr(async_planning, "plan", slow_plan)
+
+    async def run() -> object:
+        planner = AsyncPlanner()
+        cancelled = asyncio.create_task(planner.plan(points, obstacles))
+        waiting = asyncio.create_task(planner.plan(points, obstacles))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        return await waiting
+
+    assert asyncio.run(run()).tours
+
+
+@pytest.mark.fast
+def test_cancel_stops_solution(sample_map: tuple, monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Test that request cancelled during TSP solution stops search of solver.
+    """
+    points, obstacles = sample_map
+    monkeypatch.setitem(SOLVERS, "slow", SlowSolver)
+    SlowSolver.started.clear()
+    SlowSolver.stopped.clear()
+
+    async def run() -> AsyncPlanner:
+        planner = AsyncPlanner()
+        request = asyncio.create_task(planner.plan(points, obstacles, "slow"))
+        await asyncio.get_running_loop().run_in_executor(None, SlowSolver.started.wait, 10)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+        return planner
+
+    planner = asyncio.run(run())
+    assert SlowSolver.started.is_set()
+    assert SlowSolver.stopped.wait(1)
+    assert planner.in_flight == 0
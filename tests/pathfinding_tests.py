@@ -0,0 +1,148 @@
+"""Tests for route calculation between control points."""
+import math
+from itertools import product
+
+import numpy as np
+import pytest
+
+from core.circle import Circle
+from core.line import Line
+from core.point import Point
+from core.polygon import Polygon
+from pathfinding.pathfinding import (
+    CalculationCancelledError,
+    iter_routes,
+    matrix_calculation,
+    route_calculation,
+)
+from pathfinding.visibility_graph import (
+    build_visibility_matrix,
+    collect_nodes,
+    get_arc_length,
+    get_distance,
+    is_path_blocked,
+)
+from planner.map_loader import load_map
+
+
+@pytest.fixture
+def sample_map() -> tuple:
+    """
+    Fixture for control points and obstacles of map.
+    """
+    _, points, obstacles = load_map("map.txt")
+    return points, obstacles
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("workers", [1, 2])
+def test_iter_routes_yields_every_pair(sample_map: tuple, workers: int) -> None:
+    """
+    Test that every pair of control points is yielded exactly once.
+    """
+    points, obstacles = sample_map
+    pairs = [(i, j) for i, j, _ in iter_routes(points, obstacles, workers)]
+    n = len(points)
+    assert sorted(pairs) == [(i, j) for i in range(n) for j in range(n)]
+
+
+@pytest.mark.fast
+def test_iter_routes_equal_to_route_calculation(sample_map: tuple) -> None:
+    """
+    Test that streamed routes have the same lengths as routes of whole calculation.
+    """
+    points, obstacles = sample_map
+    matrix = matrix_calculation(route_calculation(points, obstacles))
+    for i, j, route in iter_routes(points, obstacles):
+        assert route.length == matrix[i][j]
+
+
+@pytest.mark.fast
+def test_float32_matrix(sample_map: tuple) -> None:
+    """
+    Test that float32 matrix has rounded lengths of routes.
+    """
+    points, obstacles = sample_map
+    routes = route_calculation(points, obstacles)
+    matrix = matrix_calculation(routes)
+    compact = matrix_calculation(routes, np.float32)
+    assert compact.dtype == np.float32
+    assert np.array_equal(compact, matrix.astype(np.float32))
+
+
+@pytest.mark.fast
+def test_progress_callback(sample_map: tuple) -> None:
+    """
+    Test that progress callback gets every calculated route.
+    """
+    points, obstacles = sample_map
+    calls = []
+    route_calculation(points, obstacles, progress=lambda done, total: calls.append((done, total)))
+    total = len(points) ** 2
+    assert calls == [(done, total) for done in range(1, total + 1)]
+
+
+@pytest.mark.fast
+def test_cancel_by_progress_callback(sample_map: tuple) -> None:
+    """
+    Test that calculation stops when progress callback returns False.
+    """
+    points, obstacles = sample_map
+    routes = list(iter_routes(points, obstacles, progress=lambda done, _: done < 4))
+    assert len(routes) == 4
+    with pytest.raises(CalculationCancelledError):
+        route_calculation(points, obstacles, progress=lambda done, _: done < 4)
+
+
+@pytest.fixture
+def crowded_map() -> tuple[list[Point], list]:
+    """
+    Fixture for random points and many obstacles.
+    """
+    rng = np.random.default_rng(seed=42)
+    obstacles = [
+        Circle(Point(*rng.uniform(100, 900, size=2)), rng.uniform(10, 50)) for _ in range(10)
+    ]
+    obstacles += [
+        Line(Point(*rng.uniform(0, 1000, size=2)), Point(*rng.uniform(0, 1000, size=2)))
+        for _ in range(10)
+    ]
+    obstacles.append(Polygon([Point(400, 400), Point(500, 400), Point(450, 500)]))
+    points = [Point(*rng.uniform(0, 1000, size=2)) for _ in range(6)]
+    return points, obstacles
+
+
+@pytest.mark.fast
+def test_visibility_matrix_equal_to_pairwise_checks(crowded_map: tuple) -> None:
+    """
+    Test that vectorized visibility matrix agrees with check of every pair of nodes.
+    """
+    points, obstacles = crowded_map
+    nodes, node_to_circle = collect_nodes(points[0], points[1], obstacles)
+    matrix = build_visibility_matrix(nodes, obstacles, node_to_circle)
+
+    for i, j in product(range(len(nodes)), range(len(nodes))):
+        circle_i = node_to_circle.get(i)
+        if i == j:
+            expected = 0
+        elif circle_i is not None and circle_i is node_to_circle.get(j):
+            expected = get_arc_length(nodes[i], nodes[j], circle_i)
+        elif is_path_blocked(nodes[i], nodes[j], obstacles):
+            expected = np.inf
+        else:
+            expected = get_distance(nodes[i], nodes[j])
+        assert math.isclose(matrix[i][j], expected, abs_tol=1e-9)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("workers", [2, 3, 8])
+def test_threaded_visibility_matrix_equal_to_serial(crowded_map: tuple, workers: int) -> None:
+    """
+    Test that visibility matrix built on thread pool is the same as serial one.
+    """
+    points, obstacles = crowded_map
+    for start, end in product(points[:3], points[:3]):
+        nodes, node_to_circle = collect_nodes(start, end, obstacles)
+        serial = build_visibility_matrix(nodes, obstacles, node_to_circle)
+        threaded = build_visibility_matrix(nodes, obstacles, node_to_circle, workers)
+        assert np.array_equal(serial, threaded)
@@ -0,0 +1,185 @@
+"""Tests for headless planning."""
+import json
+import math
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from core.point import Point
+from planner.__main__ import main
+from planner.map_loader import MapFormatError, load_map
+from planner.planning import plan, remap_tours
+from tsp_algorithms.cache import SolutionCache
+
+
+@pytest.mark.fast
+def test_load_map() -> None:
+    """
+    Test that start point is the first control point and obstacles are separated.
+    """
+    start, points, obstacles = load_map("map.txt")
+    assert points[0] == start
+    assert len(points) == 3
+    assert len(obstacles) == 4
+
+
+@pytest.mark.fast
+def test_load_map_without_start(tmp_path: Path) -> None:
+    """
+    Test that map without start point is rejected.
+    """
+    map_file = tmp_path / "map.txt"
+    map_file.write_text("Point|[100.0, 100.0]|KT1\n", encoding="utf-8")
+    with pytest.raises(MapFormatError):
+        load_map(map_file)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("solver", ["little", "brute_force"])
+def test_plan_visits_every_point(solver: str) -> None:
+    """
+    Test that every control point is visited and tours start in start point.
+    """
+    _, points, obstacles = load_map("map_without_obstacles.txt")
+    result = plan(points, obstacles, solver, drones=2)
+    visited = {point for tour in result.tours for point in tour}
+    assert visited == set(range(len(points)))
+    assert all(tour[0] == tour[-1] == 0 for tour in result.tours)
+    tours_length = sum(result.tour_route(tour).length for tour in result.tours)
+    assert math.isclose(tours_length, result.length, abs_tol=1e-5)
+
+
+@pytest.mark.fast
+def test_plan_parallel_routes_equal_serial() -> None:
+    """
+    Test that route calculation in several processes gives the same matrix.
+    """
+    _, points, obstacles = load_map("map.txt")
+    serial = plan(points, obstacles)
+    parallel = plan(points, obstacles, workers=2)
+    assert (serial.matrix == parallel.matrix).all()
+
+
+@pytest.mark.fast
+def test_cli_output(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that command line interface prints JSON result.
+    """
+    assert main(["map.txt", "--drones", "2"]) == 0
+    output = json.loads(capsys.readouterr().out)
+    assert output["drones"] == 2
+    assert set(output["timings"]) == {"load", "routes", "matrix", "solve"}
+    assert math.isclose(sum(route["length"] for route in output["routes"]), output["length"])
+
+
+@pytest.mark.fast
+def test_cli_does_not_import_qt() -> None:
+    """
+    Test that headless planning does not import PyQt6.
+    """
+    code = "import sys, planner.__main__; sys.exit('PyQt6' in sys.modules)"
+    # fixed argv: current interpreter and constant code
+    process = subprocess.run([sys.executable, "-c", code], check=False)  # noqa: S603
+    assert process.returncode == 0
+
+
+@pytest.mark.fast
+def test_plan_with_time_limit() -> None:
+    """
+    Test that planning with time limit reports lower bound of route length.
+    """
+    _, points, obstacles = load_map("map.txt")
+    result = plan(points, obstacles, time_limit=0)
+    assert result.tours
+    assert result.lower_bound <= result.length
+    assert result.to_dict()["lower_bound"] == result.lower_bound
+
+
+@pytest.mark.fast
+def test_plan_with_automatic_solver(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that automatic choice of solver is reported by planning result and CLI.
+    """
+    _, points, obstacles = load_map("map.txt")
+    result = plan(points, obstacles, "auto", time_limit=5)
+    expected = plan(points, obstacles, "held_karp")
+    assert result.choice is not None
+    assert math.isclose(result.length, expected.length)
+    assert result.to_dict()["choice"]["solver"] == result.choice.name
+    assert expected.choice is None
+    assert "choice" not in expected.to_dict()
+    assert expected.to_dict()["stats"] == expected.stats.to_dict()
+
+    assert main(["map.txt", "--solver", "auto"]) == 0
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)["choice"]["solver"] == result.choice.name
+    assert captured.err.startswith("auto: ")
+
+
+@pytest.mark.fast
+def test_plan_with_solution_cache(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that repeated planning takes solution from cache, also after restart of CLI.
+    """
+    _, points, obstacles = load_map("map.txt")
+    cache = SolutionCache()
+    result = plan(points, obstacles, "little", cache=cache)
+    cached = plan(points, obstacles, "little", cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert cached.tours == result.tours
+    assert math.isclose(cached.length, result.length)
+
+    for _ in range(2):
+        assert main(["map.txt", "--cache-dir", str(tmp_path)]) == 0
+        assert math.isclose(json.loads(capsys.readouterr().out)["length"], result.length)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+@pytest.mark.fast
+def test_remap_tours() -> None:
+    """
+    Test that tours are expressed in indices of changed points and removed points are skipped.
+    """
+    old_points = [Point(0, 0), Point(1, 0), Point(2, 0), Point(3, 0)]
+    new_points = [Point(0, 0), Point(3, 0), Point(5, 5), Point(1, 0)]
+    assert remap_tours([[0, 1, 2, 0], [0, 3, 0]], old_points, new_points) == [[0, 3, 0], [0, 1, 0]]
+
+
+@pytest.mark.fast
+def test_cli_warm_start(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that routes of previous output are hint of solver and broken file is reported.
+    """
+    assert main(["map.txt", "--solver", "local_search"]) == 0
+    previous = tmp_path / "previous.json"
+    previous.write_text(capsys.readouterr().out, encoding="utf-8")
+    assert main(["map.txt", "--solver", "local_search", "--warm-start", str(previous)]) == 0
+    expected = json.loads(previous.read_text(encoding="utf-8"))
+    assert json.loads(capsys.readouterr().out)["length"] <= expected["length"] + 1e-9
+
+    previous.write_text("{}", encoding="utf-8")
+    assert main(["map.txt", "--warm-start", str(previous)]) == 2
+
+
+@pytest.mark.fast
+def test_cli_float32_matrix(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that route planned with float32 matrix is as short as route planned with float64 one.
+    """
+    _, points, obstacles = load_map("map.txt")
+    result = plan(points, obstacles)
+    assert main(["map.txt", "--dtype", "float32"]) == 0
+    assert math.isclose(json.loads(capsys.readouterr().out)["length"], result.length, rel_tol=1e-5)
+
+
+@pytest.mark.fast
+def test_cli_without_route_in_time_limit(capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that CLI reports error instead of printing infinite length when no route is found.
+    """
+    assert main(["map.txt", "--solver", "held_karp", "--time-limit", "0"]) == 1
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert "no route" in captured.err
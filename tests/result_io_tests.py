@@ -0,0 +1,94 @@
+"""Tests for binary storage of planning results."""
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from planner.__main__ import main
+from planner.map_loader import load_map
+from planner.planning import PlanResult, plan
+from planner.result_io import PlanFormatError, load_plan, save_plan
+
+
+@pytest.fixture
+def sample_result() -> PlanResult:
+    """
+    Fixture for planning result of map with obstacles.
+    """
+    _, points, obstacles = load_map("map.txt")
+    return plan(points, obstacles, drones=2)
+
+
+@pytest.mark.fast
+def test_save_and_load(sample_result: PlanResult, tmp_path: Path) -> None:
+    """
+    Test that loaded result is equal to saved one.
+    """
+    file_path = tmp_path / "plan.bin"
+    save_plan(sample_result, file_path)
+    archive = load_plan(file_path)
+
+    assert isinstance(archive.matrix, np.memmap)
+    assert np.array_equal(archive.matrix, sample_result.matrix)
+    assert archive.tours == sample_result.tours
+    assert archive.length == sample_result.length
+    assert archive.points.tolist() == [[point.x, point.y] for point in sample_result.points]
+
+
+@pytest.mark.fast
+def test_routes_are_restored(sample_result: PlanResult, tmp_path: Path) -> None:
+    """
+    Test that lines and arcs of every route are restored.
+    """
+    file_path = tmp_path / "plan.bin"
+    save_plan(sample_result, file_path)
+    archive = load_plan(file_path)
+
+    n = len(sample_result.points)
+    for i in range(n):
+        for j in range(n):
+            restored = archive.leg_route(i, j).route
+            original = sample_result.routes[i][j].route
+            assert [type(segment) for segment in restored] == [type(segment) for segment in original]
+            assert [segment.length() for segment in restored] == [
+                segment.length() for segment in original
+            ]
+    for tour in sample_result.tours:
+        assert archive.tour_route(tour).length == pytest.approx(sample_result.tour_route(tour).length)
+
+
+@pytest.mark.fast
+def test_load_incorrect_file(tmp_path: Path) -> None:
+    """
+    Test that file of other format is rejected.
+    """
+    file_path = tmp_path / "map.txt"
+    file_path.write_text("Point|[100.0, 100.0]|KT1|Start\n" * 4, encoding="utf-8")
+    with pytest.raises(PlanFormatError):
+        load_plan(file_path)
+
+
+@pytest.mark.fast
+def test_load_truncated_file(sample_result: PlanResult, tmp_path: Path) -> None:
+    """
+    Test that file shorter than sections described by its header is rejected.
+    """
+    file_path = tmp_path / "plan.bin"
+    save_plan(sample_result, file_path)
+    data = file_path.read_bytes()
+    load_plan(file_path)
+    for size in (len(data) - 1, len(data) // 2):
+        file_path.write_bytes(data[:size])
+        with pytest.raises(PlanFormatError, match="truncated"):
+            load_plan(file_path)
+
+
+@pytest.mark.fast
+def test_cli_output_file(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    """
+    Test that command line interface writes binary result.
+    """
+    file_path = tmp_path / "plan.bin"
+    assert main(["map_without_obstacles.txt", "--output", str(file_path)]) == 0
+    capsys.readouterr()
+    assert len(load_plan(file_path).tours) == 1
@@ -1,9 +1,18 @@
 """Class TSPSolver for easier data processing."""
 import itertools
+import time
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+from .heuristics import finite_matrix, repair_tour
+
+if TYPE_CHECKING:
+    import multiprocessing.sharedctypes
+    import multiprocessing.synchronize
+    import threading
+
 
 class SolutionExceptionError(Exception):
     """
@@ -11,128 +20,373 @@ class SolutionExceptionError(Exception):
     """
 
 
-class TSPSolver(ABC):
+class SearchBudget:
     """
-    Abstract TSP solver class.
+    Limit of time and count of search steps for anytime solvers.
+
+    Budget may be shared by searches in several processes: every search gets
+    the same deadline and counter of steps in shared memory, so limits hold
+    for the whole solve rather than for every search. Search is also stopped
+    when cancel event is set, for example by another thread.
     """
 
-    @abstractmethod
-    def solve(self, matrix: np.ndarray, start: int) -> list[int]:
+    def __init__(
+            self,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            *,
+            deadline: float | None = None,
+            shared_nodes: "multiprocessing.sharedctypes.Synchronized | None" = None,
+            cancel_event: "threading.Event | multiprocessing.synchronize.Event | None" = None
+        ) -> None:
         """
-        Solve travel salesman problem.
+        Initialize budget.
 
         Args:
-            matrix: matrix of distances,
-                where matrix[i][j] is length of path from i-th control point to j-th
-            start: index of start control point
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of search steps (nodes, permutations), no limit if None
+            deadline: value of time.perf_counter() at which search stops, used instead
+                of time_limit if it is given
+            shared_nodes: count of search steps shared between processes, node_limit
+                limits its value, steps are counted only by this budget if None
+            cancel_event: event which stops search when it is set, search is not
+                cancelled if None
+
+        """
+        if deadline is None and time_limit is not None:
+            deadline = time.perf_counter() + time_limit
+        self._deadline = deadline
+        self._node_limit = node_limit
+        self._shared_nodes = shared_nodes
+        self._cancel_event = cancel_event
+        self.spent_nodes = 0
+        self.exhausted = False
+
+    @property
+    def deadline(self) -> float | None:
+        """
+        Return value of time.perf_counter() at which search stops, None if there is no time limit.
+        """
+        return self._deadline
+
+    @property
+    def node_limit(self) -> int | None:
+        """
+        Return limit of search steps, None if there is no limit.
+        """
+        return self._node_limit
+
+    @property
+    def time_left(self) -> float | None:
+        """
+        Return seconds left before time limit, None if there is no time limit.
+        """
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.perf_counter())
+
+    def spend(self, nodes: int = 1) -> bool:
+        """
+        Count search steps and check limits.
+
+        Args:
+            nodes: count of performed search steps
 
         Returns:
-            sequence(list) of points in optimal order.
+            True if budget is exhausted and search must stop
+
+        """
+        self.spent_nodes += nodes
+        spent_nodes = self.spent_nodes
+        if self._shared_nodes is not None:
+            with self._shared_nodes.get_lock():
+                self._shared_nodes.value += nodes
+                spent_nodes = self._shared_nodes.value
+        if ((self._node_limit is not None and spent_nodes > self._node_limit)
+                or (self._deadline is not None and time.perf_counter() >= self._deadline)
+                or (self._cancel_event is not None and self._cancel_event.is_set())):
+            self.exhausted = True
+        return self.exhausted
+
+
+class SolverStats:
+    """
+    Counters and timings of search during solve.
+
+    Solvers fill counters which make sense for them, other counters stay zero.
+    Time of every phase is accumulated in phase_times by its name,
+    for example "reduction", "penalty" and "subtour" in Little's algorithm.
+    """
 
+    def __init__(self) -> None:
         """
+        Initialize zero counters.
+        """
+        self.nodes_created = 0
+        self.nodes_expanded = 0
+        self.nodes_pruned = 0
+        self.peak_frontier_size = 0
+        self.peak_matrix_bytes = 0
+        self.permutations = 0
+        self.phase_times: dict[str, float] = {}
+
+    def add_time(self, phase: str, started: float) -> None:
+        """
+        Add time from started to now to phase.
+
+        Args:
+            phase: name of phase
+            started: value of time.perf_counter() at start of phase
+
+        """
+        self.phase_times[phase] = self.phase_times.get(phase, 0.0) + time.perf_counter() - started
+
+    def merge(self, other: "SolverStats") -> None:
+        """
+        Add counters and timings of other search, for example search in worker process.
 
-    def _find_right_order(
+        Peaks are maxima of peaks of both searches.
+        """
+        self.nodes_created += other.nodes_created
+        self.nodes_expanded += other.nodes_expanded
+        self.nodes_pruned += other.nodes_pruned
+        self.peak_frontier_size = max(self.peak_frontier_size, other.peak_frontier_size)
+        self.peak_matrix_bytes = max(self.peak_matrix_bytes, other.peak_matrix_bytes)
+        self.permutations += other.permutations
+        for phase, seconds in other.phase_times.items():
+            self.phase_times[phase] = self.phase_times.get(phase, 0.0) + seconds
+
+    def to_dict(self) -> dict:
+        """
+        Return JSON-compatible representation of stats.
+        """
+        return {
+            "nodes_created": self.nodes_created,
+            "nodes_expanded": self.nodes_expanded,
+            "nodes_pruned": self.nodes_pruned,
+            "peak_frontier_size": self.peak_frontier_size,
+            "peak_matrix_bytes": self.peak_matrix_bytes,
+            "permutations": self.permutations,
+            "phase_times": dict(self.phase_times),
+        }
+
+
+class TSPSolver(ABC):
+    """
+    Abstract TSP solver class.
+
+    Matrix of distances may be float64 or float32. Little's algorithm,
+    local search, Or-3opt, multi-start and multi-vehicle solvers keep
+    float32 in their copies of matrix (expanded matrix, reduced matrices of
+    nodes, shared memory), so memory and cost of copying are halved. Brute
+    force and Held-Karp solvers, which handle only small matrices, convert
+    it to float64 copy. Precision
+    contract of float32: every distance is rounded with relative error at
+    most 2^-24 (about 6e-8), lengths of routes and lower bounds are summed
+    in float64. Route is optimal for rounded distances, so its length by
+    exact distances exceeds optimal one by at most about 2 * n * 6e-8 of
+    route length. Integer matrices (for example distances in scaled integer
+    units, -1 if there is no path) are converted to float64, they are exact
+    up to 2^53.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize solver.
+        """
+        self._optimal_length = np.inf
+        self._lower_bound = 0.0
+        self._stats = SolverStats()
+        self._cancel_event: threading.Event | multiprocessing.synchronize.Event | None = None
+
+    def set_cancel_event(
             self,
-            v: int,
-            visited: list[int],
-            matrix: np.ndarray,
-            order: list[int]
-    ) -> None:
+            event: "threading.Event | multiprocessing.synchronize.Event | None"
+        ) -> None:
         """
-        Find topologic-like order of elements.
+        Set event which cancels search, for example from another thread.
 
-        This order is written in "order" array.
+        When event is set, search stops as if its time limit is reached:
+        the best route found so far is returned. Event is checked by every
+        later solve until it is replaced.
 
         Args:
-            v: start vertex
-            visited: array where visited[i] equal to 1 if vertex with index i is visited
-                and 0 otherwise
-            matrix: matrix of distances,
-                where matrix[i][j] is length of path from i-th control point to j-th
-            order: array, where this method writes right order of elements
+            event: event which cancels search, search is not cancelled if None
 
         """
-        visited[v] = 1
-        for u in range(matrix.shape[0]):
-            if (visited[u] or matrix[v][u] == np.inf):
-                continue
-            self._find_right_order(u, visited, matrix, order)
-        order.append(v)
+        self._cancel_event = event
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Return True if cancel event is set.
+        """
+        return self._cancel_event is not None and self._cancel_event.is_set()
+
+    def _search_budget(self, time_limit: float | None, node_limit: int | None) -> SearchBudget:
+        """
+        Return budget of search which is also stopped by cancel event.
+
+        Args:
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of search steps, no limit if None
+
+        """
+        return SearchBudget(time_limit, node_limit, cancel_event=self._cancel_event)
 
-    def _get_component(
+    # limits and hint are keyword-only options shared by every solver and its callers,
+    # so they are kept in signature instead of options object
+    @abstractmethod
+    def solve(  # noqa: PLR0913
             self,
-            v: int,
-            visited: list[int],
-            component: list[int],
-            matrix: np.ndarray
-        ) -> None:
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
         """
-        Find strongly connected component.
+        Solve travel salesman problem.
+
+        If time or node limit is reached, the best route found so far is returned
+        and lower_bound property shows how far it can be from optimal one.
+        Initial routes (usually solution before small change of mission) are
+        a hint: exact solvers use them as initial upper bound, local search
+        starts from them.
 
         Args:
-            v: start vertex
-            visited: array where visited[i] equal to 1 if vertex with index i is visited
-                and 0 otherwise:
-            component: array, where this method writes elements of one strong connected component
             matrix: matrix of distances,
                 where matrix[i][j] is length of path from i-th control point to j-th
+            start: index of start control point
+            salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of search steps, no limit if None
+            initial_routes: routes of salesmen in format of result, no hint if None,
+                missing points are skipped and new points are inserted
+
+        Returns:
+            routes of every salesman and summary length of routes.
 
         """
-        visited[v] = 1
-        component.append(v)
-        for u in range(matrix.shape[0]):
-            if (visited[u] or matrix.T[v][u] == np.inf):
-                continue
-            self._get_component(u, visited, component, matrix)
 
-    def _find_strongly_connected_components(self, matrix: np.ndarray) -> list[list[int]]:
+    @property
+    def optimal_length(self) -> float:
+        """
+        Return length of the best route found during last solve.
         """
-        Find every strongly connected component.
+        return self._optimal_length
+
+    @property
+    def stats(self) -> SolverStats:
+        """
+        Return counters and timings of last solve.
+        """
+        return self._stats
+
+    @property
+    def lower_bound(self) -> float:
+        """
+        Return proven lower bound of optimal route length for last solve.
+        """
+        return self._lower_bound
+
+    @property
+    def gap(self) -> float:
+        """
+        Return relative gap between found route length and lower bound, 0 if route is optimal.
+        """
+        if self._optimal_length == np.inf:
+            return np.inf
+        if self._optimal_length <= 0 or self._lower_bound >= self._optimal_length:
+            return 0.0
+        return float((self._optimal_length - self._lower_bound) / self._optimal_length)
+
+    @staticmethod
+    def _prepare_matrix(matrix: np.ndarray) -> np.ndarray:
+        """
+        Bring matrix of distances to form used by solvers.
+
+        Diagonal of float matrix is set to np.inf in place, matrix of other
+        dtype is converted to float64 first. Float32 matrix stays float32.
 
         Args:
-            matrix: matrix of distances,
-                where matrix[i][j] is length of path from i-th control point to j-th
+            matrix: matrix of distances, -1 means there is no path
+
+        Returns:
+            matrix where np.inf means there is no path
 
         """
-        size = matrix.shape[0]
-        visited = [0] * size
-        component = []
-        order = []
-        components = []
+        if matrix.dtype != np.float32:
+            matrix = matrix.astype(np.float64, copy=False)
+        np.fill_diagonal(matrix, np.inf)
+        return np.where(matrix == -1, np.inf, matrix)
 
-        for i in range(size):
-            if not visited[i]:
-                self._find_right_order(i, visited, matrix, order)
-        visited = [0] * size
-        while order:
-            v = order.pop()
-            if not visited[v]:
-                self._get_component(v, visited, component, matrix)
-                components.append(component.copy())
-                component = []
+    @staticmethod
+    def _reduction_lower_bound(matrix: np.ndarray) -> float:
+        """
+        Calculate lower bound of route length by reduction of rows and columns.
 
-        return components
+        Args:
+            matrix: matrix of distances, np.inf means there is no path
 
-    def _get_elements_not_in_main_component(
-            self,
-            components: list[list[int]],
-            main_element: int
-    ) -> list[int]:
+        Returns:
+            sum of row minima and column minima of row-reduced matrix
+
+        """
+        row_mins = np.min(matrix, axis=1)
+        if np.any(np.isinf(row_mins)):
+            return np.inf
+        col_mins = np.min(matrix - row_mins[:, np.newaxis], axis=0)
+        if np.any(np.isinf(col_mins)):
+            return np.inf
+        return float(np.sum(row_mins, dtype=np.float64) + np.sum(col_mins, dtype=np.float64))
+
+    @staticmethod
+    def _reachable_vertices(adjacency: np.ndarray, start: int) -> np.ndarray:
         """
-        Find every element which is not in the component with main element.
+        Find every vertex reachable from start vertex.
+
+        Breadth-first search processes the whole frontier at once,
+        every row of adjacency is scanned at most once.
 
         Args:
-            components: list of strongly connected components
-            main_element: major element which indicates main component
+            adjacency: boolean matrix, where adjacency[i][j] is True if there is edge from i to j
+            start: start vertex
+
+        Returns:
+            boolean mask of reachable vertices
 
         """
-        elements = []
-        for component in components:
-            if main_element in component:
-                continue
-            elements += component
+        visited = np.zeros(adjacency.shape[0], dtype=bool)
+        visited[start] = True
+        frontier = visited.copy()
+        while frontier.any():
+            frontier = np.any(adjacency[frontier], axis=0) & ~visited
+            visited |= frontier
+        return visited
+
+    def _find_unreachable_vertices(self, matrix: np.ndarray, start: int) -> list[int]:
+        """
+        Find every vertex which is not in strongly connected component of start vertex.
+
+        Vertex is in that component if it is reachable from start vertex
+        and start vertex is reachable from it.
 
-        return elements
+        Args:
+            matrix: matrix of distances,
+                where matrix[i][j] is length of path from i-th control point to j-th
+            start: start point of route
+
+        Returns:
+            sorted list of vertices which can not be visited by route from start vertex
+
+        """
+        adjacency = matrix != np.inf
+        component = (self._reachable_vertices(adjacency, start) &
+                     self._reachable_vertices(adjacency.T, start))
+        return np.flatnonzero(~component).tolist()
 
     def _check_input_data(self, matrix: np.ndarray, start: int) -> None:
         """
@@ -149,9 +403,8 @@ class TSPSolver(ABC):
             SolutionExceptionError: if check fails
 
         """
-        components = self._find_strongly_connected_components(matrix)
-        if len(components) > 1:
-            unreachable_elements = self._get_elements_not_in_main_component(components, start)
+        unreachable_elements = self._find_unreachable_vertices(matrix, start)
+        if unreachable_elements:
             error_msg = (f"Can't build a route thruough every vertex\n"
                          f"Those vertices are unreachable: {unreachable_elements}")
             raise SolutionExceptionError(error_msg)
@@ -176,7 +429,9 @@ class TSPSolver(ABC):
         """
         original_size = matrix.shape[0]
         result_size = original_size + salesmen_count - 1
-        result_matrix = np.full(shape=(result_size, result_size), fill_value=np.inf)
+        result_matrix = np.full(
+            shape=(result_size, result_size), fill_value=np.inf, dtype=matrix.dtype
+        )
         result_matrix[:original_size, :original_size] = matrix
         for copy_start_point in range(original_size, result_size):
             result_matrix[copy_start_point, :original_size] = matrix[start_point, :]
@@ -216,3 +471,37 @@ class TSPSolver(ABC):
 
         return result_routes
 
+    def _initial_routes_tour(
+            self,
+            matrix: np.ndarray,
+            origin_size: int,
+            start: int,
+            initial_routes: list[list[int]]
+        ) -> list[int]:
+        """
+        Join initial routes of salesmen into tour of expanded matrix.
+
+        Routes are separated by copies of start point, points which are
+        not in matrix are skipped, missing points and copies of start point
+        are inserted at the cheapest places.
+
+        Args:
+            matrix: matrix expanded for multiple salesmen
+            origin_size: count of control points
+            start: start point
+            initial_routes: routes of salesmen, see solve
+
+        Returns:
+            order of every vertex of expanded matrix starting with start
+
+        """
+        copies = iter(range(origin_size, matrix.shape[0]))
+        tour = []
+        for route in initial_routes:
+            points = [vertex for vertex in route if 0 <= vertex < origin_size and vertex != start]
+            if not points:
+                continue
+            if tour:
+                tour.append(next(copies, start))
+            tour.extend(points)
+        return repair_tour(finite_matrix(matrix), tour, start)
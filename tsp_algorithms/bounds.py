@@ -0,0 +1,200 @@
+"""
+Lower bounds for TSP.
+
+This module provides functions which estimate length of the shortest
+route from below. Every bound function takes matrix of distances, where
+matrix[i][j] is length of edge from i-th vertex to j-th one and np.inf
+means forbidden edge (including diagonal), and upper bound of route
+length. It returns lower bound of length of any cycle through every
+vertex, np.inf if there is no such cycle. Computation may stop as soon
+as bound reaches upper bound, because such route is discarded anyway.
+"""
+from collections.abc import Callable
+
+import numpy as np
+
+BoundFunction = Callable[[np.ndarray, float], float]
+
+
+def reduction_bound(matrix: np.ndarray, upper_bound: float = np.inf) -> float:  # noqa: ARG001
+    """
+    Calculate sum of minima of rows and minima of columns after row reduction.
+
+    Args:
+        matrix: matrix of distances
+        upper_bound: length of known route, not used
+
+    Returns:
+        lower bound of route length
+
+    """
+    row_minima = np.min(matrix, axis=1, keepdims=True)
+    if np.isinf(row_minima).any():
+        return np.inf
+    col_minima = np.min(matrix - row_minima, axis=0)
+    return float(np.sum(row_minima, dtype=np.float64) + np.sum(col_minima, dtype=np.float64))
+
+
+def assignment_bound(matrix: np.ndarray, upper_bound: float = np.inf) -> float:  # noqa: ARG001
+    """
+    Calculate cost of the cheapest assignment of successors to vertices.
+
+    Every cycle through every vertex is an assignment, so the cheapest one
+    is lower bound of route length. It is found by Hungarian algorithm
+    with shortest augmenting paths in O(n^3), every step is vectorized over
+    columns. Bound is strong for asymmetric matrices.
+
+    Args:
+        matrix: matrix of distances
+        upper_bound: length of known route, not used
+
+    Returns:
+        lower bound of route length
+
+    """
+    size = matrix.shape[0]
+    row_potentials = np.zeros(size + 1)
+    col_potentials = np.zeros(size + 1)
+    assigned_rows = np.zeros(size + 1, dtype=np.intp)
+    previous_cols = np.zeros(size + 1, dtype=np.intp)
+
+    for row in range(1, size + 1):
+        assigned_rows[0] = row
+        col = 0
+        reduced_costs = np.full(size + 1, np.inf)
+        used = np.zeros(size + 1, dtype=bool)
+        while assigned_rows[col] != 0:
+            used[col] = True
+            current_row = assigned_rows[col]
+            costs = matrix[current_row - 1] - row_potentials[current_row] - col_potentials[1:]
+            better = ~used[1:] & (costs < reduced_costs[1:])
+            reduced_costs[1:][better] = costs[better]
+            previous_cols[1:][better] = col
+            free_costs = np.where(used, np.inf, reduced_costs)
+            next_col = int(np.argmin(free_costs))
+            delta = free_costs[next_col]
+            if delta == np.inf:
+                return np.inf
+            row_potentials[assigned_rows[used]] += delta
+            col_potentials[used] -= delta
+            reduced_costs[~used] -= delta
+            col = next_col
+        while col != 0:
+            previous = previous_cols[col]
+            assigned_rows[col] = assigned_rows[previous]
+            col = previous
+
+    return float(-col_potentials[0])
+
+
+def _one_tree(weights: np.ndarray) -> tuple[float, np.ndarray]:
+    """
+    Build the shortest 1-tree of symmetric matrix.
+
+    1-tree is spanning tree of vertices except the first one
+    (built by Prim's algorithm) and two the shortest edges of the first vertex.
+
+    Args:
+        weights: symmetric matrix of distances
+
+    Returns:
+        length of 1-tree and degrees of its vertices
+
+    """
+    size = weights.shape[0]
+    degrees = np.zeros(size, dtype=np.intp)
+    in_tree = np.zeros(size, dtype=bool)
+    in_tree[:2] = True
+    distances = weights[1].copy()
+    distances[:2] = np.inf
+    parents = np.ones(size, dtype=np.intp)
+    length = 0.0
+    for _ in range(size - 2):
+        vertex = int(np.argmin(distances))
+        length += distances[vertex]
+        degrees[vertex] += 1
+        degrees[parents[vertex]] += 1
+        in_tree[vertex] = True
+        distances[vertex] = np.inf
+        closer = ~in_tree & (weights[vertex] < distances)
+        distances[closer] = weights[vertex][closer]
+        parents[closer] = vertex
+
+    nearest = np.argpartition(weights[0, 1:], 1)[:2] + 1
+    length += float(np.sum(weights[0, nearest]))
+    degrees[0] = 2
+    degrees[nearest] += 1
+    return length, degrees
+
+
+def one_tree_bound(
+        matrix: np.ndarray,
+        upper_bound: float = np.inf,
+        iterations: int = 50
+    ) -> float:
+    """
+    Calculate Held-Karp bound by 1-trees with subgradient optimization.
+
+    Every cycle through every vertex is a 1-tree, so the shortest 1-tree
+    is lower bound of route length. Penalties of vertices are added to
+    their edges and changed by subgradient steps until degree of every
+    vertex in 1-tree is 2 or iterations are over, the greatest bound is kept.
+    Edge between two vertices is treated as the shorter of two directions,
+    so bound is valid for any matrix and strong for symmetric ones.
+
+    Args:
+        matrix: matrix of distances
+        upper_bound: length of known route, it is used for step size
+            and search stops when bound reaches it
+        iterations: maximum count of subgradient steps
+
+    Returns:
+        lower bound of route length
+
+    """
+    size = matrix.shape[0]
+    if size < 3:  # noqa: PLR2004
+        return reduction_bound(matrix)
+    weights = np.minimum(matrix, matrix.T)
+    penalties = np.zeros(size)
+    best = -np.inf
+    step_scale = 2.0
+    without_improvement = 0
+
+    for _ in range(iterations):
+        length, degrees = _one_tree(weights + penalties[:, None] + penalties[None, :])
+        if length == np.inf:
+            return np.inf
+        bound = length - 2 * float(np.sum(penalties))
+        if bound > best + 1e-9:
+            best = bound
+            without_improvement = 0
+        else:
+            without_improvement += 1
+            if without_improvement >= 5:  # noqa: PLR2004
+                step_scale /= 2
+                without_improvement = 0
+        subgradient = degrees - 2
+        norm = int(np.sum(subgradient * subgradient))
+        if norm == 0 or best >= upper_bound:
+            break
+        target = upper_bound if upper_bound != np.inf else 1.05 * abs(bound) + 1.0
+        penalties += step_scale * (target - bound) / norm * subgradient
+
+    return float(best)
+
+
+def select_bound(matrix: np.ndarray) -> BoundFunction:
+    """
+    Choose bound function for matrix.
+
+    Args:
+        matrix: matrix of distances
+
+    Returns:
+        one_tree_bound for symmetric matrix, assignment_bound otherwise
+
+    """
+    if np.array_equal(matrix, matrix.T):
+        return one_tree_bound
+    return assignment_bound
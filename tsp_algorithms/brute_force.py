@@ -1,21 +1,168 @@
 """Brute force algorithm class."""
 import itertools
+import time
+from typing import ClassVar
 
 import numpy as np
 
-from .abstract_solver import TSPSolver
+from .abstract_solver import SolverStats, TSPSolver
+from .heuristics import initial_tour, tour_length
 
 
 class BruteForceSolver(TSPSolver):
     """
     Class that represents brute force solution to TSP.
+
+    Routes are enumerated by depth-first search over prefixes of route,
+    length of prefix is accumulated incrementally and prefix is pruned when
+    it can not be shorter than the best route found. When few vertices are
+    left, every their permutation is evaluated at once with NumPy.
+    Mirror routes of symmetric matrix and orders of interchangeable copies
+    of start point (multiple salesmen) are enumerated only once.
     """
 
-    def solve(
+    _permutations_cache: ClassVar[dict[int, np.ndarray]] = {}
+
+    def __init__(self, chunk_size: int = 6) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            chunk_size: count of the last vertices of route whose permutations
+                are evaluated together, table of permutations has chunk_size! rows
+
+        """
+        super().__init__()
+        self._chunk_size = chunk_size
+
+    @classmethod
+    def __permutations(cls, size: int) -> np.ndarray:
+        """
+        Return table of every permutation of range(size), one permutation per row.
+        """
+        if size not in cls._permutations_cache:
+            cls._permutations_cache[size] = np.array(
+                list(itertools.permutations(range(size))), dtype=np.intp
+            ).reshape(-1, size)
+        return cls._permutations_cache[size]
+
+    def __allowed_chunks(self, prefix: list[int], rest: np.ndarray) -> np.ndarray:
+        """
+        Find permutations of the last vertices which are not duplicates of other routes.
+
+        Args:
+            prefix: beginning of route
+            rest: sorted array of vertices which are not in prefix
+
+        Returns:
+            boolean mask of rows of permutations table
+
+        """
+        permutations = self.__permutations(rest.shape[0])
+        allowed = np.ones(permutations.shape[0], dtype=bool)
+        if self._symmetric:
+            first = prefix[1] if len(prefix) > 1 else rest[permutations[:, 0]]
+            allowed &= first <= rest[permutations[:, -1]]
+        copies = np.flatnonzero(rest >= self._origin_size)
+        if copies.shape[0] > 1:
+            positions = np.argsort(permutations, axis=1)[:, copies]
+            allowed &= np.all(np.diff(positions, axis=1) > 0, axis=1)
+        return allowed
+
+    def __evaluate_chunk(self, prefix: list[int], length: float, rest: np.ndarray) -> None:
+        """
+        Evaluate every route which starts with prefix at once.
+
+        Args:
+            prefix: beginning of route
+            length: length of prefix
+            rest: sorted array of vertices which are not in prefix
+
+        """
+        started = time.perf_counter()
+        matrix = self._matrix
+        routes = rest[self.__permutations(rest.shape[0])]
+        lengths = (length + matrix[prefix[-1], routes[:, 0]] +
+                   np.sum(matrix[routes[:, :-1], routes[:, 1:]], axis=1) +
+                   matrix[routes[:, -1], prefix[0]])
+        lengths[~self.__allowed_chunks(prefix, rest)] = np.inf
+        best = int(np.argmin(lengths))
+        if lengths[best] < self._optimal_length:
+            self._optimal_length = float(lengths[best])
+            self._optimal_path = [*prefix, *routes[best].tolist(), prefix[0]]
+        self._budget.spend(lengths.shape[0])
+        self._stats.permutations += lengths.shape[0]
+        self._stats.add_time("evaluation", started)
+
+    def __remaining_bound(self, prefix: list[int], rest: np.ndarray) -> float:
+        """
+        Calculate lower bound of length of route from the last vertex of prefix through rest.
+
+        Every vertex of rest and the last vertex of prefix is left by one edge,
+        every vertex of rest and the start vertex is entered by one edge.
+
+        Args:
+            prefix: beginning of route
+            rest: vertices which are not in prefix
+
+        Returns:
+            the greatest of sums of the shortest leaving and entering edges
+
+        """
+        sources = np.append(rest, prefix[-1])
+        targets = np.append(rest, prefix[0])
+        edges = self._matrix[np.ix_(sources, targets)]
+        return float(max(np.sum(np.min(edges, axis=1)), np.sum(np.min(edges, axis=0))))
+
+    def __search(self, prefix: list[int], length: float, visited: np.ndarray) -> None:
+        """
+        Enumerate routes which start with prefix.
+
+        Args:
+            prefix: beginning of route
+            length: length of prefix
+            visited: boolean mask of vertices in prefix
+
+        """
+        rest = np.flatnonzero(~visited)
+        started = time.perf_counter()
+        remaining_bound = self.__remaining_bound(prefix, rest)
+        self._stats.add_time("bound", started)
+        if length + remaining_bound >= self._optimal_length:
+            self._stats.nodes_pruned += 1
+            return
+        if rest.shape[0] <= self._chunk_size:
+            self.__evaluate_chunk(prefix, length, rest)
+            return
+        self._stats.nodes_expanded += 1
+
+        last = prefix[-1]
+        used_copies = visited[self._origin_size:]
+        next_copy = self._origin_size + int(np.argmin(used_copies)) if not used_copies.all() else -1
+        for vertex in rest[np.argsort(self._matrix[last, rest], kind="stable")].tolist():
+            if self._budget.spend(0):
+                return
+            if vertex >= self._origin_size and vertex != next_copy:
+                continue
+            edge = self._matrix[last, vertex]
+            if length + edge >= self._optimal_length:
+                break
+            visited[vertex] = True
+            prefix.append(vertex)
+            self._stats.nodes_created += 1
+            self.__search(prefix, length + edge, visited)
+            prefix.pop()
+            visited[vertex] = False
+
+    def solve(  # noqa: PLR0913
             self,
             matrix: np.ndarray,
             start: int,
-            salesmen_count: int = 1
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
         ) -> tuple[list[list[int]], float]:
         """
         Solve travel salesman problem.
@@ -25,14 +172,18 @@ class BruteForceSolver(TSPSolver):
                 where matrix[i][j] is length of path from i-th control point to j-th
             start: index of start control point
             salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of count of evaluated permutations, no limit if None
+            initial_routes: routes of previous solution, if they are shorter
+                than heuristic tour, routes longer than them are not enumerated
 
         Returns:
             sequence(list) of points in optimal order.
+            If limit is reached, the best route among evaluated permutations.
 
         """
-        np.fill_diagonal(matrix, np.inf)
+        matrix = self._prepare_matrix(matrix).astype(np.float64, copy=False)
         origin_size = matrix.shape[0]
-        matrix = np.where(matrix == -1, np.inf, matrix)
 
         self._check_input_data(matrix, start)
 
@@ -43,22 +194,33 @@ class BruteForceSolver(TSPSolver):
 
         modified_size = matrix.shape[0]
 
-        permutated_vertices = [i for i in range(modified_size) if i != start]
-
-        optimal_length = np.inf
-        optimal_path = []
-
-        for permutation in itertools.permutations(permutated_vertices):
-            cur_length = 0
-            prev_vertex = start
-            for vertex in permutation:
-                cur_length += matrix[prev_vertex, vertex]
-                prev_vertex = vertex
-            cur_length += matrix[permutation[-1], start]
-            if cur_length < optimal_length:
-                optimal_length = cur_length
-                optimal_path = [start, *permutation, start]
-
-        self._optimal_length = optimal_length
-        final_routes = self._unravel_multiple_salesmen_routes(optimal_path, origin_size, start)
+        self._matrix = matrix
+        self._origin_size = origin_size
+        self._symmetric = np.array_equal(matrix, matrix.T)
+        self._budget = self._search_budget(time_limit, node_limit)
+        self._stats = SolverStats()
+        started = time.perf_counter()
+        tour, self._optimal_length = initial_tour(matrix, start)
+        self._stats.add_time("initial_tour", started)
+        self._optimal_path = [*tour, start] if self._optimal_length != np.inf else []
+        if initial_routes is not None:
+            tour = self._initial_routes_tour(matrix, origin_size, start, initial_routes)
+            length = tour_length(matrix, tour)
+            if length < self._optimal_length:
+                self._optimal_length = length
+                self._optimal_path = [*tour, start]
+
+        visited = np.zeros(modified_size, dtype=bool)
+        visited[start] = True
+        if modified_size > 1:
+            self._stats.nodes_created = 1
+            self.__search([start], 0.0, visited)
+
+        optimal_length = self._optimal_length
+        self._lower_bound = optimal_length
+        if self._budget.exhausted:
+            self._lower_bound = min(optimal_length, self._reduction_lower_bound(matrix))
+        final_routes = self._unravel_multiple_salesmen_routes(
+            self._optimal_path, origin_size, start
+        )
         return final_routes, optimal_length
@@ -0,0 +1,277 @@
+"""
+Cache of TSP solutions.
+
+This module provides cache of solutions keyed by fingerprint of problem
+(matrix of distances, start point, count of salesmen and solver name)
+and solver wrapper which returns cached solution without search.
+Cache keeps recently used solutions in memory (LRU) and optionally
+in directory, one JSON file per solution, so solutions survive restart
+of the program.
+"""
+import hashlib
+import json
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from .abstract_solver import SolverStats, TSPSolver
+
+if TYPE_CHECKING:
+    import multiprocessing.synchronize
+    import threading
+
+
+def solution_key(matrix: np.ndarray, start: int, salesmen_count: int, solver: str) -> str:
+    """
+    Calculate fingerprint of problem.
+
+    Diagonal and -1 are normalized to np.inf as solvers do,
+    so equivalent matrices have the same fingerprint.
+
+    Args:
+        matrix: matrix of distances
+        start: index of start control point
+        salesmen_count: count of salesmen
+        solver: name of solver
+
+    Returns:
+        hexadecimal SHA-256 digest
+
+    """
+    normalized = np.where(matrix == -1, np.inf, matrix).astype(np.float64)
+    np.fill_diagonal(normalized, np.inf)
+    digest = hashlib.sha256()
+    digest.update(f"{solver}:{start}:{salesmen_count}:{normalized.shape}".encode())
+    digest.update(np.ascontiguousarray(normalized).tobytes())
+    return digest.hexdigest()
+
+
+class CachedSolution:
+    """
+    Solution of TSP kept in cache.
+    """
+
+    def __init__(self, routes: list[list[int]], length: float, lower_bound: float) -> None:
+        """
+        Initialize solution.
+
+        Args:
+            routes: routes of every salesman
+            length: summary length of routes
+            lower_bound: proven lower bound of optimal length
+
+        """
+        self.routes = routes
+        self.length = length
+        self.lower_bound = lower_bound
+
+    def to_dict(self) -> dict:
+        """
+        Return JSON-compatible representation of solution.
+        """
+        return {"routes": self.routes, "length": self.length, "lower_bound": self.lower_bound}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CachedSolution":
+        """
+        Create solution from its JSON-compatible representation.
+        """
+        routes = [[int(vertex) for vertex in route] for route in data["routes"]]
+        return cls(routes, float(data["length"]), float(data["lower_bound"]))
+
+
+class SolutionCache:
+    """
+    LRU cache of TSP solutions with optional directory on disk.
+    """
+
+    def __init__(self, max_entries: int = 128, directory: str | Path | None = None) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_entries: count of solutions kept in memory
+            directory: directory for solution files, solutions are kept only in memory if None
+
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedSolution] = OrderedDict()
+        self._directory = None if directory is None else Path(directory)
+        if self._directory is not None:
+            self._directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """
+        Return count of solutions in memory.
+        """
+        return len(self._entries)
+
+    def __path(self, key: str) -> Path:
+        """
+        Return path of solution file.
+        """
+        return self._directory / f"{key}.json"
+
+    def __remember(self, key: str, solution: CachedSolution) -> None:
+        """
+        Keep solution in memory and evict the least recently used one if cache is full.
+        """
+        self._entries[key] = solution
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def get(self, key: str) -> CachedSolution | None:
+        """
+        Find solution by fingerprint.
+
+        Args:
+            key: fingerprint of problem, see solution_key
+
+        Returns:
+            cached solution, None if there is no one
+
+        """
+        solution = self._entries.get(key)
+        if solution is not None:
+            self._entries.move_to_end(key)
+        elif self._directory is not None:
+            try:
+                with self.__path(key).open(encoding="utf-8") as file:
+                    solution = CachedSolution.from_dict(json.load(file))
+            except (OSError, ValueError, KeyError, TypeError):
+                solution = None
+            if solution is not None:
+                self.__remember(key, solution)
+
+        if solution is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return solution
+
+    def put(self, key: str, solution: CachedSolution) -> None:
+        """
+        Keep solution, shorter cached solution of the same problem is kept instead.
+
+        Args:
+            key: fingerprint of problem, see solution_key
+            solution: solution of problem
+
+        """
+        cached = self._entries.get(key)
+        if cached is not None and cached.length <= solution.length:
+            cached.lower_bound = max(cached.lower_bound, solution.lower_bound)
+            solution = cached
+        self.__remember(key, solution)
+        if self._directory is not None:
+            path = self.__path(key)
+            temporary = path.with_suffix(".tmp")
+            with temporary.open("w", encoding="utf-8") as file:
+                json.dump(solution.to_dict(), file)
+            temporary.replace(path)
+
+    def clear(self) -> None:
+        """
+        Remove every solution from memory and directory.
+        """
+        self._entries.clear()
+        if self._directory is not None:
+            for path in self._directory.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+
+class CachedSolver(TSPSolver):
+    """
+    Class that represents TSP solver which reuses solutions of the same problems.
+
+    Solution is returned from cache without search if the same problem was
+    solved before. Solution is cached if it is proven optimal or search
+    was neither limited nor cancelled, so result of interrupted search does
+    not replace search which could find better route.
+    """
+
+    def __init__(self, solver: TSPSolver, cache: SolutionCache, name: str | None = None) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            solver: solver which is used if solution is not cached
+            cache: cache of solutions
+            name: name of solver in fingerprint of problem, class name of solver if None
+
+        """
+        super().__init__()
+        self._solver = solver
+        self._cache = cache
+        self._name = type(solver).__name__ if name is None else name
+        self._from_cache = False
+
+    def set_cancel_event(
+            self,
+            event: "threading.Event | multiprocessing.synchronize.Event | None"
+        ) -> None:
+        """
+        Set event which cancels search of wrapped solver, see TSPSolver.set_cancel_event.
+        """
+        super().set_cancel_event(event)
+        self._solver.set_cancel_event(event)
+
+    @property
+    def from_cache(self) -> bool:
+        """
+        Return True if solution of last solve was taken from cache.
+        """
+        return self._from_cache
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
+        """
+        Solve travel salesman problem or take its solution from cache.
+
+        Args:
+            matrix: matrix of lengthes,
+                where matrix[i][j] is length of path from i-th control point to j-th
+            start: index of start control point
+            salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of search steps, no limit if None
+            initial_routes: routes of previous solution, they are passed to solver
+
+        Returns:
+            sequence(list) of points in found order and summary length of routes.
+
+        Raises:
+            SolutionExceptionError if solver raises it
+
+        """
+        key = solution_key(matrix, start, salesmen_count, self._name)
+        solution = self._cache.get(key)
+        self._from_cache = solution is not None
+        self._stats = SolverStats()
+        if solution is None:
+            routes, length = self._solver.solve(
+                matrix, start, salesmen_count,
+                time_limit=time_limit, node_limit=node_limit, initial_routes=initial_routes,
+            )
+            solution = CachedSolution(routes, float(length), float(self._solver.lower_bound))
+            self._stats = self._solver.stats
+            limited = time_limit is not None or node_limit is not None or self.cancelled
+            if routes and (not limited or self._solver.gap == 0):
+                self._cache.put(key, solution)
+
+        self._optimal_length = solution.length
+        self._lower_bound = solution.lower_bound
+        return [route.copy() for route in solution.routes], solution.length
@@ -0,0 +1,199 @@
+"""Held-Karp dynamic programming algorithm class."""
+import numpy as np
+
+from .abstract_solver import SearchBudget, SolutionExceptionError, TSPSolver
+from .heuristics import tour_length
+
+
+class HeldKarpSolver(TSPSolver):
+    """
+    Class that represents Held-Karp dynamic programming solution to TSP.
+
+    Table of the dynamic programming is indexed by bitmask of visited
+    vertices (except start one) and by the last vertex of path.
+    All subsets with the same count of vertices are processed together
+    by vectorized NumPy operations, so solution takes O(n^2 * 2^n) time
+    and O(n * 2^n) memory regardless of matrix values.
+    """
+
+    def __init__(self, max_points: int = 20) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            max_points: maximum count of vertices of matrix (including copies of
+                start point for multiple salesmen), table for 20 points takes 80 MB
+
+        """
+        super().__init__()
+        self._max_points = max_points
+
+    @staticmethod
+    def __layers(vertices_count: int) -> list[np.ndarray]:
+        """
+        Group every subset bitmask by count of vertices in it.
+
+        Args:
+            vertices_count: count of vertices which form subsets
+
+        Returns:
+            list where i-th element is array of bitmasks of subsets with i vertices
+
+        """
+        masks = np.arange(1 << vertices_count, dtype=np.int64)
+        sizes = np.bitwise_count(masks)
+        order = np.argsort(sizes, kind="stable")
+        bounds = np.searchsorted(sizes[order], np.arange(vertices_count + 2))
+        return [order[bounds[i]:bounds[i + 1]] for i in range(vertices_count + 1)]
+
+    def __fill_table(
+            self,
+            matrix: np.ndarray,
+            start: int,
+            others: np.ndarray,
+            budget: SearchBudget
+        ) -> np.ndarray | None:
+        """
+        Calculate lengths of the shortest paths through every subset of vertices.
+
+        Args:
+            matrix: matrix of distances
+            start: start vertex
+            others: vertices except start one, j-th bit of bitmask means others[j]
+            budget: limit of time and count of calculated table cells
+
+        Returns:
+            table where table[mask, j] is length of the shortest path which starts
+            in start vertex, visits vertices of mask and ends in others[j].
+            None if budget is exhausted.
+
+        """
+        count = others.shape[0]
+        inner = matrix[np.ix_(others, others)]
+        table = np.full((1 << count, count), np.inf)
+        bits = 1 << np.arange(count)
+        table[bits, np.arange(count)] = matrix[start, others]
+
+        for layer in self.__layers(count)[2:]:
+            if budget.spend(layer.shape[0] * count):
+                return None
+            for j in range(count):
+                subsets = layer[(layer & bits[j]) != 0]
+                previous = table[subsets ^ bits[j]]
+                table[subsets, j] = np.min(previous + inner[:, j], axis=1)
+
+        return table
+
+    def __restore_route(
+            self,
+            table: np.ndarray,
+            matrix: np.ndarray,
+            start: int,
+            others: np.ndarray
+        ) -> tuple[list[int], float]:
+        """
+        Restore the shortest route from table of dynamic programming.
+
+        Args:
+            table: table built by __fill_table
+            matrix: matrix of distances
+            start: start vertex
+            others: vertices except start one
+
+        Returns:
+            closed route which starts in start vertex and its length
+
+        Raises:
+            SolutionExceptionError if there is no route through every vertex
+
+        """
+        inner = matrix[np.ix_(others, others)]
+        mask = (1 << others.shape[0]) - 1
+        closing = table[mask] + matrix[others, start]
+        last = int(np.argmin(closing))
+        length = float(closing[last])
+        if length == np.inf:
+            error_msg = "Can't build a route through every vertex"
+            raise SolutionExceptionError(error_msg)
+
+        reversed_route = [start]
+        while mask:
+            reversed_route.append(int(others[last]))
+            previous_mask = mask ^ (1 << last)
+            if previous_mask:
+                last = int(np.argmin(table[previous_mask] + inner[:, last]))
+            mask = previous_mask
+        reversed_route.append(start)
+
+        return reversed_route[::-1], length
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
+        """
+        Solve travel salesman problem.
+
+        Args:
+            matrix: matrix of lengthes,
+                where matrix[i][j] is length of path from i-th control point to j-th
+            start: index of start control point
+            salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of count of calculated table cells, no limit if None
+            initial_routes: routes of previous solution, they are returned if limit is reached
+
+        Returns:
+            sequence(list) of points in optimal order.
+            If limit is reached, initial routes or empty list and np.inf if there are no ones.
+
+        Raises:
+            ValueError if matrix has more vertices than max_points
+            SolutionExceptionError if there is no route through every vertex
+
+        """
+        matrix = self._prepare_matrix(matrix).astype(np.float64, copy=False)
+        origin_size = matrix.shape[0]
+
+        self._check_input_data(matrix, start)
+
+        if salesmen_count >= origin_size:
+            salesmen_count = origin_size - 1
+
+        matrix = self._transform_matrix_for_multiple_salesmen(matrix, start, salesmen_count)
+
+        modified_size = matrix.shape[0]
+        if modified_size > self._max_points:
+            error_msg = (f"Held-Karp solver supports at most {self._max_points} points, "
+                         f"got {modified_size}")
+            raise ValueError(error_msg)
+
+        self._optimal_length = np.inf
+        self._lower_bound = self._reduction_lower_bound(matrix)
+        others = np.array([i for i in range(modified_size) if i != start], dtype=np.int64)
+        if others.shape[0] == 0:
+            self._optimal_length = self._lower_bound = 0.0
+            return [[start, start]], 0.0
+
+        table = self.__fill_table(matrix, start, others, self._search_budget(time_limit, node_limit))
+        if table is None:
+            if initial_routes is None:
+                return [], np.inf
+            tour = self._initial_routes_tour(matrix, origin_size, start, initial_routes)
+            length = tour_length(matrix, tour)
+            if length == np.inf:
+                return [], np.inf
+            self._optimal_length = length
+            self._lower_bound = min(self._lower_bound, length)
+            return self._unravel_multiple_salesmen_routes([*tour, start], origin_size, start), length
+
+        route, length = self.__restore_route(table, matrix, start, others)
+        self._optimal_length = length
+        self._lower_bound = length
+        return self._unravel_multiple_salesmen_routes(route, origin_size, start), length
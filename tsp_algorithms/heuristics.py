@@ -0,0 +1,173 @@
+"""
+Heuristics for TSP.
+
+This module provides functions which build good (not necessarily optimal)
+tours. Tour is a list of vertices which starts with start vertex,
+route returns from the last vertex to the start one.
+"""
+import numpy as np
+
+
+def tour_length(matrix: np.ndarray, tour: list[int]) -> float:
+    """
+    Calculate length of closed tour.
+
+    Args:
+        matrix: matrix of distances,
+            where matrix[i][j] is length of path from i-th control point to j-th
+        tour: order of vertices
+
+    Returns:
+        length of tour including return to the first vertex
+
+    """
+    vertices = np.asarray(tour)
+    return float(np.sum(matrix[vertices, np.roll(vertices, -1)], dtype=np.float64))
+
+
+def finite_matrix(matrix: np.ndarray) -> np.ndarray:
+    """
+    Replace np.inf in matrix by large finite value.
+
+    Local search compares differences of lengths,
+    with infinite distances those differences are undefined.
+
+    Args:
+        matrix: matrix of distances
+
+    Returns:
+        matrix where every np.inf is replaced by value greater than any finite tour
+
+    """
+    finite = np.isfinite(matrix)
+    if finite.all():
+        return matrix.copy()
+    largest = np.max(np.abs(matrix[finite]), initial=1.0)
+    return np.where(finite, matrix, largest * matrix.shape[0] + 1.0)
+
+
+def nearest_neighbour_tour(matrix: np.ndarray, start: int) -> list[int]:
+    """
+    Build tour by moving to the nearest unvisited vertex.
+
+    Args:
+        matrix: matrix of distances
+        start: start vertex
+
+    Returns:
+        order of vertices starting with start
+
+    """
+    size = matrix.shape[0]
+    visited = np.zeros(size, dtype=bool)
+    visited[start] = True
+    tour = [start]
+    current = start
+    for _ in range(size - 1):
+        distances = np.where(visited, np.inf, matrix[current])
+        current = int(np.argmin(distances))
+        if visited[current]:
+            current = int(np.flatnonzero(~visited)[0])
+        visited[current] = True
+        tour.append(current)
+    return tour
+
+
+def two_opt(matrix: np.ndarray, tour: list[int], max_passes: int = 100) -> list[int]:
+    """
+    Improve tour by reversing its segments while it gets shorter.
+
+    Matrix may be asymmetric: change of length of reversed segment is
+    taken into account. Start vertex stays the first one.
+
+    Args:
+        matrix: matrix of distances without np.inf, see finite_matrix
+        tour: order of vertices
+        max_passes: maximum count of passes through every segment start
+
+    Returns:
+        improved order of vertices
+
+    """
+    tour = np.array(tour)
+    size = tour.shape[0]
+    if size < 4:  # noqa: PLR2004
+        return tour.tolist()
+
+    eps = 1e-9
+    for _ in range(max_passes):
+        improved = False
+        for i in range(1, size - 1):
+            closed = np.append(tour, tour[0])
+            forward = matrix[closed[:-1], closed[1:]]
+            backward = matrix[closed[1:], closed[:-1]]
+            forward_prefix = np.concatenate(([0.0], np.cumsum(forward)))
+            backward_prefix = np.concatenate(([0.0], np.cumsum(backward)))
+
+            # reverse tour[i..j] for every j > i
+            j = np.arange(i + 1, size)
+            before = tour[i - 1]
+            after = closed[j + 1]
+            removed = forward[i - 1] + forward[j] + forward_prefix[j] - forward_prefix[i]
+            added = (matrix[before, tour[j]] + matrix[tour[i], after] +
+                     backward_prefix[j] - backward_prefix[i])
+            delta = added - removed
+            best = int(np.argmin(delta))
+            if delta[best] < -eps:
+                end = int(j[best])
+                tour[i:end + 1] = tour[i:end + 1][::-1]
+                improved = True
+        if not improved:
+            break
+
+    return tour.tolist()
+
+
+def initial_tour(matrix: np.ndarray, start: int) -> tuple[list[int], float]:
+    """
+    Build tour by nearest neighbour heuristic improved by 2-opt.
+
+    Args:
+        matrix: matrix of distances, np.inf means there is no path
+        start: start vertex
+
+    Returns:
+        order of vertices and its length (np.inf if tour uses missing path)
+
+    """
+    finite = finite_matrix(matrix)
+    tour = two_opt(finite, nearest_neighbour_tour(finite, start))
+    return tour, tour_length(matrix, tour)
+
+
+def repair_tour(matrix: np.ndarray, tour: list[int], start: int) -> list[int]:
+    """
+    Turn order of vertices from previous solution into tour of current matrix.
+
+    Vertices which are not in matrix and repeated vertices are skipped,
+    missing vertices are inserted one by one at the cheapest place.
+
+    Args:
+        matrix: matrix of distances without np.inf, see finite_matrix
+        tour: order of vertices, for example tour before small change of matrix
+        start: start vertex
+
+    Returns:
+        order of every vertex starting with start
+
+    """
+    size = matrix.shape[0]
+    present = np.zeros(size, dtype=bool)
+    present[start] = True
+    result = [start]
+    for vertex in tour:
+        if 0 <= vertex < size and not present[vertex]:
+            present[vertex] = True
+            result.append(int(vertex))
+
+    for vertex in np.flatnonzero(~present).tolist():
+        vertices = np.array(result)
+        following = np.roll(vertices, -1)
+        costs = matrix[vertices, vertex] + matrix[vertex, following] - matrix[vertices, following]
+        result.insert(int(np.argmin(costs)) + 1, vertex)
+    return result
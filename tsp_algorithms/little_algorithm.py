@@ -1,47 +1,413 @@
 """Little algorithm class."""
 import heapq
+import itertools
+import multiprocessing
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import ClassVar
 
 import numpy as np
 
-from .abstract_solver import TSPSolver
+from .abstract_solver import SearchBudget, SolutionExceptionError, SolverStats, TSPSolver
+from .bounds import BoundFunction
+from .heuristics import initial_tour, tour_length
 
 
 class Node:
         """
         Auxiliary class for Little's algorithm.
+
+        Node does not store reduced matrix, only decision which
+        distinguishes it from the parent node: edge which is included to
+        the route or excluded from it. Matrix of node is rebuilt by
+        replaying decisions from the root when node is expanded.
+
+        Lower bound of node may be raised by additional bound function,
+        bounds of descendants are built from sum of reductions of matrix.
         """
 
+        __slots__ = ("depth", "edge", "is_included", "lower_bound", "parent", "reduction_bound")
+
         def __init__(
                 self,
-                matrix: np.ndarray,
                 lower_bound: float,
-                route: list[tuple[int, int]],
+                parent: "Node | None" = None,
+                edge: tuple[int, int] | None = None,
+                *,
+                is_included: bool = False
             ) -> None:
             """
             Initialize node.
 
             Args:
-                matrix: 2D numpy array of distances
-                lower_bound: lower bound of possible route length
-                route: list of edges between points
+                lower_bound: lower bound of possible route length (sum of reductions of matrix)
+                parent: parent node, None for the root
+                edge: edge between points which is decided in this node
+                is_included: True if edge is included in route, False if excluded
 
             """
-            self.matrix = matrix
             self.lower_bound = lower_bound
-            self.route = route
+            self.reduction_bound = lower_bound
+            self.parent = parent
+            self.edge = edge
+            self.is_included = is_included
+            self.depth = 0 if parent is None else parent.depth + int(is_included)
+
+        @property
+        def route(self) -> list[tuple[int, int]]:
+            """
+            Return list of edges included in route from the root to this node.
+            """
+            route = []
+            node = self
+            while node.parent is not None:
+                if node.is_included:
+                    route.append(node.edge)
+                node = node.parent
+            return route[::-1]
 
         def __lt__(self, other: "Node") -> bool:
             """
             Auxiliary method for possibility to add elements to queue.
+
+            Of nodes with equal bounds the deeper one goes first.
+            """
+            if self.lower_bound != other.lower_bound:
+                return self.lower_bound < other.lower_bound
+            return self.depth > other.depth
+
+
+def _positive_minima(values: np.ndarray, axis: int) -> np.ndarray:
+    """
+    Find the least positive value of every row or column.
+
+    Args:
+        values: 2D numpy array
+        axis: 1 for rows, 0 for columns
+
+    Returns:
+        the least positive values, np.inf for lines without positive values
+
+    """
+    return np.minimum.reduce(values, axis=axis, where=values > 0, initial=np.inf)
+
+
+class ReducedMatrix:
+        """
+        Auxiliary class for Little's algorithm.
+
+        Reduced matrix of distances of node. Rows and columns of edges
+        included to the route are removed from matrix, so matrix shrinks
+        with depth of node. Arrays rows and cols map indices of matrix
+        to original vertices, row_pos and col_pos map original vertices
+        to indices of matrix (-1 for removed ones).
+
+        Included edges form paths (fragments of route). Array heads keeps
+        the first vertex of fragment for its last vertex, array tails keeps
+        the last vertex of fragment for its first one, so edge which closes
+        fragment into a cycle is found in O(1).
+
+        The least positive values of rows and columns are computed when
+        penalties of zeros are needed and then updated incrementally when
+        edge is excluded.
+        """
+
+        __slots__ = (
+            "col_minima", "col_pos", "cols", "heads", "row_minima", "row_pos", "rows", "tails",
+            "values",
+        )
+
+        def __init__(
+                self,
+                values: np.ndarray,
+                rows: np.ndarray,
+                cols: np.ndarray,
+                size: int,
+                fragments: tuple[np.ndarray, np.ndarray] | None = None
+            ) -> None:
+            """
+            Initialize reduced matrix.
+
+            Args:
+                values: 2D numpy array of reduced distances
+                rows: original vertex of every row of values
+                cols: original vertex of every column of values
+                size: count of original vertices
+                fragments: arrays heads and tails, every vertex is a separate fragment if None
+
+            """
+            self.values = values
+            self.rows = rows
+            self.cols = cols
+            self.row_pos = np.full(size, -1)
+            self.row_pos[rows] = np.arange(rows.shape[0])
+            self.col_pos = np.full(size, -1)
+            self.col_pos[cols] = np.arange(cols.shape[0])
+            if fragments is None:
+                fragments = (np.arange(size), np.arange(size))
+            self.heads, self.tails = fragments
+            self.row_minima = None
+            self.col_minima = None
+
+        def copy(self) -> "ReducedMatrix":
+            """
+            Return copy of matrix, index maps are shared.
             """
-            return self.lower_bound < other.lower_bound
+            matrix = ReducedMatrix.__new__(ReducedMatrix)
+            matrix.values = self.values.copy()
+            matrix.rows = self.rows
+            matrix.cols = self.cols
+            matrix.row_pos = self.row_pos
+            matrix.col_pos = self.col_pos
+            matrix.heads = self.heads
+            matrix.tails = self.tails
+            matrix.row_minima = self.row_minima
+            matrix.col_minima = self.col_minima
+            return matrix
+
+        @property
+        def nbytes(self) -> int:
+            """
+            Return count of bytes held in matrix.
+            """
+            nbytes = (self.values.nbytes + self.rows.nbytes + self.cols.nbytes +
+                      self.row_pos.nbytes + self.col_pos.nbytes +
+                      self.heads.nbytes + self.tails.nbytes)
+            if self.row_minima is not None:
+                nbytes += self.row_minima.nbytes + self.col_minima.nbytes
+            return nbytes
+
+        def row_index(self, vertex: int) -> int:
+            """
+            Return row of original vertex, -1 if row is removed.
+            """
+            return int(self.row_pos[vertex])
+
+        def col_index(self, vertex: int) -> int:
+            """
+            Return column of original vertex, -1 if column is removed.
+            """
+            return int(self.col_pos[vertex])
+
+        def forbid(self, frm: int, to: int) -> None:
+            """
+            Set distance of edge between original vertices to np.inf if edge is in matrix.
+            """
+            row = self.row_index(frm)
+            col = self.col_index(to)
+            if row != -1 and col != -1:
+                self.values[row, col] = np.inf
+
+        def without(self, frm: int, to: int) -> "ReducedMatrix":
+            """
+            Return new matrix without row of vertex frm and column of vertex to.
+
+            Fragments which end in frm and start in to are joined.
+            """
+            row_mask = self.rows != frm
+            col_mask = self.cols != to
+            head = self.heads[frm]
+            tail = self.tails[to]
+            heads = self.heads.copy()
+            tails = self.tails.copy()
+            heads[tail] = head
+            tails[head] = tail
+            return ReducedMatrix(
+                self.values[np.ix_(row_mask, col_mask)],
+                self.rows[row_mask],
+                self.cols[col_mask],
+                self.row_pos.shape[0],
+                (heads, tails),
+            )
+
+        def positive_minima(self) -> tuple[np.ndarray, np.ndarray]:
+            """
+            Return the least positive values of rows and columns, compute them if unknown.
+            """
+            if self.row_minima is None:
+                self.row_minima = _positive_minima(self.values, 1)
+                self.col_minima = _positive_minima(self.values, 0)
+            return self.row_minima, self.col_minima
+
+        def update_positive_minima(
+                self,
+                row: int,
+                col: int,
+                old_row: np.ndarray,
+                old_col: np.ndarray
+            ) -> None:
+            """
+            Update the least positive values after row and column are changed.
+
+            Row and column are recomputed. Other columns changed only in row
+            and other rows changed only in col, their values only decreased,
+            so line is recomputed only if its least positive value became zero.
+
+            Args:
+                row: index of changed row
+                col: index of changed column
+                old_row: values of row before change
+                old_col: values of column before change
+
+            """
+            if self.row_minima is None:
+                return
+            values = self.values
+            row_minima = self.row_minima.copy()
+            col_minima = self.col_minima.copy()
+            for minima, old, new, lines in (
+                (col_minima, old_row, values[row], values),
+                (row_minima, old_col, values[:, col], values.T),
+            ):
+                stale = np.flatnonzero((new == 0) & (old == minima))
+                np.minimum(minima, new, out=minima, where=new > 0)
+                if stale.shape[0]:
+                    minima[stale] = _positive_minima(lines[:, stale], 0)
+            row_minima[row] = _positive_minima(values[row], 0)
+            col_minima[col] = _positive_minima(values[:, col], 0)
+            self.row_minima = row_minima
+            self.col_minima = col_minima
+
+        def fragments_matrix(self) -> np.ndarray:
+            """
+            Return matrix of reduced distances between fragments of route.
+
+            Element [i, j] is distance from the last vertex of i-th fragment
+            to the first vertex of j-th one, fragments are ordered as rows.
+            """
+            return self.values[:, self.col_pos[self.heads[self.rows]]]
+
+        def closing_edge(self, vertex: int) -> tuple[int, int]:
+            """
+            Return edge from the last vertex to the first one of fragment which starts in vertex.
+            """
+            return int(self.tails[vertex]), vertex
+
+
+_worker_state: dict = {}
+
+
+def _init_subtree_worker(
+        matrix: np.ndarray,
+        incumbent: "multiprocessing.sharedctypes.Synchronized",
+        matrix_cache_bytes: int,
+        bound: BoundFunction | None,
+        limits: tuple[
+            float | None,
+            int | None,
+            "multiprocessing.sharedctypes.Synchronized",
+            "multiprocessing.synchronize.Event",
+        ]
+    ) -> None:
+    """
+    Keep data shared by every subtree in worker process.
+
+    Args:
+        matrix: matrix of distances after transformation for multiple salesmen
+        incumbent: shared length of the best route found by any process
+        matrix_cache_bytes: limit of bytes of cached matrices of worker solver
+        bound: additional bound function of worker solver
+        limits: deadline of whole search (see SearchBudget), limit of count of
+            expanded nodes of whole search, shared count of expanded nodes and
+            event which stops every subtree search
+
+    """
+    _worker_state["matrix"] = matrix
+    _worker_state["incumbent"] = incumbent
+    _worker_state["matrix_cache_bytes"] = matrix_cache_bytes
+    _worker_state["bound"] = bound
+    _worker_state["limits"] = limits
+
+
+def _solve_subtree(
+        decisions: list[tuple[tuple[int, int], bool]],
+        lower_bound: float,
+        reduction_bound: float
+    ) -> tuple[float, list[tuple[int, int]], float, SolverStats]:
+    """
+    Search subtree of Little's algorithm in worker process.
+
+    Time and node limits and cancellation are shared by every subtree, see _init_subtree_worker.
+
+    Args:
+        decisions: edges included to route or excluded from it on the way
+            from the root to the subtree root
+        lower_bound: lower bound of the subtree root
+        reduction_bound: sum of reductions of matrix of the subtree root
+
+    Returns:
+        length and edges of the best route in subtree (np.inf and empty list if
+        route is not shorter than shared incumbent), lower bound of unexplored nodes,
+        stats of subtree search
+
+    """
+    solver = LittleAlgorithm(
+        _worker_state["matrix_cache_bytes"], use_initial_tour=False, bound=_worker_state["bound"]
+    )
+    deadline, node_limit, spent_nodes, stop = _worker_state["limits"]
+    budget = SearchBudget(
+        node_limit=node_limit, deadline=deadline, shared_nodes=spent_nodes, cancel_event=stop
+    )
+    return solver._solve_subtree(  # noqa: SLF001
+        _worker_state["matrix"].copy(), decisions, (lower_bound, reduction_bound),
+        _worker_state["incumbent"], budget,
+    )
 
 
 class LittleAlgorithm(TSPSolver):
     """
     Class that represents Little algorithm solution to TSP.
+
+    With several workers the best-first search runs serially until the
+    frontier is large enough, then frontier nodes are searched as subtrees
+    in worker processes. Length of the best route is shared between
+    processes, so every worker prunes by routes found by others. Frontier
+    is split once: subtrees are not redistributed between workers, so
+    worker which got hard subtree may search it while others are idle.
+
+    Lower bound of node is the sum of reductions of its matrix. Additional
+    bound function (see module bounds) may raise it by bound of the
+    cheapest way to join fragments of route in reduced matrix of node.
     """
 
+    bound_tolerance: ClassVar[float] = 1e-9
+    cancel_check_interval: ClassVar[float] = 0.05
+
+    def __init__(
+            self,
+            matrix_cache_bytes: int = 64 * 2 ** 20,
+            *,
+            use_initial_tour: bool = True,
+            workers: int = 1,
+            bound: BoundFunction | None = None
+        ) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            matrix_cache_bytes: limit of bytes held in cached reduced matrices of nodes,
+                matrices of other nodes are rebuilt from the nearest cached ancestor when needed
+            use_initial_tour: if True, tour built by nearest neighbour heuristic and 2-opt
+                is used as initial upper bound of route length
+            workers: count of processes which search subtrees, search is serial if 1
+            bound: additional bound function of nodes, only reductions are used if None
+
+        """
+        super().__init__()
+        self._use_initial_tour = use_initial_tour
+        self._workers = workers
+        self._bound = bound
+        self._initial_upper_bound = np.inf
+        self._tolerance = self.bound_tolerance
+        self._matrix_cache_bytes = matrix_cache_bytes
+        self._matrix_cache: dict[Node, ReducedMatrix] = {}
+        self._cache_queue: list[tuple[float, int, Node]] = []
+        self._cache_counter = itertools.count()
+        self._root_matrix: ReducedMatrix | None = None
+        self._distances: np.ndarray | None = None
+        self._cached_bytes = 0
+        self._incumbent: multiprocessing.sharedctypes.Synchronized | None = None
+
     def __add_node(self, nodes: list[Node],  node: Node) -> None:
         """
         Auxiliary method for clearer usage of heap.
@@ -142,74 +508,32 @@ class LittleAlgorithm(TSPSolver):
         if not np.all(np.isinf(matrix[row, :])):
             min_elem = np.min(matrix[row])
             matrix[row] -= min_elem
-            summary += min_elem
+            summary += float(min_elem)
         if not np.all(np.isinf(matrix[:, col])):
             min_elem = np.min(matrix[:, col])
             matrix[:, col] -= min_elem
-            summary += min_elem
+            summary += float(min_elem)
         return summary
 
-    def __get_index_with_max_penalty(self, matrix: np.ndarray) -> tuple[int, int]:
+    def __get_index_with_max_penalty(self, matrix: ReducedMatrix) -> tuple[int, int]:
         """
         Auxiliary method for reducing process of matrix.
 
         This method finds zero element in matrix with maximum reduction value.
+        Penalty of zero is the sum of the least positive values of its row and column,
+        which are kept in matrix, so penalties are calculated only for zeros.
 
         Args:
-            matrix: 2D numpy array of distances
+            matrix: reduced matrix of node
 
         Returns:
             Tuple of row and col - index in matrix of element
 
         """
-        row_mins = np.min(np.where(matrix == 0, np.inf, matrix), axis=1)
-        col_mins = np.min(np.where(matrix == 0, np.inf, matrix), axis=0)
-
-        penalties = np.where(matrix == 0, row_mins[:, np.newaxis] + col_mins[np.newaxis, :], -np.inf)
-
-        return np.unravel_index(np.argmax(penalties), penalties.shape)
-
-    def __find_next_start_point_edge(self, edges: list[tuple[int, int]], start_point: int) -> int:
-        """
-        Auxiliary method of finding early closive edges.
-
-        This method finds for argument point edge,
-        from which we entered this point.
-
-        Args:
-            edges: list of edges between points
-            start_point: point for which we want to find entering edge
-
-        Returns:
-            index of edge in edges if such edge exists, otherwise -1
-
-        """
-        for i in range(len(edges)):
-            if edges[i][1] == start_point:
-                return i
-
-        return -1
-
-    def __find_next_end_point_edge(self, edges: list[tuple[int, int]], end_point: int) -> int:
-        """
-        Auxiliary method of finding early closive edges.
-
-        This method finds for argument point edge,
-        which we entering from this point.
-
-        Args:
-            edges: list of edges between points
-            end_point: point for which we want to find outer edge
-
-        Returns:
-            index of edge in edges if such edge exists, otherwise -1
-
-        """
-        for i in range(len(edges)):
-            if edges[i][0] == end_point:
-                return i
-
-        return -1
+        row_minima, col_minima = matrix.positive_minima()
+        rows, cols = np.nonzero(matrix.values == 0)
+        best = int(np.argmax(row_minima[rows] + col_minima[cols]))
+        return int(rows[best]), int(cols[best])
 
     def __unravel_edges(self, start: int, edges: list[tuple[int, int]]) -> list[int]:
         """
@@ -226,55 +550,39 @@ class LittleAlgorithm(TSPSolver):
             where i-th point goes after (i - 1)-th point
 
         """
+        successors = dict(edges)
         path = [start]
-        index = self.__find_next_start_point_edge(edges, start)
-        cur = int(edges[index][0])
-        path.append(cur)
+        cur = successors[start]
         while cur != start:
-            index = self.__find_next_start_point_edge(edges, cur)
-            cur = int(edges[index][0])
             path.append(cur)
-        return path[::-1]
+            cur = successors[cur]
+        path.append(start)
+        return path
 
-    def __get_close_edges(self, route: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    def __is_single_cycle(self, edges: list[tuple[int, int]], size: int) -> bool:
         """
-        Auxiliary method of finding early closive edges.
+        Check if edges form one cycle through every vertex.
 
         Args:
-            route: list of edges
+            edges: list of edges in arbitrary order
+            size: count of vertices
 
         Returns:
-            list of edges which forms early closive circles.
+            True if edges form Hamiltonian cycle
 
         """
-        result = []
-        edges = route.copy()
-        min_elements_form_circle = 1
-
-        while len(edges):
-            length = 1
-            edge = edges.pop()
-            start = edge[0]
-            end = edge[1]
-
-            index = self.__find_next_start_point_edge(edges, start)
-            while index != -1:
-                length += 1
-                start = edges[index][0]
-                edges.pop(index)
-                index = self.__find_next_start_point_edge(edges, start)
-
-            index = self.__find_next_end_point_edge(edges, end)
-            while index != -1:
-                length += 1
-                end = edges[index][1]
-                edges.pop(index)
-                index = self.__find_next_end_point_edge(edges, end)
-
-            if length >= min_elements_form_circle:
-                result.append((end, start))
-
-        return result
+        successors = dict(edges)
+        if len(successors) != size:
+            return False
+        start = edges[0][0]
+        cur = start
+        for steps in range(1, size + 1):
+            cur = successors.get(cur)
+            if cur is None:
+                return False
+            if cur == start:
+                return steps == size
+        return False
 
     def __check_vertex_isolated(self, matrix: np.ndarray, frm: int, to: int) -> bool:
         """
@@ -297,63 +605,555 @@ class LittleAlgorithm(TSPSolver):
         entries_to_to = np.sum(matrix[:, to] != np.inf)
         return entries_to_to == 0
 
-    def __make_children(self, cur_node: Node) -> tuple[Node, Node]:
+    def __exclude_edge(self, matrix: ReducedMatrix, frm: int, to: int) -> float:
+        """
+        Forbid edge in matrix of node.
+
+        Args:
+            matrix: reduced matrix of node, changed in place
+            frm: start point of edge
+            to: end point of edge
+
+        Returns:
+            Increase of lower bound, np.inf if some vertex become isolated
+
+        """
+        row = matrix.row_index(frm)
+        col = matrix.col_index(to)
+        old_row = matrix.values[row].copy()
+        old_col = matrix.values[:, col].copy()
+        matrix.values[row, col] = np.inf
+        started = time.perf_counter()
+        penalty = self.__reduce_row_and_col(matrix.values, row, col)
+        self._stats.add_time("reduction", started)
+        if self.__check_vertex_isolated(matrix.values, row, col):
+            return np.inf
+        started = time.perf_counter()
+        matrix.update_positive_minima(row, col, old_row, old_col)
+        self._stats.add_time("penalty", started)
+        return penalty
+
+    def __include_edge(
+            self,
+            matrix: ReducedMatrix,
+            frm: int,
+            to: int
+        ) -> tuple[ReducedMatrix, float]:
+        """
+        Include edge to route in matrix of node.
+
+        Edge which closes fragment of route with this edge into a cycle is forbidden.
+
+        Args:
+            matrix: reduced matrix of node
+            frm: start point of edge
+            to: end point of edge
+
+        Returns:
+            New reduced matrix without row frm and column to, increase of lower bound
+
+        """
+        head = int(matrix.heads[frm])
+        matrix = matrix.without(frm, to)
+        started = time.perf_counter()
+        matrix.forbid(*matrix.closing_edge(head))
+        self._stats.add_time("subtour", started)
+        started = time.perf_counter()
+        penalty = self.__reduce_matrix_by_rows_and_cols(matrix.values)
+        self._stats.add_time("reduction", started)
+        return matrix, penalty
+
+    def __cache_matrix(self, node: Node, matrix: ReducedMatrix) -> None:
+        """
+        Keep reduced matrix of node.
+
+        If cache is full, matrix of node with the greatest lower bound is dropped,
+        because such nodes are expanded last.
+
+        Args:
+            node: node of search tree
+            matrix: reduced matrix of node
+
+        """
+        if matrix.nbytes > self._matrix_cache_bytes:
+            return
+        self._matrix_cache[node] = matrix
+        self._cached_bytes += matrix.nbytes
+        heapq.heappush(self._cache_queue, (-node.lower_bound, next(self._cache_counter), node))
+
+        while self._cached_bytes > self._matrix_cache_bytes:
+            _, _, dropped = heapq.heappop(self._cache_queue)
+            if dropped in self._matrix_cache:
+                self._cached_bytes -= self._matrix_cache.pop(dropped).nbytes
+
+        if len(self._cache_queue) > 2 * len(self._matrix_cache) + 16:
+            self._cache_queue = [item for item in self._cache_queue if item[2] in self._matrix_cache]
+            heapq.heapify(self._cache_queue)
+
+    def __node_matrix(self, node: Node) -> ReducedMatrix:
+        """
+        Get reduced matrix of node.
+
+        Matrix is taken from cache or rebuilt by replaying decisions
+        from the nearest ancestor with cached matrix (or from the root).
+
+        Args:
+            node: node of search tree
+
+        Returns:
+            reduced matrix of node which can be changed by caller
+
+        """
+        if node in self._matrix_cache:
+            return self._matrix_cache[node].copy()
+
+        decisions = []
+        ancestor = node
+        while ancestor.parent is not None and ancestor not in self._matrix_cache:
+            decisions.append(ancestor)
+            ancestor = ancestor.parent
+        if ancestor.parent is None:
+            matrix = self._root_matrix.copy()
+        else:
+            matrix = self._matrix_cache[ancestor].copy()
+
+        for decision in reversed(decisions):
+            frm, to = decision.edge
+            if decision.is_included:
+                matrix, _ = self.__include_edge(matrix, frm, to)
+            else:
+                self.__exclude_edge(matrix, frm, to)
+        return matrix
+
+    def __raise_bound(self, node: Node, matrix: ReducedMatrix, optimal_length: float) -> None:
+        """
+        Raise lower bound of node by additional bound function.
+
+        Bound function gets original distances between fragments of route,
+        length of included edges is added to its result. Bound which differs
+        from length of the best route by rounding errors (relative bound_tolerance,
+        or n * eps for float32 matrix) is treated as equal to it. Nodes which are
+        finished (only two fragments are left) keep their bounds.
+
+        Args:
+            node: new node
+            matrix: reduced matrix of node
+            optimal_length: length of the best route found so far
+
+        """
+        if self._bound is None or node.lower_bound >= optimal_length:
+            return
+        if node.depth >= self._root_matrix.values.shape[0] - 2:
+            return
+        started = time.perf_counter()
+        included_length = sum(float(self._distances[frm, to]) for frm, to in node.route)
+        fragments = matrix.fragments_matrix()
+        distances = self._distances[np.ix_(matrix.rows, matrix.heads[matrix.rows])]
+        distances[fragments == np.inf] = np.inf
+        bound = included_length + self._bound(distances, optimal_length - included_length)
+        if bound >= optimal_length - self._tolerance * abs(optimal_length):
+            bound = optimal_length
+        if node.parent is not None:
+            bound = max(bound, node.parent.lower_bound)
+        node.lower_bound = max(node.lower_bound, bound)
+        self._stats.add_time("bound", started)
+
+    def __make_children(
+            self,
+            cur_node: Node,
+            matrix: ReducedMatrix,
+            optimal_length: float
+        ) -> tuple[Node, Node]:
         """
         Auxiliary method to form new correct nodes in Little algorithm.
 
         Args:
             cur_node: current node from which we want to form descendant nodes
+            matrix: reduced matrix of current node, it is reused by left descendant
+            optimal_length: length of the best route found so far
 
         Returns:
             left and right descendant nodes
 
         """
-        frm, to = self.__get_index_with_max_penalty(cur_node.matrix)
-        left_matrix = cur_node.matrix.copy()
-        left_matrix[frm, to] = np.inf
-        left_penalty = self.__reduce_row_and_col(left_matrix, frm, to)
-        left_bound = cur_node.lower_bound + left_penalty
-        if self.__check_vertex_isolated(left_matrix, frm, to):
-            left_bound = np.inf
-        left_child = Node(left_matrix, left_bound, cur_node.route.copy())
-
-        right_matrix = cur_node.matrix.copy()
-        right_matrix[to, frm] = np.inf
-        right_matrix[frm, :] = np.inf
-        right_matrix[:, to] = np.inf
-        right_route = [*cur_node.route, (frm, to)]
-        close_edges = self.__get_close_edges(right_route)
-        for i, j in close_edges:
-            right_matrix[i][j] = np.inf
-        right_penalty = self.__reduce_matrix_by_rows_and_cols(right_matrix)
-        right_bound = cur_node.lower_bound + right_penalty
-        right_child = Node(right_matrix, right_bound, right_route)
+        started = time.perf_counter()
+        row, col = self.__get_index_with_max_penalty(matrix)
+        self._stats.add_time("penalty", started)
+        frm, to = int(matrix.rows[row]), int(matrix.cols[col])
+
+        right_matrix, right_penalty = self.__include_edge(matrix, frm, to)
+        right_bound = cur_node.reduction_bound + right_penalty
+        right_child = Node(right_bound, cur_node, (frm, to), is_included=True)
+        self.__raise_bound(right_child, right_matrix, optimal_length)
+
+        self._stats.peak_matrix_bytes = max(
+            self._stats.peak_matrix_bytes,
+            self._cached_bytes + self._root_matrix.nbytes + matrix.nbytes + right_matrix.nbytes
+        )
+
+        left_matrix = matrix
+        left_bound = cur_node.reduction_bound + self.__exclude_edge(left_matrix, frm, to)
+        left_child = Node(left_bound, cur_node, (frm, to), is_included=False)
+        self.__raise_bound(left_child, left_matrix, optimal_length)
+
+        if left_bound != np.inf:
+            self.__cache_matrix(left_child, left_matrix)
+        if right_bound != np.inf:
+            self.__cache_matrix(right_child, right_matrix)
 
         return left_child, right_child
 
-    def __finish_node(self, cur_node: Node, modified_size: int) -> None:
+    def __finish_node(
+            self,
+            cur_node: Node,
+            matrix: ReducedMatrix
+        ) -> tuple[float, list[tuple[int, int]]]:
         """
         Finish node route.
 
         Args:
             cur_node: current node
-            modified_size: size of modified matrix of distances
+            matrix: reduced matrix of current node
+
+        Returns:
+            length and edges of finished route, length is np.inf if route is not a cycle
+
+        """
+        length = cur_node.reduction_bound
+        route = cur_node.route
+        for row, column in zip(*np.nonzero(matrix.values != np.inf), strict=True):
+            length += float(matrix.values[row, column])
+            route.append((int(matrix.rows[row]), int(matrix.cols[column])))
+        started = time.perf_counter()
+        if not self.__is_single_cycle(route, self._root_matrix.values.shape[0]):
+            length = np.inf
+        self._stats.add_time("subtour", started)
+        return length, route
+
+    def __init_search(self, matrix: np.ndarray) -> Node:
+        """
+        Reset state of search and create the root node.
+
+        Args:
+            matrix: matrix of distances after transformation for multiple salesmen
+
+        Returns:
+            the root node of search tree
+
+        """
+        size = matrix.shape[0]
+        self._distances = matrix
+        self._tolerance = max(self.bound_tolerance, size * float(np.finfo(matrix.dtype).eps))
+        root_matrix = matrix.copy()
+        self._stats = SolverStats()
+        started = time.perf_counter()
+        lower_bound = (self.__reduce_matrix_by_rows(root_matrix) +
+                        self.__reduce_matrix_by_cols(root_matrix))
+        self._stats.add_time("reduction", started)
+        vertices = np.arange(size)
+        self._root_matrix = ReducedMatrix(root_matrix, vertices, vertices, size)
+        self._matrix_cache.clear()
+        self._cache_queue.clear()
+        self._cached_bytes = 0
+        self._stats.peak_matrix_bytes = self._root_matrix.nbytes
+        self._stats.peak_frontier_size = 1
+        self._stats.nodes_created = 1
+        return Node(lower_bound)
+
+    def __search(
+            self,
+            nodes: list[Node],
+            optimal_length: float,
+            optimal_route: list[tuple[int, int]],
+            budget: SearchBudget,
+            split_size: int | None = None
+        ) -> tuple[float, list[tuple[int, int]]]:
+        """
+        Expand nodes in best-first order.
+
+        Length of the best route is shared with other processes through
+        incumbent of subtree search, see _solve_subtree.
+
+        Args:
+            nodes: list(heap) of nodes to expand, changed in place
+            optimal_length: length of the best route found so far
+            optimal_route: edges of the best route found so far
+            budget: limit of time and count of expanded nodes
+            split_size: size of frontier at which search stops, no stop if None
+
+        Returns:
+            length and edges of the best route
 
         """
-        for row in range(modified_size):
-            for column in range(modified_size):
-                if cur_node.matrix[row, column] != np.inf:
-                    cur_node.lower_bound += cur_node.matrix[row, column]
-                    cur_node.route.append((row, column))
-        final_edge = self.__get_close_edges(cur_node.route)
-        if final_edge[0][0] != final_edge[0][1]:
-            cur_node.lower_bound = np.inf
+        size = self._root_matrix.values.shape[0]
+        incumbent = self._incumbent
+        while nodes and (split_size is None or len(nodes) < split_size):
+            cur_node = self.__get_best_node(nodes)
+            if incumbent is not None:
+                optimal_length = min(optimal_length, incumbent.value)
+
+            if optimal_length <= cur_node.lower_bound:
+                self._stats.nodes_pruned += 1
+                continue
 
-    def solve(
+            if budget.spend():
+                self._lower_bound = min(cur_node.lower_bound, optimal_length)
+                self.__add_node(nodes, cur_node)
+                break
+
+            cur_matrix = self.__node_matrix(cur_node)
+            if not np.isfinite(cur_matrix.values).any():
+                self._stats.nodes_pruned += 1
+                continue
+
+            if cur_node.depth == size - 2:
+                length, route = self.__finish_node(cur_node, cur_matrix)
+                if optimal_length > length and len(route) == size:
+                    optimal_length = length
+                    optimal_route = route
+                    if incumbent is not None:
+                        with incumbent.get_lock():
+                            incumbent.value = min(incumbent.value, length)
+                continue
+
+            self.__expand(nodes, cur_node, cur_matrix, optimal_length)
+
+        return optimal_length, optimal_route
+
+    def __expand(
+            self,
+            nodes: list[Node],
+            node: Node,
+            matrix: ReducedMatrix,
+            optimal_length: float
+        ) -> None:
+        """
+        Add children of node which may contain route shorter than the best one to nodes.
+
+        Args:
+            nodes: list(heap) of nodes to expand, changed in place
+            node: expanded node
+            matrix: reduced matrix of node
+            optimal_length: length of the best route found so far
+
+        """
+        self._stats.nodes_expanded += 1
+        self._stats.nodes_created += 2
+        for child in self.__make_children(node, matrix, optimal_length):
+            if child.lower_bound < optimal_length:
+                self.__add_node(nodes, child)
+            else:
+                self._stats.nodes_pruned += 1
+        self._stats.peak_frontier_size = max(self._stats.peak_frontier_size, len(nodes))
+
+    def _solve_subtree(
             self,
             matrix: np.ndarray,
+            decisions: list[tuple[tuple[int, int], bool]],
+            bounds: tuple[float, float],
+            incumbent: "multiprocessing.sharedctypes.Synchronized",
+            budget: SearchBudget
+        ) -> tuple[float, list[tuple[int, int]], float, SolverStats]:
+        """
+        Search subtree whose root is given by decisions from the root of search tree.
+
+        Args:
+            matrix: matrix of distances after transformation for multiple salesmen
+            decisions: edges included to route or excluded from it on the way
+                from the root to the subtree root
+            bounds: lower bound and sum of reductions of matrix of the subtree root
+            incumbent: length of the best route shared between processes
+            budget: limit of time and count of expanded nodes
+
+        Returns:
+            length and edges of the best route in subtree (np.inf and empty list if
+            route is not shorter than incumbent), lower bound of unexplored nodes,
+            stats of subtree search
+
+        """
+        node = self.__init_search(matrix)
+        self._stats.nodes_created = 0
+        lower_bound, reduction_bound = bounds
+        for edge, is_included in decisions:
+            node = Node(lower_bound, node, edge, is_included=is_included)
+        node.reduction_bound = reduction_bound
+        nodes = [node]
+        self._lower_bound = np.inf
+
+        self._incumbent = incumbent
+        length, route = self.__search(nodes, np.inf, [], budget)
+        self._incumbent = None
+        if not route:
+            length = np.inf
+        if not budget.exhausted:
+            self._lower_bound = np.inf
+        self._matrix_cache.clear()
+        self._cache_queue.clear()
+        self._root_matrix = None
+        self._distances = None
+        return length, route, self._lower_bound, self._stats
+
+    def __wait_for_subtree(self, future: Future, stop: "multiprocessing.synchronize.Event") -> None:
+        """
+        Wait for search of subtree, stop search in every worker if cancel event is set.
+
+        Args:
+            future: future of subtree search
+            stop: event which stops subtree searches in worker processes
+
+        """
+        while self._cancel_event is not None and not stop.is_set():
+            done, _ = wait([future], timeout=self.cancel_check_interval)
+            if done:
+                return
+            if self._cancel_event.is_set():
+                stop.set()
+
+    def __search_in_parallel(
+            self,
+            matrix: np.ndarray,
+            nodes: list[Node],
+            optimal_length: float,
+            optimal_route: list[tuple[int, int]],
+            budget: SearchBudget
+        ) -> tuple[float, list[tuple[int, int]]]:
+        """
+        Search subtrees of frontier nodes in worker processes.
+
+        Args:
+            matrix: matrix of distances after transformation for multiple salesmen
+            nodes: frontier of search tree
+            optimal_length: length of the best route found so far
+            optimal_route: edges of the best route found so far
+            budget: limit of time and count of expanded nodes of whole search,
+                it is shared by every subtree
+
+        Returns:
+            length and edges of the best route
+
+        """
+        subtrees = []
+        for node in sorted(nodes):
+            decisions = []
+            ancestor = node
+            while ancestor.parent is not None:
+                decisions.append((ancestor.edge, ancestor.is_included))
+                ancestor = ancestor.parent
+            subtrees.append((decisions[::-1], node.lower_bound, node.reduction_bound))
+        nodes.clear()
+        self._matrix_cache.clear()
+        self._cache_queue.clear()
+        self._cached_bytes = 0
+
+        incumbent = multiprocessing.Value("d", optimal_length)
+        spent_nodes = multiprocessing.Value("q", budget.spent_nodes)
+        stop = multiprocessing.Event()
+        limits = (budget.deadline, budget.node_limit, spent_nodes, stop)
+        unexplored_bound = np.inf
+        with ProcessPoolExecutor(
+            max_workers=self._workers,
+            initializer=_init_subtree_worker,
+            initargs=(matrix, incumbent, self._matrix_cache_bytes, self._bound, limits),
+        ) as executor:
+            futures = [
+                executor.submit(_solve_subtree, decisions, bound, reduction_bound)
+                for decisions, bound, reduction_bound in subtrees
+            ]
+            for future in futures:
+                self.__wait_for_subtree(future, stop)
+                length, route, bound, stats = future.result()
+                self._stats.merge(stats)
+                unexplored_bound = min(unexplored_bound, bound)
+                if length < optimal_length:
+                    optimal_length, optimal_route = length, route
+
+        budget.spent_nodes = spent_nodes.value
+        if unexplored_bound != np.inf:
+            self._subtrees_exhausted = True
+            self._lower_bound = min(unexplored_bound, optimal_length)
+        return optimal_length, optimal_route
+
+    @property
+    def peak_matrix_bytes(self) -> int:
+        """
+        Return maximum count of bytes held in reduced matrices during last solve.
+        """
+        return self._stats.peak_matrix_bytes
+
+    @property
+    def peak_frontier_size(self) -> int:
+        """
+        Return maximum count of nodes waiting in queue during last solve.
+        """
+        return self._stats.peak_frontier_size
+
+    @property
+    def initial_upper_bound(self) -> float:
+        """
+        Return length of heuristic tour used as initial upper bound during last solve.
+        """
+        return self._initial_upper_bound
+
+    @property
+    def expanded_nodes(self) -> int:
+        """
+        Return count of nodes expanded during last solve.
+        """
+        return self._stats.nodes_expanded
+
+    @property
+    def pruned_nodes(self) -> int:
+        """
+        Return count of nodes discarded because lower bound is not less than best route length.
+        """
+        return self._stats.nodes_pruned
+
+    def __initial_route(
+            self,
+            matrix: np.ndarray,
+            origin_size: int,
             start: int,
-            salesmen_count: int = 1
+            initial_routes: list[list[int]] | None
+        ) -> tuple[float, list[tuple[int, int]]]:
+        """
+        Return initial upper bound of route length and edges of its route.
+
+        Args:
+            matrix: matrix of distances after transformation for multiple salesmen
+            origin_size: size of matrix before transformation
+            start: index of start control point
+            initial_routes: routes of previous solution, no hint if None
+
+        Returns:
+            length and edges of the shorter of heuristic tour and initial routes,
+            np.inf and empty list if there is neither of them
+
+        """
+        optimal_length = np.inf
+        optimal_route = []
+        if self._use_initial_tour:
+            started = time.perf_counter()
+            tour, optimal_length = initial_tour(matrix, start)
+            self._stats.add_time("initial_tour", started)
+            if optimal_length != np.inf:
+                optimal_route = list(itertools.pairwise([*tour, start]))
+        if initial_routes is not None:
+            tour = self._initial_routes_tour(matrix, origin_size, start, initial_routes)
+            length = tour_length(matrix, tour)
+            if length < optimal_length:
+                optimal_length = length
+                optimal_route = list(itertools.pairwise([*tour, start]))
+        return optimal_length, optimal_route
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
         ) -> tuple[list[list[int]], float]:
         """
         Representation method of Little's algorithm.
@@ -363,13 +1163,22 @@ class LittleAlgorithm(TSPSolver):
                 where matrix[i][j] is length of path from i-th control point to j-th
             start: index of start control point
             salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of count of expanded nodes, no limit if None
+            initial_routes: routes of previous solution, if they are shorter
+                than heuristic tour, they are initial upper bound of route length
 
         Returns:
-            list of indices of points which form circle for the most optimal TSP solution
+            list of indices of points which form circle for the most optimal TSP solution.
+            If limit is reached, the best route found so far, lower_bound property
+            contains the least lower bound of nodes which are not explored.
+            Empty list and np.inf if limit is reached before any route is found.
+
+        Raises:
+            SolutionExceptionError if there is no route through every vertex
 
         """
-        np.fill_diagonal(matrix, np.inf)
-        matrix = np.where(matrix == -1, np.inf, matrix)
+        matrix = self._prepare_matrix(matrix)
         origin_size = matrix.shape[0]
         nodes = []
 
@@ -380,37 +1189,47 @@ class LittleAlgorithm(TSPSolver):
 
         matrix = self._transform_matrix_for_multiple_salesmen(matrix, start, salesmen_count)
 
-        modified_size = matrix.shape[0]
-
-        root_matrix = matrix.copy()
-        lower_bound = (self.__reduce_matrix_by_rows(root_matrix) +
-                        self.__reduce_matrix_by_cols(root_matrix))
-        root = Node(root_matrix, lower_bound, route=[])
-        self.__add_node(nodes, root)
-
-        optimal_length = np.inf
-        optimal_route = []
-
-        while nodes:
-            cur_node = self.__get_best_node(nodes)
-
-            if optimal_length <= cur_node.lower_bound:
-                continue
-
-            if len(cur_node.route) == modified_size - 2:
-                self.__finish_node(cur_node, modified_size)
+        root = self.__init_search(matrix)
+        self._subtrees_exhausted = False
 
-            if optimal_length > cur_node.lower_bound and len(cur_node.route) == modified_size:
-                optimal_length = cur_node.lower_bound
-                optimal_route = cur_node.route
-                continue
-
-            if len(cur_node.route) < modified_size:
-                left_child, right_child = self.__make_children(cur_node)
-                self.__add_node(nodes, left_child)
-                self.__add_node(nodes, right_child)
+        optimal_length, optimal_route = self.__initial_route(matrix, origin_size, start, initial_routes)
+        self._initial_upper_bound = optimal_length
 
+        self.__raise_bound(root, self._root_matrix, optimal_length)
+        lower_bound = root.lower_bound
+        self.__add_node(nodes, root)
+        budget = self._search_budget(time_limit, node_limit)
+        self._lower_bound = lower_bound
+
+        if self._workers > 1:
+            optimal_length, optimal_route = self.__search(
+                nodes, optimal_length, optimal_route, budget, split_size=4 * self._workers
+            )
+            if nodes and not budget.exhausted:
+                optimal_length, optimal_route = self.__search_in_parallel(
+                    matrix, nodes, optimal_length, optimal_route, budget
+                )
+        else:
+            optimal_length, optimal_route = self.__search(
+                nodes, optimal_length, optimal_route, budget
+            )
+
+        self._matrix_cache.clear()
+        self._cache_queue.clear()
+        self._cached_bytes = 0
+        self._root_matrix = None
+        self._distances = None
+        mixed_route = self.__unravel_edges(start, optimal_route) if optimal_route else []
+        if mixed_route:
+            optimal_length = tour_length(matrix, mixed_route[:-1])
         self._optimal_length = optimal_length
-        mixed_route = self.__unravel_edges(start, optimal_route)
+        if not budget.exhausted and not self._subtrees_exhausted:
+            self._lower_bound = optimal_length
+        if not optimal_route:
+            if budget.exhausted or self._subtrees_exhausted:
+                return [], np.inf
+            error_msg = "Can't build a route thruough every vertex"
+            raise SolutionExceptionError(error_msg)
+
         final_routes = self._unravel_multiple_salesmen_routes(mixed_route, origin_size, start)
         return final_routes, optimal_length
@@ -0,0 +1,359 @@
+"""Local search algorithm class."""
+from collections import deque
+
+import numpy as np
+
+from .abstract_solver import SearchBudget, SolutionExceptionError, TSPSolver
+from .heuristics import finite_matrix, nearest_neighbour_tour, tour_length
+
+
+class LocalSearchSolver(TSPSolver):
+    """
+    Class that represents heuristic solution to TSP by local search.
+
+    Nearest neighbour tour is improved by 2-opt and Or-opt moves.
+    Only moves which connect vertex with one of its nearest neighbours
+    are considered, vertices whose neighbourhood gave no improvement are
+    not checked again until adjacent edges change (don't-look bits).
+    Tour is stored in array together with position of every vertex.
+
+    2-opt reverses parts of tour, so it is used only for symmetric matrices,
+    Or-opt moves segments of 1-3 vertices and works for any matrix.
+    Found route is not guaranteed to be optimal.
+    """
+
+    def __init__(self, neighbours_count: int = 8, max_segment_length: int = 3) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            neighbours_count: count of the nearest neighbours of vertex in candidate lists
+            max_segment_length: maximum count of vertices moved by Or-opt
+
+        """
+        super().__init__()
+        self._neighbours_count = neighbours_count
+        self._max_segment_length = max_segment_length
+        self._improving_moves = 0
+
+    @property
+    def improving_moves(self) -> int:
+        """
+        Return count of applied moves during last solve.
+        """
+        return self._improving_moves
+
+    def __neighbour_lists(self, matrix: np.ndarray) -> tuple[list[list[int]], list[list[float]]]:
+        """
+        Find the nearest neighbours of every vertex.
+
+        Distance between vertices is the shortest of paths in both directions.
+
+        Args:
+            matrix: matrix of distances without np.inf
+
+        Returns:
+            neighbours of every vertex sorted by distance and those distances
+
+        """
+        size = matrix.shape[0]
+        count = min(self._neighbours_count, size - 1)
+        distances = np.minimum(matrix, matrix.T)
+        np.fill_diagonal(distances, np.inf)
+        nearest = np.argpartition(distances, count - 1, axis=1)[:, :count]
+        nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+        order = np.argsort(nearest_distances, axis=1, kind="stable")
+        nearest = np.take_along_axis(nearest, order, axis=1)
+        nearest_distances = np.take_along_axis(nearest_distances, order, axis=1)
+        return nearest.tolist(), nearest_distances.tolist()
+
+    def __reverse(self, first: int, last: int) -> None:
+        """
+        Reverse part of tour between positions first and last inclusive.
+        """
+        tour = self._tour
+        tour[first:last + 1] = tour[first:last + 1][::-1]
+        pos = self._pos
+        for i in range(first, last + 1):
+            pos[tour[i]] = i
+
+    def __two_opt(self, a: int) -> list[int] | None:
+        """
+        Try 2-opt moves which connect vertex a with its neighbours.
+
+        Args:
+            a: vertex
+
+        Returns:
+            vertices of changed edges if tour is improved, None otherwise
+
+        """
+        changed = self.__two_opt_after(a)
+        if changed is None:
+            changed = self.__two_opt_before(a)
+        return changed
+
+    def __two_opt_after(self, a: int) -> list[int] | None:
+        """
+        Try 2-opt moves which replace edge from vertex a to its successor.
+
+        Args:
+            a: vertex
+
+        Returns:
+            vertices of changed edges if tour is improved, None otherwise
+
+        """
+        d = self._distances
+        tour = self._tour
+        pos = self._pos
+        size = len(tour)
+        eps = 1e-9
+
+        # a -> b ... c -> e  becomes  a -> c ... b -> e
+        b = tour[(pos[a] + 1) % size]
+        for c, ac in zip(self._neighbours[a], self._neighbour_distances[a], strict=True):
+            if ac >= d[a][b] - eps:
+                break
+            e = tour[(pos[c] + 1) % size]
+            if c == b or e == a:
+                continue
+            if ac + d[b][e] - d[a][b] - d[c][e] < -eps:
+                if pos[b] <= pos[c]:
+                    self.__reverse(pos[b], pos[c])
+                else:
+                    self.__reverse(pos[e], pos[a])
+                return [a, b, c, e]
+
+        return None
+
+    def __two_opt_before(self, a: int) -> list[int] | None:
+        """
+        Try 2-opt moves which replace edge from predecessor of vertex a to a.
+
+        Args:
+            a: vertex
+
+        Returns:
+            vertices of changed edges if tour is improved, None otherwise
+
+        """
+        d = self._distances
+        tour = self._tour
+        pos = self._pos
+        eps = 1e-9
+
+        # b -> a ... e -> c  becomes  b -> e ... a -> c
+        b = tour[pos[a] - 1]
+        for c, ac in zip(self._neighbours[a], self._neighbour_distances[a], strict=True):
+            if ac >= d[b][a] - eps:
+                break
+            e = tour[pos[c] - 1]
+            if c == b or e == a:
+                continue
+            if ac + d[b][e] - d[b][a] - d[e][c] < -eps:
+                if pos[a] <= pos[e]:
+                    self.__reverse(pos[a], pos[e])
+                else:
+                    self.__reverse(pos[c], pos[b])
+                return [a, b, c, e]
+
+        return None
+
+    def __move_segment(self, first: int, length: int, after: int, *, reverse: bool) -> None:
+        """
+        Move segment of tour to other place.
+
+        Args:
+            first: position of the first vertex of segment
+            length: count of vertices in segment
+            after: vertex after which segment is inserted
+            reverse: True if segment is inserted in reversed order
+
+        """
+        tour = self._tour
+        size = len(tour)
+        rotated = tour[first:] + tour[:first]
+        segment = rotated[:length]
+        rest = rotated[length:]
+        if reverse:
+            segment.reverse()
+        insert_at = rest.index(after) + 1
+        tour[:] = rest[:insert_at] + segment + rest[insert_at:]
+        pos = self._pos
+        for i in range(size):
+            pos[tour[i]] = i
+
+    def __insertion_candidates(
+            self,
+            a: int,
+            last: int,
+            gain: float
+        ) -> list[tuple[int, int, bool]]:
+        """
+        Find edges next to neighbours of the ends of segment where segment may be inserted.
+
+        Args:
+            a: the first vertex of segment
+            last: the last vertex of segment
+            gain: decrease of tour length after removal of segment
+
+        Returns:
+            edges (x, y) and True if segment is inserted between them in reversed order
+
+        """
+        tour = self._tour
+        pos = self._pos
+        size = len(tour)
+        eps = 1e-9
+
+        candidates = []
+        # x -> a ... last -> y or, reversed, x -> last ... a -> y
+        for c, distance in zip(self._neighbours[a], self._neighbour_distances[a], strict=True):
+            if distance >= gain - eps:
+                break
+            candidates.append((c, tour[(pos[c] + 1) % size], False))
+            if self._symmetric:
+                candidates.append((tour[pos[c] - 1], c, True))
+        for c, distance in zip(self._neighbours[last], self._neighbour_distances[last], strict=True):
+            if distance >= gain - eps:
+                break
+            candidates.append((tour[pos[c] - 1], c, False))
+            if self._symmetric:
+                candidates.append((c, tour[(pos[c] + 1) % size], True))
+        return candidates
+
+    def __or_opt(self, a: int) -> list[int] | None:
+        """
+        Try Or-opt moves of segments which start with vertex a.
+
+        Segment is inserted next to neighbours of its first or last vertex.
+
+        Args:
+            a: vertex
+
+        Returns:
+            vertices of changed edges if tour is improved, None otherwise
+
+        """
+        d = self._distances
+        tour = self._tour
+        pos = self._pos
+        size = len(tour)
+        eps = 1e-9
+
+        first = pos[a]
+        prev = tour[first - 1]
+        for length in range(1, min(self._max_segment_length, size - 3) + 1):
+            last = tour[(first + length - 1) % size]
+            nxt = tour[(first + length) % size]
+            segment = {tour[(first + i) % size] for i in range(length)}
+            gain = d[prev][a] + d[last][nxt] - d[prev][nxt]
+            if gain <= eps:
+                continue
+
+            for x, y, reverse in self.__insertion_candidates(a, last, gain):
+                if x in segment or y in segment:
+                    continue
+                added = d[x][last] + d[a][y] if reverse else d[x][a] + d[last][y]
+                if added - d[x][y] - gain < -eps:
+                    self.__move_segment(first, length, x, reverse=reverse)
+                    return [prev, a, last, nxt, x, y]
+
+        return None
+
+    def __improve(self, budget: SearchBudget) -> None:
+        """
+        Apply improving moves while there are vertices to check.
+
+        Args:
+            budget: limit of time and count of checked vertices
+
+        """
+        size = len(self._tour)
+        queue = deque(self._tour)
+        queued = [True] * size
+        while queue:
+            if budget.spend():
+                return
+            a = queue.popleft()
+            queued[a] = False
+            changed = self.__two_opt(a) if self._symmetric else None
+            if changed is None:
+                changed = self.__or_opt(a)
+            if changed is None:
+                continue
+            self._improving_moves += 1
+            for vertex in changed:
+                if not queued[vertex]:
+                    queued[vertex] = True
+                    queue.append(vertex)
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
+        """
+        Solve travel salesman problem approximately.
+
+        Args:
+            matrix: matrix of lengthes,
+                where matrix[i][j] is length of path from i-th control point to j-th
+            start: index of start control point
+            salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of count of checked vertices, no limit if None
+            initial_routes: routes of previous solution, search starts from them,
+                from nearest neighbour tour if None
+
+        Returns:
+            sequence(list) of points in found order and summary length of routes.
+
+        Raises:
+            SolutionExceptionError if there is no route through every vertex
+                or local search could not find one
+
+        """
+        matrix = self._prepare_matrix(matrix)
+        origin_size = matrix.shape[0]
+
+        self._check_input_data(matrix, start)
+
+        if salesmen_count >= origin_size:
+            salesmen_count = origin_size - 1
+
+        matrix = self._transform_matrix_for_multiple_salesmen(matrix, start, salesmen_count)
+
+        finite = finite_matrix(matrix)
+        if initial_routes is None:
+            self._tour = nearest_neighbour_tour(finite, start)
+        else:
+            self._tour = self._initial_routes_tour(matrix, origin_size, start, initial_routes)
+        self._pos = [0] * len(self._tour)
+        for i, vertex in enumerate(self._tour):
+            self._pos[vertex] = i
+        self._improving_moves = 0
+
+        if len(self._tour) > 3:  # noqa: PLR2004
+            self._symmetric = bool(np.allclose(finite, finite.T, rtol=1e-12, atol=0))
+            self._distances = finite.tolist()
+            self._neighbours, self._neighbour_distances = self.__neighbour_lists(finite)
+            self.__improve(self._search_budget(time_limit, node_limit))
+
+        first = self._pos[start]
+        tour = self._tour[first:] + self._tour[:first]
+        length = tour_length(matrix, tour)
+        if length == np.inf:
+            error_msg = "Local search could not find a route through every vertex"
+            raise SolutionExceptionError(error_msg)
+
+        self._optimal_length = length
+        self._lower_bound = min(length, self._reduction_lower_bound(matrix))
+        route = self._unravel_multiple_salesmen_routes([*tour, start], origin_size, start)
+        return route, length
@@ -0,0 +1,292 @@
+"""Parallel multi-start algorithm class."""
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from .abstract_solver import SolutionExceptionError, TSPSolver
+from .heuristics import finite_matrix, nearest_neighbour_tour
+from .local_search import LocalSearchSolver
+from .or_3opt import Or3OptSolver
+
+_shared_matrix: np.ndarray | None = None
+_shared_block: shared_memory.SharedMemory | None = None
+
+
+def _attach_matrix(name: str, shape: tuple[int, int], dtype: np.dtype) -> None:
+    """
+    Attach worker process to matrix of distances in shared memory.
+
+    Args:
+        name: name of shared memory block
+        shape: shape of matrix
+        dtype: type of matrix elements
+
+    """
+    global _shared_matrix, _shared_block  # noqa: PLW0603
+    _shared_block = shared_memory.SharedMemory(name=name)
+    _shared_matrix = np.ndarray(shape, dtype=dtype, buffer=_shared_block.buf)
+    _shared_matrix.flags.writeable = False
+
+
+def _random_start_routes(
+        matrix: np.ndarray,
+        start: int,
+        rng: np.random.Generator
+    ) -> list[list[int]]:
+    """
+    Build nearest neighbour tour from random vertex and rotate it to start.
+
+    Args:
+        matrix: matrix of distances
+        start: index of start control point
+        rng: generator of random numbers
+
+    Returns:
+        tour as single route in format of initial routes of solvers
+
+    """
+    tour = nearest_neighbour_tour(finite_matrix(matrix), int(rng.integers(matrix.shape[0])))
+    position = tour.index(start)
+    return [[*tour[position:], *tour[:position], start]]
+
+
+def _restart(  # noqa: PLR0913
+        matrix: np.ndarray | None,
+        start: int,
+        salesmen_count: int,
+        seed: np.random.SeedSequence,
+        max_kicks: int,
+        time_limit: float | None,
+        initial_routes: list[list[int]] | None = None,
+        *,
+        random_start: bool = True,
+        cancel_event: threading.Event | None = None
+    ) -> tuple[list[list[int]], float, float]:
+    """
+    Run one randomized restart of local search.
+
+    Symmetric matrix is searched by 2-opt and Or-opt, asymmetric one
+    by Or-3opt with random kicks of local optimum.
+
+    Args:
+        matrix: matrix of distances, None to use matrix in shared memory
+        start: index of start control point
+        salesmen_count: count of salesmen
+        seed: seed of random start tour and random kicks of restart
+        max_kicks: count of kicks of local optimum of asymmetric matrix
+        time_limit: limit of restart time in seconds, no limit if None
+        initial_routes: routes which local search starts from
+        random_start: start from nearest neighbour tour of random vertex if there
+            are no initial routes, from nearest neighbour tour of start otherwise
+        cancel_event: event which stops restart, restart is not cancelled if None
+
+    Returns:
+        routes, their summary length and lower bound of optimal length
+
+    """
+    if matrix is None:
+        matrix = _shared_matrix
+    if initial_routes is None and random_start:
+        initial_routes = _random_start_routes(matrix, start, np.random.default_rng(seed))
+    if np.array_equal(matrix, matrix.T):
+        solver = LocalSearchSolver()
+    else:
+        solver = Or3OptSolver(max_kicks=max_kicks, seed=int(seed.generate_state(1)[0]))
+    solver.set_cancel_event(cancel_event)
+    routes, length = solver.solve(
+        matrix.copy(), start, salesmen_count,
+        time_limit=time_limit, initial_routes=initial_routes,
+    )
+    return routes, length, solver.lower_bound
+
+
+class MultiStartSolver(TSPSolver):
+    """
+    Class that represents heuristic solution to TSP by many restarts of local search.
+
+    Every restart starts from its own random tour (the first one starts
+    from nearest neighbour tour of start point or from initial routes),
+    symmetric matrix is searched by 2-opt and Or-opt, asymmetric one by
+    Or-3opt with its own random kicks. Restarts are distributed to process
+    pool, matrix of distances is passed to workers once through shared
+    memory. The best route is kept, search stops after given count of
+    restarts, after stagnation (restarts without improvement), when time
+    is over or search is cancelled (restarts which already run in worker
+    processes are finished). Results of restarts are processed in
+    order of their seeds, so without time limit result depends only on seed.
+    """
+
+    def __init__(
+            self,
+            workers: int = 1,
+            restarts: int = 32,
+            stagnation: int = 8,
+            max_kicks: int = 50,
+            seed: int | None = 0
+        ) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            workers: count of processes, restarts run in current process if 1
+            restarts: maximum count of restarts
+            stagnation: count of consecutive restarts without improvement which stops search
+            max_kicks: count of kicks of local optimum in every restart
+            seed: seed of restarts, random if None
+
+        """
+        super().__init__()
+        self._workers = workers
+        self._restarts = restarts
+        self._stagnation = stagnation
+        self._max_kicks = max_kicks
+        self._seed = seed
+        self._finished_restarts = 0
+
+    @property
+    def finished_restarts(self) -> int:
+        """
+        Return count of restarts processed during last solve.
+        """
+        return self._finished_restarts
+
+    def __search(
+            self,
+            submit: Callable[[np.random.SeedSequence, float | None], Future],
+            seeds: list[np.random.SeedSequence],
+            time_limit: float | None
+        ) -> tuple[list[list[int]], float, float]:
+        """
+        Run restarts and keep the best route.
+
+        Args:
+            submit: function which starts restart with given seed and time limit
+                and returns its future
+            seeds: seeds of every restart
+            time_limit: limit of search time in seconds, no limit if None
+
+        Returns:
+            the best routes, their length and the greatest lower bound
+
+        """
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        in_flight = deque()
+        next_seed = 0
+        best_routes = []
+        best_length = np.inf
+        lower_bound = 0.0
+        without_improvement = 0
+
+        while True:
+            while next_seed < len(seeds) and len(in_flight) < 2 * self._workers:
+                remaining = None
+                if deadline is not None:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0 and next_seed > 0:
+                        break
+                if self.cancelled and next_seed > 0:
+                    break
+                in_flight.append(submit(seeds[next_seed], remaining))
+                next_seed += 1
+            if not in_flight:
+                break
+
+            routes, length, restart_bound = in_flight.popleft().result()
+            self._finished_restarts += 1
+            lower_bound = max(lower_bound, restart_bound)
+            if length < best_length:
+                best_routes, best_length = routes, length
+                without_improvement = 0
+            else:
+                without_improvement += 1
+            if without_improvement >= self._stagnation or self.cancelled:
+                for future in in_flight:
+                    future.cancel()
+                break
+
+        return best_routes, best_length, lower_bound
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
+        """
+        Solve travel salesman problem approximately.
+
+        Args:
+            matrix: matrix of lengthes,
+                where matrix[i][j] is length of path from i-th control point to j-th
+            start: index of start control point
+            salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of count of restarts, no limit if None
+            initial_routes: routes of previous solution, the first restart starts from them
+
+        Returns:
+            sequence(list) of points in found order and summary length of routes.
+
+        Raises:
+            SolutionExceptionError if there is no route through every vertex
+                or local search could not find one
+
+        """
+        matrix = self._prepare_matrix(matrix)
+        self._check_input_data(matrix, start)
+
+        restarts = self._restarts if node_limit is None else min(self._restarts, node_limit)
+        seeds = np.random.SeedSequence(self._seed).spawn(max(restarts, 1))
+        self._finished_restarts = 0
+
+        if self._workers <= 1:
+            def submit(seed: np.random.SeedSequence, remaining: float | None) -> Future:
+                future = Future()
+                future.set_result(_restart(
+                    matrix, start, salesmen_count, seed, self._max_kicks, remaining,
+                    initial_routes if seed is seeds[0] else None,
+                    random_start=seed is not seeds[0], cancel_event=self._cancel_event,
+                ))
+                return future
+
+            routes, length, lower_bound = self.__search(submit, seeds, time_limit)
+        else:
+            block = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+            try:
+                shared = np.ndarray(matrix.shape, dtype=matrix.dtype, buffer=block.buf)
+                shared[:] = matrix
+                del shared
+                with ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    initializer=_attach_matrix,
+                    initargs=(block.name, matrix.shape, matrix.dtype),
+                ) as executor:
+                    def submit(seed: np.random.SeedSequence, remaining: float | None) -> Future:
+                        return executor.submit(
+                            _restart, None, start, salesmen_count, seed,
+                            self._max_kicks, remaining,
+                            initial_routes if seed is seeds[0] else None,
+                            random_start=seed is not seeds[0],
+                        )
+
+                    routes, length, lower_bound = self.__search(submit, seeds, time_limit)
+            finally:
+                block.close()
+                block.unlink()
+
+        if not routes:
+            error_msg = "Local search could not find a route through every vertex"
+            raise SolutionExceptionError(error_msg)
+
+        self._optimal_length = length
+        self._lower_bound = min(length, lower_bound)
+        return routes, length
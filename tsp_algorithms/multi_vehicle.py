@@ -0,0 +1,372 @@
+"""Route-first cluster-second algorithm class for multiple salesmen."""
+from collections import deque
+
+import numpy as np
+
+from .abstract_solver import SearchBudget, SolutionExceptionError, TSPSolver
+from .heuristics import finite_matrix, tour_length
+from .local_search import LocalSearchSolver
+from .or_3opt import Or3OptSolver
+
+
+class MultiVehicleSolver(TSPSolver):
+    """
+    Class that represents heuristic solution to TSP with multiple salesmen.
+
+    Matrix is not expanded by copies of start point. Tour through every
+    point is built by local search (giant tour), then it is split into
+    routes of salesmen by dynamic programming which finds the optimal
+    split for given order of points in O(salesmen * n). Routes are
+    improved by moves between them: relocation of point to other place
+    and exchange of tails of two routes (2-opt*), neither of them reverses
+    routes, so asymmetric matrices are supported. Finally every route is
+    improved separately. Every salesman visits at least one point.
+    """
+
+    def __init__(self, neighbours_count: int = 8) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            neighbours_count: count of the nearest neighbours of point in candidate lists
+
+        """
+        super().__init__()
+        self._neighbours_count = neighbours_count
+        self._improving_moves = 0
+
+    @property
+    def improving_moves(self) -> int:
+        """
+        Return count of applied moves between routes during last solve.
+        """
+        return self._improving_moves
+
+    def __tour_solver(self, matrix: np.ndarray) -> TSPSolver:
+        """
+        Return solver of single route, 2-opt is used only for symmetric matrix.
+
+        Solver is cancelled by the same event as this solver.
+        """
+        solver = LocalSearchSolver() if np.array_equal(matrix, matrix.T) else Or3OptSolver()
+        solver.set_cancel_event(self._cancel_event)
+        return solver
+
+    @staticmethod
+    def _split(
+            matrix: np.ndarray,
+            depot: int,
+            tour: list[int],
+            routes_count: int
+        ) -> list[list[int]]:
+        """
+        Split order of points into routes with the least summary length.
+
+        Cost of route of points tour[i..j] is d(depot, tour[i]) + P[j] - P[i] + d(tour[j], depot),
+        where P is prefix sum of lengths along tour, so the best previous split for
+        every j is found by running minimum over i.
+
+        Args:
+            matrix: matrix of distances without np.inf
+            depot: start point of every route
+            tour: order of points except depot
+            routes_count: count of non-empty routes, not greater than len(tour)
+
+        Returns:
+            routes as lists of points without depot
+
+        """
+        points = np.asarray(tour)
+        size = points.shape[0]
+        prefix = np.concatenate(
+            ([0.0], np.cumsum(matrix[points[:-1], points[1:]], dtype=np.float64))
+        )
+        leave = matrix[depot, points] - prefix
+        back = prefix + matrix[points, depot]
+        indices = np.arange(size)
+
+        costs = leave[0] + back
+        choices = []
+        for routes in range(2, routes_count + 1):
+            previous = np.full(size, np.inf)
+            previous[1:] = costs[:-1] + leave[1:]
+            previous[:routes - 1] = np.inf
+            minima = np.minimum.accumulate(previous)
+            choices.append(np.maximum.accumulate(np.where(previous <= minima, indices, 0)))
+            costs = minima + back
+
+        result = []
+        last = size - 1
+        for choice in reversed(choices):
+            first = int(choice[last])
+            result.append(tour[first:last + 1])
+            last = first - 1
+        result.append(tour[:last + 1])
+        return result[::-1]
+
+    def __neighbour_lists(self, matrix: np.ndarray) -> list[list[int]]:
+        """
+        Find the nearest neighbours of every point by the shorter of two directions.
+        """
+        count = min(self._neighbours_count, matrix.shape[0] - 1)
+        distances = np.minimum(matrix, matrix.T)
+        np.fill_diagonal(distances, np.inf)
+        nearest = np.argpartition(distances, count - 1, axis=1)[:, :count]
+        order = np.argsort(np.take_along_axis(distances, nearest, axis=1), axis=1, kind="stable")
+        return np.take_along_axis(nearest, order, axis=1).tolist()
+
+    def __neighbours_in_route(self, vertex: int) -> tuple[int, int]:
+        """
+        Return previous and next point of vertex in its route, depot at the ends.
+        """
+        route = self._routes[self._route_of[vertex]]
+        position = self._pos[vertex]
+        previous = route[position - 1] if position > 0 else self._depot
+        following = route[position + 1] if position + 1 < len(route) else self._depot
+        return previous, following
+
+    def __insertion_places(self, vertex: int) -> list[tuple[int, int]]:
+        """
+        Find places next to the nearest neighbours of vertex.
+
+        Returns:
+            pairs (route, index), vertex may be inserted before route[index]
+
+        """
+        places = []
+        for neighbour in self._neighbours[vertex]:
+            if neighbour == self._depot:
+                for route, points in enumerate(self._routes):
+                    places.extend(((route, 0), (route, len(points))))
+            else:
+                route = self._route_of[neighbour]
+                position = self._pos[neighbour]
+                places.extend(((route, position), (route, position + 1)))
+        return places
+
+    def __update_positions(self, route: int) -> None:
+        """
+        Update route and position of every point of route.
+        """
+        for position, vertex in enumerate(self._routes[route]):
+            self._route_of[vertex] = route
+            self._pos[vertex] = position
+
+    def __relocate(self, vertex: int) -> list[int] | None:
+        """
+        Try to move vertex to place next to one of its neighbours.
+
+        Args:
+            vertex: point
+
+        Returns:
+            points whose adjacent edges changed if routes are improved, None otherwise
+
+        """
+        d = self._distances
+        eps = 1e-9
+        source = self._route_of[vertex]
+        previous, following = self.__neighbours_in_route(vertex)
+        gain = d[previous][vertex] + d[vertex][following] - d[previous][following]
+        if gain <= eps:
+            return None
+
+        for route, index in self.__insertion_places(vertex):
+            points = self._routes[route]
+            if route == source:
+                position = self._pos[vertex]
+                if index in (position, position + 1):
+                    continue
+            elif len(self._routes[source]) == 1:
+                continue
+            before = points[index - 1] if index > 0 else self._depot
+            after = points[index] if index < len(points) else self._depot
+            if d[before][vertex] + d[vertex][after] - d[before][after] < gain - eps:
+                position = self._pos[vertex]
+                target = index - 1 if route == source and index > position else index
+                del self._routes[source][position]
+                points.insert(target, vertex)
+                self.__update_positions(source)
+                self.__update_positions(route)
+                return [v for v in (previous, following, before, after, vertex) if v != self._depot]
+
+        return None
+
+    def __exchange_tails(self, vertex: int) -> list[int] | None:
+        """
+        Try to connect vertex with neighbour of other route by exchange of route tails.
+
+        Routes a = [..., vertex, x, ...] and b = [..., y, neighbour, ...] become
+        [..., vertex, neighbour, ...] and [..., y, x, ...].
+
+        Args:
+            vertex: point
+
+        Returns:
+            points whose adjacent edges changed if routes are improved, None otherwise
+
+        """
+        d = self._distances
+        eps = 1e-9
+        first = self._route_of[vertex]
+        cut = self._pos[vertex] + 1
+        route_a = self._routes[first]
+        x = route_a[cut] if cut < len(route_a) else self._depot
+        for neighbour in self._neighbours[vertex]:
+            if neighbour == self._depot or self._route_of[neighbour] == first:
+                continue
+            second = self._route_of[neighbour]
+            route_b = self._routes[second]
+            other_cut = self._pos[neighbour]
+            y = route_b[other_cut - 1] if other_cut > 0 else self._depot
+            if other_cut + len(route_a) - cut == 0:
+                continue
+            if d[vertex][neighbour] + d[y][x] < d[vertex][x] + d[y][neighbour] - eps:
+                self._routes[first] = route_a[:cut] + route_b[other_cut:]
+                self._routes[second] = route_b[:other_cut] + route_a[cut:]
+                self.__update_positions(first)
+                self.__update_positions(second)
+                return [v for v in (vertex, x, y, neighbour) if v != self._depot]
+
+        return None
+
+    def __improve(self, budget: SearchBudget) -> None:
+        """
+        Apply moves between routes while there are points to check.
+
+        Args:
+            budget: limit of time and count of checked points
+
+        """
+        queue = deque(vertex for route in self._routes for vertex in route)
+        queued = [False] * len(self._distances)
+        for vertex in queue:
+            queued[vertex] = True
+        while queue:
+            if budget.spend():
+                return
+            vertex = queue.popleft()
+            queued[vertex] = False
+            changed = self.__relocate(vertex)
+            if changed is None:
+                changed = self.__exchange_tails(vertex)
+            if changed is None:
+                continue
+            self._improving_moves += 1
+            for point in changed:
+                if not queued[point]:
+                    queued[point] = True
+                    queue.append(point)
+
+    def __improve_route(
+            self,
+            matrix: np.ndarray,
+            route: list[int],
+            budget: SearchBudget
+        ) -> list[int]:
+        """
+        Improve order of points of single route.
+
+        Args:
+            matrix: matrix of distances
+            route: points of route without depot
+            budget: limit of time
+
+        Returns:
+            improved route without depot
+
+        """
+        if len(route) < 3 or budget.exhausted:  # noqa: PLR2004
+            return route
+        vertices = np.array([self._depot, *route])
+        submatrix = matrix[np.ix_(vertices, vertices)]
+        try:
+            improved, _ = self.__tour_solver(submatrix).solve(
+                submatrix.copy(), 0, time_limit=budget.time_left
+            )
+        except SolutionExceptionError:
+            return route
+        order = vertices[improved[0][1:-1]].tolist()
+        if tour_length(matrix, [self._depot, *order]) < tour_length(matrix, [self._depot, *route]):
+            return order
+        return route
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
+        """
+        Solve travel salesman problem with multiple salesmen approximately.
+
+        Args:
+            matrix: matrix of lengthes,
+                where matrix[i][j] is length of path from i-th control point to j-th
+            start: index of start control point
+            salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of count of points checked by moves between routes,
+                no limit if None
+            initial_routes: routes of previous solution, giant tour starts from
+                their concatenation
+
+        Returns:
+            sequence(list) of points in found order and summary length of routes.
+
+        Raises:
+            SolutionExceptionError if there is no route through every vertex
+                or local search could not find one
+
+        """
+        matrix = self._prepare_matrix(matrix)
+        origin_size = matrix.shape[0]
+
+        self._check_input_data(matrix, start)
+
+        if salesmen_count >= origin_size:
+            salesmen_count = origin_size - 1
+        salesmen_count = max(salesmen_count, 1)
+
+        budget = self._search_budget(time_limit, node_limit)
+        self._improving_moves = 0
+        self._depot = start
+        if origin_size == 1:
+            self._optimal_length = self._lower_bound = 0.0
+            return [[start, start]], 0.0
+
+        giant_hint = None
+        if initial_routes is not None:
+            giant_hint = [[start, *(vertex for route in initial_routes for vertex in route), start]]
+        giant_routes, _ = self.__tour_solver(matrix).solve(
+            matrix.copy(), start, time_limit=time_limit, initial_routes=giant_hint
+        )
+        finite = finite_matrix(matrix)
+        self._distances = finite.tolist()
+        self._routes = self._split(finite, start, giant_routes[0][1:-1], salesmen_count)
+        self._route_of = [0] * origin_size
+        self._pos = [0] * origin_size
+        for route in range(len(self._routes)):
+            self.__update_positions(route)
+
+        if salesmen_count > 1 and origin_size > 3:  # noqa: PLR2004
+            self._neighbours = self.__neighbour_lists(finite)
+            self.__improve(budget)
+            self._routes = [
+                self.__improve_route(matrix, route, budget) for route in self._routes
+            ]
+
+        routes = [[start, *route, start] for route in self._routes]
+        length = sum(tour_length(matrix, route[:-1]) for route in routes)
+        if length == np.inf:
+            error_msg = "Local search could not find a route through every vertex"
+            raise SolutionExceptionError(error_msg)
+
+        self._optimal_length = length
+        expanded = self._transform_matrix_for_multiple_salesmen(matrix, start, salesmen_count)
+        self._lower_bound = min(length, self._reduction_lower_bound(expanded))
+        return routes, length
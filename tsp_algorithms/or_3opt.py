@@ -0,0 +1,292 @@
+"""Or-3opt local search algorithm class for asymmetric matrices."""
+from collections import deque
+
+import numpy as np
+
+from .abstract_solver import SearchBudget, SolutionExceptionError, TSPSolver
+from .heuristics import finite_matrix, nearest_neighbour_tour, tour_length
+
+
+class Or3OptSolver(TSPSolver):
+    """
+    Class that represents heuristic solution to asymmetric TSP.
+
+    Tour is improved by Or-3opt moves (exchange of two adjacent segments),
+    which do not reverse any part of tour, so length of every move is
+    correct for asymmetric matrix. Moves are searched sequentially as in
+    Lin-Kernighan: the first new edge leaves vertex to one of its nearest
+    successors, the second one enters successor of that vertex from one of
+    its nearest predecessors, and search continues only while partial gain
+    is positive. Local optimum is perturbed by random double-bridge kicks
+    while time and count of kicks allow, the best tour is kept.
+    """
+
+    def __init__(
+            self,
+            neighbours_count: int = 8,
+            max_kicks: int = 100,
+            seed: int | None = 0
+        ) -> None:
+        """
+        Initialize solver.
+
+        Args:
+            neighbours_count: count of the nearest successors and predecessors of vertex
+                in candidate lists
+            max_kicks: maximum count of double-bridge kicks of local optimum
+            seed: seed of random kicks
+
+        """
+        super().__init__()
+        self._neighbours_count = neighbours_count
+        self._max_kicks = max_kicks
+        self._seed = seed
+        self._improving_moves = 0
+        self._kicks = 0
+
+    @property
+    def improving_moves(self) -> int:
+        """
+        Return count of applied Or-3opt moves during last solve.
+        """
+        return self._improving_moves
+
+    @property
+    def kicks(self) -> int:
+        """
+        Return count of double-bridge kicks during last solve.
+        """
+        return self._kicks
+
+    def __neighbour_lists(
+            self,
+            matrix: np.ndarray
+        ) -> tuple[list[list[tuple[int, float]]], list[list[tuple[int, float]]]]:
+        """
+        Find the nearest successors and predecessors of every vertex.
+
+        Args:
+            matrix: matrix of distances without np.inf
+
+        Returns:
+            pairs (vertex, distance) sorted by distance: the nearest successors
+            and the nearest predecessors of every vertex
+
+        """
+        count = min(self._neighbours_count, matrix.shape[0] - 1)
+        lists = []
+        for oriented in (matrix, matrix.T):
+            distances = oriented.copy()
+            np.fill_diagonal(distances, np.inf)
+            nearest = np.argpartition(distances, count - 1, axis=1)[:, :count]
+            nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+            order = np.argsort(nearest_distances, axis=1, kind="stable")
+            nearest = np.take_along_axis(nearest, order, axis=1).tolist()
+            nearest_distances = np.take_along_axis(nearest_distances, order, axis=1).tolist()
+            lists.append([
+                list(zip(vertices, values, strict=True))
+                for vertices, values in zip(nearest, nearest_distances, strict=True)
+            ])
+        return lists[0], lists[1]
+
+    def __exchange(self, a: int, second: int, last: int) -> None:
+        """
+        Exchange two adjacent segments of tour which follow vertex a.
+
+        Tour a -> [first segment] -> [second segment] -> rest becomes
+        a -> [second segment] -> [first segment] -> rest.
+
+        Args:
+            a: vertex before the first segment
+            second: offset of the first vertex of the second segment from a
+            last: offset of the last vertex of the second segment from a
+
+        """
+        tour = self._tour
+        first = self._pos[a]
+        rotated = tour[first:] + tour[:first]
+        tour[:] = rotated[:1] + rotated[second:last + 1] + rotated[1:second] + rotated[last + 1:]
+        pos = self._pos
+        for i, vertex in enumerate(tour):
+            pos[vertex] = i
+
+    def __or_3opt(self, a: int) -> list[int] | None:
+        """
+        Try Or-3opt moves which replace edge from vertex a.
+
+        Edges a -> a1, b -> b1, c -> c1 are replaced by a -> b1, c -> a1, b -> c1.
+
+        Args:
+            a: vertex
+
+        Returns:
+            vertices of changed edges if tour is improved, None otherwise
+
+        """
+        d = self._distances
+        tour = self._tour
+        pos = self._pos
+        size = len(tour)
+        eps = 1e-9
+
+        a1 = tour[(pos[a] + 1) % size]
+        gain_a = d[a][a1]
+        for b1, distance_ab1 in self._successors[a]:
+            gain_b = gain_a - distance_ab1
+            if gain_b <= eps:
+                break
+            offset_b1 = (pos[b1] - pos[a]) % size
+            if offset_b1 < 2:  # noqa: PLR2004
+                continue
+            b = tour[pos[b1] - 1]
+            gain_b += d[b][b1]
+            for c, distance_ca1 in self._predecessors[a1]:
+                gain_c = gain_b - distance_ca1
+                if gain_c <= eps:
+                    break
+                offset_c = (pos[c] - pos[a]) % size
+                if offset_c < offset_b1:
+                    continue
+                c1 = tour[(pos[c] + 1) % size]
+                if gain_c + d[c][c1] - d[b][c1] > eps:
+                    self.__exchange(a, offset_b1, offset_c)
+                    return [a, a1, b, b1, c, c1]
+
+        return None
+
+    def __improve(self, queue: deque, budget: SearchBudget) -> None:
+        """
+        Apply improving moves while there are vertices to check.
+
+        Args:
+            queue: vertices to check
+            budget: limit of time and count of checked vertices
+
+        """
+        queued = [False] * len(self._tour)
+        for vertex in queue:
+            queued[vertex] = True
+        while queue:
+            if budget.spend():
+                return
+            a = queue.popleft()
+            queued[a] = False
+            changed = self.__or_3opt(a)
+            if changed is None:
+                continue
+            self._improving_moves += 1
+            for vertex in changed:
+                if not queued[vertex]:
+                    queued[vertex] = True
+                    queue.append(vertex)
+
+    def __kick(self, rng: np.random.Generator) -> list[int]:
+        """
+        Perturb tour by random double-bridge move.
+
+        Returns:
+            vertices of changed edges
+
+        """
+        size = len(self._tour)
+        a = self._tour[int(rng.integers(size))]
+        second, last = sorted(rng.choice(np.arange(2, size), size=2, replace=False).tolist())
+        last -= 1
+        rotated = self._tour[self._pos[a]:] + self._tour[:self._pos[a]]
+        changed = [rotated[i] for i in (0, 1, second - 1, second, last, (last + 1) % size)]
+        self.__exchange(a, second, last)
+        return changed
+
+    def __tour_length(self) -> float:
+        """
+        Return length of current tour by matrix without np.inf.
+        """
+        d = self._distances
+        tour = self._tour
+        return sum(d[tour[i - 1]][tour[i]] for i in range(len(tour)))
+
+    def solve(  # noqa: PLR0913
+            self,
+            matrix: np.ndarray,
+            start: int,
+            salesmen_count: int = 1,
+            *,
+            time_limit: float | None = None,
+            node_limit: int | None = None,
+            initial_routes: list[list[int]] | None = None
+        ) -> tuple[list[list[int]], float]:
+        """
+        Solve travel salesman problem approximately.
+
+        Args:
+            matrix: matrix of lengthes,
+                where matrix[i][j] is length of path from i-th control point to j-th
+            start: index of start control point
+            salesmen_count: count of salesmen
+            time_limit: limit of search time in seconds, no limit if None
+            node_limit: limit of count of checked vertices, no limit if None
+            initial_routes: routes of previous solution, search starts from them,
+                from nearest neighbour tour if None
+
+        Returns:
+            sequence(list) of points in found order and summary length of routes.
+
+        Raises:
+            SolutionExceptionError if there is no route through every vertex
+                or local search could not find one
+
+        """
+        matrix = self._prepare_matrix(matrix)
+        origin_size = matrix.shape[0]
+
+        self._check_input_data(matrix, start)
+
+        if salesmen_count >= origin_size:
+            salesmen_count = origin_size - 1
+
+        matrix = self._transform_matrix_for_multiple_salesmen(matrix, start, salesmen_count)
+
+        finite = finite_matrix(matrix)
+        if initial_routes is None:
+            self._tour = nearest_neighbour_tour(finite, start)
+        else:
+            self._tour = self._initial_routes_tour(matrix, origin_size, start, initial_routes)
+        self._pos = [0] * len(self._tour)
+        for i, vertex in enumerate(self._tour):
+            self._pos[vertex] = i
+        self._improving_moves = 0
+        self._kicks = 0
+
+        best_tour = self._tour
+        if len(self._tour) > 3:  # noqa: PLR2004
+            self._distances = finite.tolist()
+            self._successors, self._predecessors = self.__neighbour_lists(finite)
+            budget = self._search_budget(time_limit, node_limit)
+            rng = np.random.default_rng(self._seed)
+
+            self.__improve(deque(self._tour), budget)
+            best_tour = self._tour.copy()
+            best_length = self.__tour_length()
+            while self._kicks < self._max_kicks and not budget.exhausted:
+                self._kicks += 1
+                self.__improve(deque(self.__kick(rng)), budget)
+                length = self.__tour_length()
+                if length < best_length:
+                    best_tour = self._tour.copy()
+                    best_length = length
+                else:
+                    self._tour[:] = best_tour
+                    for i, vertex in enumerate(self._tour):
+                        self._pos[vertex] = i
+
+        first = best_tour.index(start)
+        tour = best_tour[first:] + best_tour[:first]
+        length = tour_length(matrix, tour)
+        if length == np.inf:
+            error_msg = "Local search could not find a route through every vertex"
+            raise SolutionExceptionError(error_msg)
+
+        self._optimal_length = length
+        self._lower_bound = min(length, self._reduction_lower_bound(matrix))
+        route = self._unravel_multiple_salesmen_routes([*tour, start], origin_size, start)
+        return route, length
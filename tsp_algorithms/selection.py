@@ -0,0 +1,195 @@
+"""
+Choice of TSP solver.
+
+This module provides registry of solvers by name and automatic choice
+of solver for matrix of distances. Exact solvers are chosen while their
+expected time fits into time budget: brute force for tiny matrices,
+Held-Karp dynamic programming for small ones, Little's branch and bound
+for larger ones, otherwise heuristic search is chosen (multi-vehicle
+search for several salesmen, it does not add copies of start point to
+matrix). Expected times are
+rough estimates measured on random instances, real time depends on
+structure of matrix.
+"""
+import math
+
+import numpy as np
+
+from .abstract_solver import TSPSolver
+from .bounds import assignment_bound
+from .brute_force import BruteForceSolver
+from .held_karp import HeldKarpSolver
+from .little_algorithm import LittleAlgorithm
+from .local_search import LocalSearchSolver
+from .multi_start import MultiStartSolver
+from .multi_vehicle import MultiVehicleSolver
+from .or_3opt import Or3OptSolver
+
+AUTO = "auto"
+
+SOLVERS: dict[str, type[TSPSolver]] = {
+    "little": LittleAlgorithm,
+    "brute_force": BruteForceSolver,
+    "held_karp": HeldKarpSolver,
+    "local_search": LocalSearchSolver,
+    "or_3opt": Or3OptSolver,
+    "multi_start": MultiStartSolver,
+    "multi_vehicle": MultiVehicleSolver,
+}
+
+DEFAULT_TIME_BUDGET = 10.0
+BRUTE_FORCE_MAX_POINTS = 9
+HELD_KARP_MAX_POINTS = 20
+
+
+class SolverChoice:
+    """
+    Solver chosen for matrix with expected time of solution.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            expected_time: float,
+            reason: str,
+            options: dict | None = None
+        ) -> None:
+        """
+        Initialize choice.
+
+        Args:
+            name: name of solver from SOLVERS
+            expected_time: estimated time of solution in seconds
+            reason: human-readable explanation of choice
+            options: keyword arguments of solver constructor
+
+        """
+        self.name = name
+        self.expected_time = expected_time
+        self.reason = reason
+        self.options = {} if options is None else options
+
+    def create(self) -> TSPSolver:
+        """
+        Return new instance of chosen solver.
+        """
+        return SOLVERS[self.name](**self.options)
+
+    def to_dict(self) -> dict:
+        """
+        Return JSON-compatible representation of choice.
+        """
+        return {
+            "solver": self.name,
+            "expected_time": self.expected_time,
+            "reason": self.reason,
+        }
+
+
+def _brute_force_time(size: int, *, symmetric: bool) -> float:
+    """
+    Estimate time of brute force solution, mirror routes of symmetric matrix are skipped.
+    """
+    return 3e-8 * math.factorial(size - 1) / (2 if symmetric else 1)
+
+
+def _held_karp_time(size: int) -> float:
+    """
+    Estimate time of Held-Karp solution, it takes O(n^2 * 2^n) time for any matrix.
+    """
+    return 3e-9 * size * size * 2.0 ** size
+
+
+def _little_time(size: int, *, symmetric: bool) -> float:
+    """
+    Estimate time of Little's algorithm.
+
+    Search tree with reduction bound grows exponentially for symmetric
+    matrices, with assignment bound it grows slowly for asymmetric ones.
+    """
+    if symmetric:
+        return 0.03 * 1.75 ** (size - 15)
+    return 0.05 * (size / 20) ** 3.6
+
+
+def _heuristic_time(size: int, restarts: int = 1) -> float:
+    """
+    Estimate time of local search with given count of restarts.
+    """
+    return restarts * (2e-4 * size + 2.5e-7 * size * size)
+
+
+def choose_solver(
+        matrix: np.ndarray,
+        salesmen_count: int = 1,
+        time_limit: float | None = None
+    ) -> SolverChoice:
+    """
+    Choose solver for matrix of distances.
+
+    Args:
+        matrix: matrix of lengthes,
+            where matrix[i][j] is length of path from i-th control point to j-th
+            (-1 or np.inf if there is no path)
+        salesmen_count: count of salesmen, every extra salesman adds a vertex
+        time_limit: time budget of solution in seconds, DEFAULT_TIME_BUDGET if None
+
+    Returns:
+        the fastest exact solver whose expected time fits into budget,
+        heuristic solver if there is no such one
+        (multi-vehicle one for several salesmen)
+
+    """
+    budget = DEFAULT_TIME_BUDGET if time_limit is None else time_limit
+    points_count = matrix.shape[0]
+    size = points_count + min(salesmen_count, max(points_count - 1, 1)) - 1
+    distances = np.where(matrix == -1, np.inf, matrix)
+    np.fill_diagonal(distances, np.inf)
+    symmetric = bool(np.array_equal(distances, distances.T))
+    structure = "symmetric" if symmetric else "asymmetric"
+
+    if size <= BRUTE_FORCE_MAX_POINTS:
+        return SolverChoice(
+            "brute_force", _brute_force_time(size, symmetric=symmetric),
+            f"{size} points: every route can be enumerated",
+        )
+
+    expected_time = _held_karp_time(size)
+    if size <= HELD_KARP_MAX_POINTS and expected_time <= budget:
+        return SolverChoice(
+            "held_karp", expected_time,
+            f"{size} points: dynamic programming fits into {budget:g} s",
+        )
+
+    expected_time = _little_time(size, symmetric=symmetric)
+    if expected_time <= budget:
+        options = {} if symmetric else {"bound": assignment_bound}
+        bound = "reduction" if symmetric else "assignment"
+        return SolverChoice(
+            "little", expected_time,
+            f"{size} points, {structure} matrix: branch and bound with {bound} bound "
+            f"fits into {budget:g} s",
+            options,
+        )
+
+    if size > points_count:
+        return SolverChoice(
+            "multi_vehicle", _heuristic_time(points_count),
+            f"{size} points with copies of start point: exact solution does not fit into "
+            f"{budget:g} s, {points_count} points are split into routes of salesmen",
+        )
+
+    restarts = 32
+    expected_time = _heuristic_time(size, restarts)
+    if expected_time <= budget:
+        return SolverChoice(
+            "multi_start", expected_time,
+            f"{size} points, {structure} matrix: exact solution does not fit into "
+            f"{budget:g} s, {restarts} restarts of local search do",
+            {"restarts": restarts},
+        )
+
+    return SolverChoice(
+        "local_search", _heuristic_time(size),
+        f"{size} points: only single local search fits into {budget:g} s",
+    )
@@ -0,0 +1,64 @@
+"""Tests for common checks of TSP solvers."""
+import threading
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.abstract_solver import SolutionExceptionError
+from tsp_algorithms.local_search import LocalSearchSolver
+from tsp_algorithms.selection import SOLVERS
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("solver", list(SOLVERS))
+def test_unreachable_points_are_listed(solver: str) -> None:
+    """
+    Test that every solver lists every point outside of strongly connected component of start.
+    """
+    matrix = np.full((5, 5), np.inf)
+    matrix[0, 1] = matrix[1, 0] = 1
+    matrix[1, 2] = 1
+    matrix[3, 0] = 1
+    matrix[4, 4] = 1
+    with pytest.raises(SolutionExceptionError, match=r"unreachable: \[2, 3, 4\]"):
+        SOLVERS[solver]().solve(matrix, 0)
+
+@pytest.mark.fast
+@pytest.mark.parametrize("solver", list(SOLVERS))
+def test_cancel_event(solver: str) -> None:
+    """
+    Test that every solver stops search when cancel event is set as if limit is reached.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(12, 2))
+    matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    _, length = SOLVERS[solver]().solve(matrix.copy(), 0)
+
+    cancelled = SOLVERS[solver]()
+    event = threading.Event()
+    cancelled.set_cancel_event(event)
+    assert not cancelled.cancelled
+    event.set()
+    routes, cancelled_length = cancelled.solve(matrix.copy(), 0)
+    assert cancelled.cancelled
+    assert not routes or sorted(routes[0][:-1]) == list(range(12))
+    assert cancelled_length >= length - 1e-6
+    assert cancelled.gap > 0
+
+@pytest.mark.fast
+def test_long_single_cycle() -> None:
+    """
+    Test that check of input data works for graph deeper than recursion limit.
+    """
+    size = 1500
+    matrix = np.full((size, size), np.inf)
+    matrix[np.arange(size), (np.arange(size) + 1) % size] = 1
+    solver = LocalSearchSolver()
+    assert solver._find_unreachable_vertices(matrix, 0) == []  # noqa: SLF001
+    matrix[size - 1, 0] = np.inf
+    assert solver._find_unreachable_vertices(matrix, 0) == list(range(1, size))  # noqa: SLF001
+
+    matrix[size - 1, 0] = 1
+    routes, length = solver.solve(matrix, 0)
+    assert routes == [[*range(size), 0]]
+    assert length == size
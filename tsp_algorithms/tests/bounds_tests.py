@@ -0,0 +1,139 @@
+"""Tests for lower bounds of TSP."""
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.bounds import (
+    assignment_bound,
+    one_tree_bound,
+    reduction_bound,
+    select_bound,
+)
+from tsp_algorithms.held_karp import HeldKarpSolver
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+
+
+def _euclidean_matrix(rng: np.random.Generator, size: int) -> np.ndarray:
+    """
+    Build symmetric matrix of distances between random points.
+    """
+    points = rng.uniform(0, 100, size=(size, 2))
+    matrix = np.linalg.norm(points[:, None] - points[None, :], axis=2)
+    np.fill_diagonal(matrix, np.inf)
+    return matrix
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_bounds_do_not_exceed_optimum(symmetric: bool) -> None:  # noqa: FBT001
+    """
+    Test that every bound is not greater than length of the shortest route.
+    """
+    rng = np.random.default_rng(seed=42)
+    for size in (4, 7, 10):
+        if symmetric:
+            matrix = _euclidean_matrix(rng, size)
+        else:
+            matrix = rng.uniform(1, 100, size=(size, size))
+            np.fill_diagonal(matrix, np.inf)
+        _, optimal_length = HeldKarpSolver().solve(matrix.copy(), 0)
+        for bound in (reduction_bound, assignment_bound, one_tree_bound):
+            assert bound(matrix) <= optimal_length + 1e-7
+            assert bound(matrix, optimal_length) <= optimal_length + 1e-7
+
+
+@pytest.mark.fast
+def test_assignment_bound_is_the_cheapest_assignment() -> None:
+    """
+    Test Hungarian algorithm against enumeration of every assignment.
+    """
+    rng = np.random.default_rng(seed=42)
+    size = 6
+    for _ in range(5):
+        matrix = rng.uniform(1, 10, size=(size, size))
+        np.fill_diagonal(matrix, np.inf)
+        expected = min(
+            sum(matrix[i, permutation[i]] for i in range(size))
+            for permutation in itertools.permutations(range(size))
+        )
+        assert math.isclose(assignment_bound(matrix), expected)
+
+
+@pytest.mark.fast
+def test_one_tree_bound_is_tight_for_symmetric_matrix() -> None:
+    """
+    Test that 1-tree bound is much closer to optimum than reduction bound.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = _euclidean_matrix(rng, 12)
+    _, optimal_length = HeldKarpSolver().solve(matrix.copy(), 0)
+    assert one_tree_bound(matrix) >= 0.98 * optimal_length
+    assert one_tree_bound(matrix) > reduction_bound(matrix)
+
+
+@pytest.mark.fast
+def test_bounds_of_matrix_without_route() -> None:
+    """
+    Test that bounds are infinite when some vertex is not connected with others.
+    """
+    matrix = np.full((4, 4), 1.0)
+    np.fill_diagonal(matrix, np.inf)
+    matrix[2, :] = np.inf
+    assert reduction_bound(matrix) == np.inf
+    assert assignment_bound(matrix) == np.inf
+    matrix[:, 2] = np.inf
+    assert one_tree_bound(matrix) == np.inf
+
+
+@pytest.mark.fast
+def test_select_bound() -> None:
+    """
+    Test that bound is chosen by symmetry of matrix.
+    """
+    rng = np.random.default_rng(seed=42)
+    assert select_bound(_euclidean_matrix(rng, 5)) is one_tree_bound
+    assert select_bound(rng.uniform(1, 10, size=(5, 5))) is assignment_bound
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_little_with_bound(symmetric: bool) -> None:  # noqa: FBT001
+    """
+    Test that additional bound keeps optimal length and decreases count of expanded nodes.
+    """
+    rng = np.random.default_rng(seed=42)
+    size = 16
+    matrix = _euclidean_matrix(rng, size) if symmetric else rng.uniform(1, 100, size=(size, size))
+    reduction_solver = LittleAlgorithm()
+    _, expected_length = reduction_solver.solve(matrix.copy(), 0)
+    solver = LittleAlgorithm(bound=select_bound(matrix))
+    route, length = solver.solve(matrix.copy(), 0)
+    assert math.isclose(length, expected_length)
+    assert sorted(route[0][:-1]) == list(range(size))
+    assert solver.expanded_nodes < reduction_solver.expanded_nodes
+
+
+@pytest.mark.fast
+def test_little_with_bound_and_multiple_salesmen() -> None:
+    """
+    Test that additional bound keeps optimal length of routes of several salesmen.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(8, 8))
+    _, expected_length = LittleAlgorithm().solve(matrix.copy(), 0, 3)
+    _, length = LittleAlgorithm(bound=assignment_bound).solve(matrix.copy(), 0, 3)
+    assert math.isclose(length, expected_length)
+
+
+@pytest.mark.slow
+def test_parallel_little_with_bound() -> None:
+    """
+    Test that bound function is passed to worker processes.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(20, 20))
+    _, expected_length = LittleAlgorithm(bound=assignment_bound).solve(matrix.copy(), 0)
+    _, length = LittleAlgorithm(workers=2, bound=assignment_bound).solve(matrix.copy(), 0)
+    assert math.isclose(length, expected_length)
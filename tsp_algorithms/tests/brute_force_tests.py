@@ -1,5 +1,7 @@
 """Tests for brute force algorithm of TSP."""
+import itertools
 import json
+import math
 from pathlib import Path
 
 import numpy as np
@@ -38,3 +40,102 @@ def test_on_data_from_file(sample_solver: BruteForceSolver) -> None:
         else:
             _, length = sample_solver.solve(matrix, start)
             assert length == expected_length
+
+
+@pytest.mark.fast
+def test_node_limit(sample_solver: BruteForceSolver) -> None:
+    """
+    Test that solver with node limit returns valid route and lower bound.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(8, 8))
+    np.fill_diagonal(matrix, np.inf)
+
+    route, length = sample_solver.solve(matrix.copy(), 0, node_limit=10)
+    assert sorted(route[0][:-1]) == list(range(8))
+    assert sample_solver.lower_bound <= length
+    assert sample_solver.gap >= 0
+
+    _, optimal_length = sample_solver.solve(matrix.copy(), 0)
+    assert sample_solver.lower_bound == optimal_length
+    assert sample_solver.gap == 0
+    assert optimal_length <= length
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("matrix_size", "salesmen_count", "symmetric", "chunk_size"),
+    [
+        (5, 1, False, 6),
+        (8, 1, False, 3),
+        (8, 1, True, 3),
+        (7, 2, False, 2),
+        (7, 3, True, 4),
+        (9, 1, True, 6),
+    ]
+)
+def test_compare_to_exhaustive_enumeration(
+        matrix_size: int,
+        salesmen_count: int,
+        symmetric: bool,  # noqa: FBT001
+        chunk_size: int
+    ) -> None:
+    """
+    Test that pruned enumeration finds the same length as plain enumeration of permutations.
+    """
+    rng = np.random.default_rng(seed=42)
+    solver = BruteForceSolver(chunk_size)
+
+    for _ in range(3):
+        matrix = rng.uniform(1, 100, size=(matrix_size, matrix_size))
+        if symmetric:
+            matrix = (matrix + matrix.T) / 2
+        np.fill_diagonal(matrix, np.inf)
+        routes, length = solver.solve(matrix.copy(), 0, salesmen_count)
+
+        expanded = solver._transform_matrix_for_multiple_salesmen(  # noqa: SLF001
+            matrix, 0, salesmen_count
+        )
+        expected = min(
+            sum(expanded[a, b] for a, b in itertools.pairwise([0, *permutation, 0]))
+            for permutation in itertools.permutations(range(1, expanded.shape[0]))
+        )
+        assert math.isclose(length, expected, abs_tol=1e-5)
+
+        route_length = sum(
+            matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route))
+        )
+        assert math.isclose(length, route_length, abs_tol=1e-5)
+        assert len(routes) == salesmen_count
+
+@pytest.mark.fast
+def test_stats(sample_solver: BruteForceSolver) -> None:
+    """
+    Test that stats count evaluated permutations and prefixes of last solve.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(10, 10))
+    sample_solver.solve(matrix.copy(), 0)
+    stats = sample_solver.stats
+    assert 0 < stats.permutations <= math.factorial(9)
+    assert stats.nodes_created >= stats.nodes_expanded + stats.nodes_pruned
+    assert set(stats.phase_times) == {"initial_tour", "bound", "evaluation"}
+
+    sample_solver.solve(matrix.copy(), 0, node_limit=100)
+    assert sample_solver.stats.permutations <= 100 + math.factorial(6)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("salesmen_count", [1, 2])
+def test_initial_routes(sample_solver: BruteForceSolver, salesmen_count: int) -> None:
+    """
+    Test that initial routes do not change optimal length and broken routes are repaired.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(7, 7))
+    routes, length = sample_solver.solve(matrix.copy(), 0, salesmen_count)
+    for initial_routes in (routes, [[0, 3, 1, 0]], [[0, 9, 2, 0], []]):
+        _, warm_length = sample_solver.solve(
+            matrix.copy(), 0, salesmen_count, initial_routes=initial_routes
+        )
+        assert math.isclose(warm_length, length, abs_tol=1e-5)
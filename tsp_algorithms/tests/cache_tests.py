@@ -0,0 +1,106 @@
+"""Tests for cache of TSP solutions."""
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.cache import CachedSolution, CachedSolver, SolutionCache, solution_key
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+from tsp_algorithms.local_search import LocalSearchSolver
+
+
+@pytest.fixture
+def sample_matrix() -> np.ndarray:
+    """
+    Fixture for random asymmetric matrix of distances.
+    """
+    rng = np.random.default_rng(seed=42)
+    return rng.uniform(1, 100, size=(12, 12))
+
+@pytest.mark.fast
+def test_solution_key(sample_matrix: np.ndarray) -> None:
+    """
+    Test that fingerprint depends on every part of problem but not on diagonal and -1.
+    """
+    key = solution_key(sample_matrix, 0, 1, "little")
+    normalized = sample_matrix.copy()
+    np.fill_diagonal(normalized, np.inf)
+    assert solution_key(normalized, 0, 1, "little") == key
+    changed = sample_matrix.copy()
+    changed[1, 2] = -1
+    other = changed.copy()
+    other[1, 2] = np.inf
+    assert solution_key(changed, 0, 1, "little") == solution_key(other, 0, 1, "little")
+    assert solution_key(changed, 0, 1, "little") != key
+    assert solution_key(sample_matrix, 1, 1, "little") != key
+    assert solution_key(sample_matrix, 0, 2, "little") != key
+    assert solution_key(sample_matrix, 0, 1, "held_karp") != key
+
+@pytest.mark.fast
+def test_least_recently_used_eviction() -> None:
+    """
+    Test that the least recently used solution is evicted and shorter solution is kept.
+    """
+    cache = SolutionCache(max_entries=2)
+    for key in "abc":
+        if key == "c":
+            assert cache.get("a") is not None
+        cache.put(key, CachedSolution([[0, 1, 0]], 10.0, 5.0))
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+    cache.put("a", CachedSolution([[0, 2, 0]], 20.0, 8.0))
+    solution = cache.get("a")
+    assert (solution.routes, solution.length, solution.lower_bound) == ([[0, 1, 0]], 10.0, 8.0)
+
+@pytest.mark.fast
+def test_cached_solver(sample_matrix: np.ndarray) -> None:
+    """
+    Test that the same problem is solved once and result is equal to solution.
+    """
+    cache = SolutionCache()
+    solver = CachedSolver(LittleAlgorithm(), cache, "little")
+    routes, length = solver.solve(sample_matrix.copy(), 0, 2)
+    assert not solver.from_cache
+    cached_routes, cached_length = solver.solve(sample_matrix.copy(), 0, 2)
+    assert solver.from_cache
+    assert (cached_routes, cached_length) == (routes, length)
+    assert solver.gap == 0
+    cached_routes[0].append(5)
+    assert solver.solve(sample_matrix.copy(), 0, 2)[0] == routes
+
+    solver.solve(sample_matrix.copy(), 0, 3)
+    assert not solver.from_cache
+    assert (cache.hits, cache.misses) == (2, 2)
+
+@pytest.mark.fast
+def test_interrupted_search_is_not_cached(sample_matrix: np.ndarray) -> None:
+    """
+    Test that result of limited search is cached only if it is proven optimal.
+    """
+    cache = SolutionCache()
+    solver = CachedSolver(LocalSearchSolver(), cache)
+    solver.solve(sample_matrix.copy(), 0, time_limit=10)
+    assert len(cache) == 0
+    solver = CachedSolver(LittleAlgorithm(), cache)
+    solver.solve(sample_matrix.copy(), 0, time_limit=10)
+    assert len(cache) == 1
+
+@pytest.mark.fast
+def test_disk_tier(sample_matrix: np.ndarray, tmp_path: Path) -> None:
+    """
+    Test that solutions are read from directory by new cache.
+    """
+    _, length = CachedSolver(LittleAlgorithm(), SolutionCache(directory=tmp_path)).solve(
+        sample_matrix.copy(), 0
+    )
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    cache = SolutionCache(max_entries=1, directory=tmp_path)
+    assert cache.get("broken") is None
+    solver = CachedSolver(LittleAlgorithm(), cache)
+    assert math.isclose(solver.solve(sample_matrix.copy(), 0)[1], length)
+    assert solver.from_cache
+    cache.clear()
+    assert not list(tmp_path.glob("*.json"))
@@ -0,0 +1,143 @@
+"""Tests for Held-Karp algorithm of TSP."""
+import json
+import math
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.abstract_solver import SolutionExceptionError
+from tsp_algorithms.brute_force import BruteForceSolver
+from tsp_algorithms.held_karp import HeldKarpSolver
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+
+
+@pytest.fixture
+def sample_solver() -> HeldKarpSolver:
+    """
+    Fixture for Held-Karp solver.
+    """
+    return HeldKarpSolver()
+
+@pytest.mark.fast
+def test_on_data_from_file(sample_solver: HeldKarpSolver) -> None:
+    """
+    Tests for Held-Karp algorithm taken from file.
+    """
+    test_data = {}
+    with Path("tsp_algorithms/cases.json").open() as f:
+        test_data = json.load(f)
+
+    for data in test_data.values():
+
+        matrix = np.array(data["matrix"], dtype=float)
+        matrix = np.where(matrix == -1, np.inf, matrix)
+        start = data["start"]
+        expected_length = data["expected_length"]
+
+        if expected_length == -1:
+            with pytest.raises(SolutionExceptionError):
+                sample_solver.solve(matrix, start)
+        else:
+            _, length = sample_solver.solve(matrix, start)
+            assert length == expected_length
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("matrix_size", "salesmen_count", "start_vertex"),
+    [
+        (4, 1, 0),
+        (6, 1, 3),
+        (7, 1, 0),
+        (5, 2, 1),
+        (6, 3, 0),
+    ]
+)
+def test_compare_to_brute_force(
+        matrix_size: int,
+        salesmen_count: int,
+        start_vertex: int,
+        sample_solver: HeldKarpSolver
+    ) -> None:
+    """
+    Test that Held-Karp algorithm finds optimal route and its length is correct.
+
+    Considered that brute force algorithm is correct.
+    """
+    rng = np.random.default_rng(seed=42)
+
+    for _ in range(5):
+        matrix = rng.uniform(1, 100, size=(matrix_size, matrix_size))
+        np.fill_diagonal(matrix, np.inf)
+        routes, length = sample_solver.solve(matrix.copy(), start_vertex, salesmen_count)
+        _, length_brute = BruteForceSolver().solve(matrix.copy(), start_vertex, salesmen_count)
+        assert math.isclose(length, length_brute, abs_tol=1e-5)
+
+        route_length = sum(
+            matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route))
+        )
+        assert math.isclose(length, route_length, abs_tol=1e-5)
+        visited = sorted(vertex for route in routes for vertex in route[1:-1])
+        assert visited == [i for i in range(matrix_size) if i != start_vertex]
+
+@pytest.mark.fast
+def test_compare_to_little_algorithm(sample_solver: HeldKarpSolver) -> None:
+    """
+    Test that Held-Karp and Little's algorithms find routes of the same length.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(14, 14))
+    np.fill_diagonal(matrix, np.inf)
+    _, length = sample_solver.solve(matrix.copy(), 0)
+    _, length_little = LittleAlgorithm().solve(matrix.copy(), 0)
+    assert math.isclose(length, length_little, abs_tol=1e-5)
+    assert sample_solver.gap == 0
+
+@pytest.mark.fast
+def test_size_limit() -> None:
+    """
+    Test that solver refuses matrices larger than maximum size.
+    """
+    matrix = np.ones((6, 6))
+    with pytest.raises(ValueError, match="at most 5 points"):
+        HeldKarpSolver(max_points=5).solve(matrix.copy(), 0)
+    with pytest.raises(ValueError, match="at most 6 points"):
+        HeldKarpSolver(max_points=6).solve(matrix.copy(), 0, 2)
+
+@pytest.mark.fast
+def test_node_limit(sample_solver: HeldKarpSolver) -> None:
+    """
+    Test that exhausted limit gives no route and lower bound of its length.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(10, 10))
+    np.fill_diagonal(matrix, np.inf)
+    assert sample_solver.solve(matrix.copy(), 0, node_limit=10) == ([], np.inf)
+    assert 0 < sample_solver.lower_bound < np.inf
+
+@pytest.mark.fast
+def test_node_limit_with_initial_routes(sample_solver: HeldKarpSolver) -> None:
+    """
+    Test that exhausted limit gives initial routes completed by missing points.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(10, 10))
+    np.fill_diagonal(matrix, np.inf)
+    routes, length = sample_solver.solve(
+        matrix.copy(), 0, 2, node_limit=10, initial_routes=[[0, 1, 2, 0], [0, 3, 4, 12, 0]]
+    )
+    assert len(routes) == 2
+    assert sorted(vertex for route in routes for vertex in route[1:-1]) == list(range(1, 10))
+    assert sample_solver.lower_bound <= length < np.inf
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [3, 6])
+def test_star_graph_without_cycle(sample_solver: HeldKarpSolver, size: int) -> None:
+    """
+    Test that strongly connected graph without route through every vertex is reported.
+    """
+    matrix = np.full((size, size), -1.0)
+    matrix[0, :] = matrix[:, 0] = 1.0
+    with pytest.raises(SolutionExceptionError):
+        sample_solver.solve(matrix, 0)
@@ -0,0 +1,123 @@
+"""Tests for TSP heuristics."""
+import math
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.brute_force import BruteForceSolver
+from tsp_algorithms.heuristics import (
+    finite_matrix,
+    initial_tour,
+    nearest_neighbour_tour,
+    repair_tour,
+    tour_length,
+    two_opt,
+)
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(("matrix_size", "start_vertex"), [(1, 0), (5, 0), (8, 3), (30, 7)])
+def test_tours_are_permutations(matrix_size: int, start_vertex: int) -> None:
+    """
+    Test that heuristic tours visit every vertex once and start in start vertex.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(matrix_size, matrix_size))
+    np.fill_diagonal(matrix, np.inf)
+
+    for tour in (nearest_neighbour_tour(matrix, start_vertex), initial_tour(matrix, start_vertex)[0]):
+        assert tour[0] == start_vertex
+        assert sorted(tour) == list(range(matrix_size))
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("symmetric", [False, True])
+def test_two_opt_does_not_worsen_tour(symmetric: bool) -> None:  # noqa: FBT001
+    """
+    Test that 2-opt gives tour not longer than initial one.
+    """
+    rng = np.random.default_rng(seed=42)
+    for _ in range(10):
+        matrix = rng.uniform(1, 100, size=(20, 20))
+        if symmetric:
+            matrix = matrix + matrix.T
+        tour = list(rng.permutation(20))
+        improved = two_opt(matrix, tour)
+        assert sorted(improved) == list(range(20))
+        assert improved[0] == tour[0]
+        assert tour_length(matrix, improved) <= tour_length(matrix, tour) + 1e-9
+
+
+@pytest.mark.fast
+def test_initial_tour_is_not_shorter_than_optimal() -> None:
+    """
+    Test that length of heuristic tour is correct upper bound.
+    """
+    rng = np.random.default_rng(seed=42)
+    for _ in range(5):
+        matrix = rng.uniform(1, 100, size=(7, 7))
+        np.fill_diagonal(matrix, np.inf)
+        tour, length = initial_tour(matrix, 0)
+        _, optimal_length = BruteForceSolver().solve(matrix.copy(), 0)
+        assert math.isclose(length, tour_length(matrix, tour))
+        assert length >= optimal_length - 1e-9
+
+
+@pytest.mark.fast
+def test_finite_matrix() -> None:
+    """
+    Test that missing paths are replaced by distance greater than any tour.
+    """
+    matrix = np.array([[np.inf, 1.0, 5.0], [2.0, np.inf, np.inf], [3.0, 4.0, np.inf]])
+    finite = finite_matrix(matrix)
+    assert np.isfinite(finite).all()
+    assert finite[1, 2] > 3 * 5.0
+
+
+@pytest.mark.fast
+def test_repair_tour() -> None:
+    """
+    Test that missing and repeated vertices are skipped and new ones are inserted cheaply.
+    """
+    points = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [2.0, 1.0], [1.0, 1.0], [0.0, 1.0]])
+    matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    tour = repair_tour(matrix, [1, 2, 7, 3, 1, 5], 0)
+    assert tour == [0, 1, 2, 3, 4, 5]
+
+
+@pytest.mark.fast
+def test_initial_upper_bound_in_little_algorithm() -> None:
+    """
+    Test that initial tour does not change optimal length and reduces frontier.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(14, 2))
+    matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis, :]) ** 2).sum(axis=2))
+
+    seeded = LittleAlgorithm()
+    plain = LittleAlgorithm(use_initial_tour=False)
+    _, seeded_length = seeded.solve(matrix.copy(), 0)
+    _, plain_length = plain.solve(matrix.copy(), 0)
+
+    assert math.isclose(seeded_length, plain_length, abs_tol=1e-5)
+    assert seeded.initial_upper_bound >= seeded_length - 1e-9
+    assert plain.initial_upper_bound == np.inf
+    assert seeded.peak_frontier_size <= plain.peak_frontier_size
+
+
+@pytest.mark.fast
+def test_initial_routes_in_little_algorithm() -> None:
+    """
+    Test that shorter initial routes become initial upper bound and do not change result.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(14, 2))
+    matrix = np.sqrt(((points[:, np.newaxis] - points[np.newaxis, :]) ** 2).sum(axis=2))
+
+    routes, length = LittleAlgorithm().solve(matrix.copy(), 0, 2)
+    hinted = LittleAlgorithm(use_initial_tour=False)
+    hinted_routes, hinted_length = hinted.solve(matrix.copy(), 0, 2, initial_routes=routes)
+    assert math.isclose(hinted.initial_upper_bound, length)
+    assert math.isclose(hinted_length, length, abs_tol=1e-5)
+    assert len(hinted_routes) == 2
@@ -1,6 +1,7 @@
 """Tests for Little's algorithm."""
 import json
 import math
+import threading
 from pathlib import Path
 
 import numpy as np
@@ -8,7 +9,7 @@ import pytest
 
 from tsp_algorithms.abstract_solver import SolutionExceptionError
 from tsp_algorithms.brute_force import BruteForceSolver
-from tsp_algorithms.little_algorithm import LittleAlgorithm
+from tsp_algorithms.little_algorithm import LittleAlgorithm, ReducedMatrix
 
 
 @pytest.fixture
@@ -145,3 +146,270 @@ def test_on_data_from_file(sample_solver_little: LittleAlgorithm) -> None:
         else:
             _, length = sample_solver_little.solve(matrix, start)
             assert length == expected_length
+
+@pytest.mark.fast
+@pytest.mark.parametrize("cached_matrices", [0, 1, 4])
+def test_small_matrix_cache(cached_matrices: int, sample_solver_little: LittleAlgorithm) -> None:
+    """
+    Test that rebuilding of node matrices gives the same result and bounded memory.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix_size = 9
+    matrix_bytes = (matrix_size * matrix_size + 8 * matrix_size) * np.dtype(np.intp).itemsize
+    solver = LittleAlgorithm(cached_matrices * matrix_bytes)
+
+    for _ in range(5):
+        matrix = rng.uniform(1, 100, size=(matrix_size, matrix_size))
+        _, length = solver.solve(matrix.copy(), 0)
+        _, expected_length = sample_solver_little.solve(matrix.copy(), 0)
+        assert math.isclose(length, expected_length, abs_tol=1e-5)
+
+        assert solver.peak_matrix_bytes <= (cached_matrices + 3) * matrix_bytes
+        assert solver.peak_frontier_size >= 1
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("node_limit", [1, 10, 100])
+def test_node_limit(node_limit: int) -> None:
+    """
+    Test that interrupted search returns valid route and its lower bound.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(25, 25))
+    np.fill_diagonal(matrix, np.inf)
+
+    solver = LittleAlgorithm()
+    route, length = solver.solve(matrix.copy(), 0, node_limit=node_limit)
+    assert sorted(route[0][:-1]) == list(range(25))
+    assert solver.lower_bound <= length
+    assert solver.expanded_nodes <= node_limit
+
+    _, optimal_length = LittleAlgorithm().solve(matrix.copy(), 0)
+    assert solver.lower_bound <= optimal_length <= length
+
+
+@pytest.mark.fast
+def test_zero_time_limit() -> None:
+    """
+    Test that solver without time for search returns initial tour.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(15, 15))
+    np.fill_diagonal(matrix, np.inf)
+
+    solver = LittleAlgorithm()
+    route, length = solver.solve(matrix.copy(), 0, time_limit=0)
+    assert sorted(route[0][:-1]) == list(range(15))
+    assert length == solver.initial_upper_bound
+
+    no_tour_solver = LittleAlgorithm(use_initial_tour=False)
+    assert no_tour_solver.solve(matrix.copy(), 0, time_limit=0) == ([], np.inf)
+
+
+@pytest.mark.fast
+def test_unlimited_search_is_optimal() -> None:
+    """
+    Test that search without limits proves optimality of route.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(10, 10))
+    np.fill_diagonal(matrix, np.inf)
+
+    solver = LittleAlgorithm()
+    _, length = solver.solve(matrix, 0)
+    assert solver.lower_bound == length
+    assert solver.gap == 0
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(("matrix_size", "salesmen_count"), [(12, 1), (16, 1), (10, 3)])
+def test_parallel_search(matrix_size: int, salesmen_count: int) -> None:
+    """
+    Test that parallel search finds optimal length of serial search.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(matrix_size, 2))
+    matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+
+    _, length = LittleAlgorithm().solve(matrix.copy(), 0, salesmen_count)
+    solver = LittleAlgorithm(workers=2)
+    routes, parallel_length = solver.solve(matrix.copy(), 0, salesmen_count)
+    assert math.isclose(length, parallel_length, abs_tol=1e-5)
+    assert solver.lower_bound == parallel_length
+    route_length = sum(
+        matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route))
+    )
+    assert math.isclose(parallel_length, route_length, abs_tol=1e-5)
+
+
+@pytest.mark.fast
+def test_parallel_search_with_node_limit() -> None:
+    """
+    Test that interrupted parallel search returns valid route and its lower bound.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(18, 2))
+    matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+
+    solver = LittleAlgorithm(workers=2)
+    route, length = solver.solve(matrix.copy(), 0, node_limit=20)
+    assert sorted(route[0][:-1]) == list(range(18))
+    _, optimal_length = LittleAlgorithm().solve(matrix.copy(), 0)
+    assert solver.lower_bound <= optimal_length <= length
+
+
+@pytest.mark.fast
+def test_parallel_search_limits_are_shared() -> None:
+    """
+    Test that time and node limits hold for whole parallel search, not for every subtree.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(40, 2))
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    matrix = distances * rng.uniform(1, 1.5, size=distances.shape)
+
+    solver = LittleAlgorithm(workers=2)
+    routes, _ = solver.solve(matrix.copy(), 0, node_limit=200)
+    assert routes
+    assert solver.expanded_nodes <= 200
+
+    routes, length = solver.solve(matrix.copy(), 0, time_limit=0.05)
+    assert sorted(routes[0][:-1]) == list(range(40))
+    assert solver.gap > 0
+    assert solver.lower_bound <= length
+
+
+@pytest.mark.fast
+def test_parallel_search_is_cancelled() -> None:
+    """
+    Test that cancel event set during parallel search stops subtree searches in workers.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(40, 2))
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    matrix = distances * rng.uniform(1, 1.5, size=distances.shape)
+
+    solver = LittleAlgorithm(workers=2)
+    event = threading.Event()
+    solver.set_cancel_event(event)
+    timer = threading.Timer(0.2, event.set)
+    timer.start()
+    try:
+        routes, length = solver.solve(matrix.copy(), 0)
+    finally:
+        timer.cancel()
+    assert solver.cancelled
+    assert sorted(routes[0][:-1]) == list(range(40))
+    assert solver.gap > 0
+    assert solver.lower_bound <= length
+
+
+@pytest.mark.fast
+def test_fragments_of_reduced_matrix() -> None:
+    """
+    Test that included edges are joined into fragments and closing edge is forbidden.
+    """
+    size = 5
+    vertices = np.arange(size)
+    matrix = ReducedMatrix(np.ones((size, size)), vertices, vertices, size)
+    matrix = matrix.without(1, 2)
+    matrix = matrix.without(3, 4)
+    matrix = matrix.without(2, 3)
+    assert matrix.closing_edge(1) == (4, 1)
+    assert matrix.heads[4] == 1
+    assert matrix.closing_edge(0) == (0, 0)
+
+
+@pytest.mark.fast
+def test_positive_minima_of_reduced_matrix() -> None:
+    """
+    Test that incremental update of the least positive values equals their full computation.
+    """
+    rng = np.random.default_rng(seed=42)
+    size = 6
+    vertices = np.arange(size)
+    values = rng.integers(0, 4, size=(size, size)).astype(float)
+    matrix = ReducedMatrix(values, vertices, vertices, size)
+    matrix.positive_minima()
+    old_row = values[2].copy()
+    old_col = values[:, 3].copy()
+    values[2, 3] = np.inf
+    values[2] -= np.min(values[2])
+    values[:, 3] -= np.min(values[:, 3])
+    matrix.update_positive_minima(2, 3, old_row, old_col)
+    row_minima, col_minima = matrix.positive_minima()
+    positive = np.where(values > 0, values, np.inf)
+    assert np.array_equal(row_minima, np.min(positive, axis=1))
+    assert np.array_equal(col_minima, np.min(positive, axis=0))
+
+
+@pytest.mark.fast
+def test_node_without_finite_edges_is_pruned(sample_solver_bruteforce: BruteForceSolver) -> None:
+    """
+    Test that node whose reduced matrix has no finite edge is pruned.
+    """
+    rng = np.random.default_rng(seed=42)
+    for _ in range(5):
+        points = rng.uniform(0, 100, size=(11, 2))
+        matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+        _, length = LittleAlgorithm().solve(matrix.copy(), 0, 3)
+        _, expected_length = sample_solver_bruteforce.solve(matrix.copy(), 0, 3)
+        assert math.isclose(length, expected_length, abs_tol=1e-5)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("workers", [1, 2])
+def test_stats(workers: int) -> None:
+    """
+    Test that stats count nodes of whole search tree and time of its phases.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(14, 2))
+    matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+
+    solver = LittleAlgorithm(workers=workers)
+    solver.solve(matrix.copy(), 0)
+    stats = solver.stats
+    assert stats.nodes_expanded == solver.expanded_nodes > 0
+    assert stats.nodes_pruned == solver.pruned_nodes
+    assert stats.nodes_created == 1 + 2 * stats.nodes_expanded
+    assert stats.peak_frontier_size == solver.peak_frontier_size
+    assert stats.peak_matrix_bytes == solver.peak_matrix_bytes
+    assert {"reduction", "penalty", "subtour"} <= set(stats.phase_times)
+    assert stats.to_dict()["nodes_expanded"] == stats.nodes_expanded
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(("workers", "salesmen_count"), [(1, 1), (1, 3), (2, 1)])
+def test_float32_matrix(workers: int, salesmen_count: int) -> None:
+    """
+    Test that float32 matrix is kept in nodes and its route is as short as route of float64 one.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(14, 2))
+    matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+
+    solver = LittleAlgorithm(workers=workers)
+    _, length = solver.solve(matrix.copy(), 0, salesmen_count)
+    compact_solver = LittleAlgorithm(workers=workers)
+    routes, compact_length = compact_solver.solve(matrix.astype(np.float32), 0, salesmen_count)
+    assert isinstance(compact_length, float)
+    assert math.isclose(compact_length, length, rel_tol=1e-5)
+    assert compact_solver.lower_bound <= compact_length
+    route_length = sum(matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route)))
+    assert math.isclose(route_length, length, rel_tol=1e-5)
+    assert compact_solver.stats.peak_matrix_bytes < solver.stats.peak_matrix_bytes
+
+
+@pytest.mark.fast
+def test_integer_matrix(sample_solver_bruteforce: BruteForceSolver) -> None:
+    """
+    Test that integer matrix with -1 instead of missing paths is solved as float one.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.integers(1, 1000, size=(8, 8))
+    matrix[rng.uniform(size=matrix.shape) < 0.2] = -1
+    routes, length = LittleAlgorithm().solve(matrix.copy(), 0)
+    _, expected_length = sample_solver_bruteforce.solve(matrix.astype(np.float64), 0)
+    assert length == expected_length
+    assert all(matrix[route[i - 1], route[i]] > 0 for route in routes for i in range(1, len(route)))
@@ -0,0 +1,132 @@
+"""Tests for local search algorithm of TSP."""
+import math
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.abstract_solver import SolutionExceptionError
+from tsp_algorithms.held_karp import HeldKarpSolver
+from tsp_algorithms.heuristics import nearest_neighbour_tour, tour_length
+from tsp_algorithms.local_search import LocalSearchSolver
+
+
+def euclidean_matrix(points_count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Build matrix of distances between random points of plane.
+    """
+    points = rng.uniform(0, 1000, size=(points_count, 2))
+    return np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+
+
+@pytest.fixture
+def sample_solver() -> LocalSearchSolver:
+    """
+    Fixture for local search solver.
+    """
+    return LocalSearchSolver()
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("matrix_size", "salesmen_count", "symmetric"),
+    [
+        (2, 1, True),
+        (4, 1, True),
+        (5, 2, False),
+        (30, 1, True),
+        (30, 1, False),
+        (40, 3, True),
+        (40, 4, False),
+    ]
+)
+def test_routes_visit_every_point(
+        matrix_size: int,
+        salesmen_count: int,
+        symmetric: bool,  # noqa: FBT001
+        sample_solver: LocalSearchSolver
+    ) -> None:
+    """
+    Test that every point is visited once and length of routes is correct.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(matrix_size, matrix_size))
+    if symmetric:
+        matrix = (matrix + matrix.T) / 2
+    np.fill_diagonal(matrix, np.inf)
+
+    routes, length = sample_solver.solve(matrix.copy(), 0, salesmen_count)
+    assert len(routes) == salesmen_count
+    visited = sorted(vertex for route in routes for vertex in route[1:-1])
+    assert visited == list(range(1, matrix_size))
+    route_length = sum(
+        matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route))
+    )
+    assert math.isclose(length, route_length, abs_tol=1e-5)
+    assert sample_solver.lower_bound <= length
+
+@pytest.mark.fast
+def test_close_to_optimal(sample_solver: LocalSearchSolver) -> None:
+    """
+    Test that routes between points of plane are close to optimal ones.
+    """
+    rng = np.random.default_rng(seed=42)
+    for _ in range(5):
+        matrix = euclidean_matrix(12, rng)
+        _, length = sample_solver.solve(matrix.copy(), 0)
+        _, optimal_length = HeldKarpSolver().solve(matrix.copy(), 0)
+        assert optimal_length - 1e-5 <= length <= 1.05 * optimal_length
+
+@pytest.mark.fast
+def test_improves_nearest_neighbour_tour(sample_solver: LocalSearchSolver) -> None:
+    """
+    Test that local search shortens nearest neighbour tour of many points.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = euclidean_matrix(300, rng)
+    _, length = sample_solver.solve(matrix.copy(), 0)
+    nearest_neighbour_length = tour_length(matrix, nearest_neighbour_tour(matrix, 0))
+    assert length < 0.95 * nearest_neighbour_length
+    assert sample_solver.improving_moves > 0
+
+@pytest.mark.fast
+def test_node_limit(sample_solver: LocalSearchSolver) -> None:
+    """
+    Test that limited search returns valid route not shorter than unlimited one.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = euclidean_matrix(100, rng)
+    routes, length = sample_solver.solve(matrix.copy(), 0, node_limit=0)
+    assert sample_solver.improving_moves == 0
+    assert sorted(routes[0][:-1]) == list(range(100))
+    _, improved_length = sample_solver.solve(matrix.copy(), 0)
+    assert improved_length < length
+
+@pytest.mark.fast
+def test_unreachable_points(sample_solver: LocalSearchSolver) -> None:
+    """
+    Test that solver reports unreachable points.
+    """
+    matrix = np.array([
+        [np.inf, 1, np.inf],
+        [1, np.inf, np.inf],
+        [np.inf, np.inf, np.inf],
+    ])
+    with pytest.raises(SolutionExceptionError):
+        sample_solver.solve(matrix, 0)
+
+@pytest.mark.fast
+@pytest.mark.parametrize("salesmen_count", [1, 3])
+def test_initial_routes(sample_solver: LocalSearchSolver, salesmen_count: int) -> None:
+    """
+    Test that search starts from previous routes after new point is added.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = euclidean_matrix(200, rng)
+    previous_routes, _ = sample_solver.solve(matrix[:-1, :-1].copy(), 0, salesmen_count)
+    moves = sample_solver.improving_moves
+    routes, length = sample_solver.solve(
+        matrix.copy(), 0, salesmen_count, initial_routes=previous_routes
+    )
+    assert sample_solver.improving_moves < moves / 10
+    assert len(routes) == salesmen_count
+    assert sorted(vertex for route in routes for vertex in route[1:-1]) == list(range(1, 200))
+    assert math.isclose(length, sum(tour_length(matrix, route[:-1]) for route in routes))
@@ -0,0 +1,109 @@
+"""Tests for parallel multi-start algorithm of TSP."""
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+from tsp_algorithms.local_search import LocalSearchSolver
+from tsp_algorithms.multi_start import MultiStartSolver
+
+
+@pytest.fixture
+def sample_matrix() -> np.ndarray:
+    """
+    Fixture for asymmetric matrix of distances between random points of plane.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(40, 2))
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    return distances * rng.uniform(1, 1.5, size=distances.shape)
+
+@pytest.mark.fast
+@pytest.mark.parametrize("salesmen_count", [1, 3])
+def test_routes_visit_every_point(sample_matrix: np.ndarray, salesmen_count: int) -> None:
+    """
+    Test that every point is visited once and length of routes is correct.
+    """
+    routes, length = MultiStartSolver(restarts=4).solve(sample_matrix.copy(), 5, salesmen_count)
+    assert len(routes) == salesmen_count
+    visited = sorted(vertex for route in routes for vertex in route[1:-1])
+    assert visited == [i for i in range(40) if i != 5]
+    route_length = sum(
+        sample_matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route))
+    )
+    assert math.isclose(length, route_length, abs_tol=1e-5)
+
+@pytest.mark.fast
+def test_result_depends_only_on_seed(sample_matrix: np.ndarray) -> None:
+    """
+    Test that serial and parallel searches with the same seed give the same result.
+    """
+    serial = MultiStartSolver(workers=1, restarts=6, seed=7)
+    parallel = MultiStartSolver(workers=2, restarts=6, seed=7)
+    assert serial.solve(sample_matrix.copy(), 0) == parallel.solve(sample_matrix.copy(), 0)
+    assert serial.finished_restarts == parallel.finished_restarts
+
+@pytest.mark.fast
+def test_stop_conditions(sample_matrix: np.ndarray) -> None:
+    """
+    Test that search stops by count of restarts, stagnation and time.
+    """
+    solver = MultiStartSolver(restarts=100, stagnation=100)
+    solver.solve(sample_matrix.copy(), 0, node_limit=3)
+    assert solver.finished_restarts == 3
+
+    solver = MultiStartSolver(restarts=100, stagnation=2)
+    solver.solve(sample_matrix.copy(), 0)
+    assert solver.finished_restarts < 100
+
+    solver = MultiStartSolver(restarts=100, stagnation=100)
+    routes, _ = solver.solve(sample_matrix.copy(), 0, time_limit=0)
+    assert solver.finished_restarts == 1
+    assert routes
+
+@pytest.mark.fast
+def test_close_to_optimal() -> None:
+    """
+    Test that restarts find optimal routes of small problems.
+    """
+    rng = np.random.default_rng(seed=42)
+    for _ in range(5):
+        matrix = rng.uniform(1, 100, size=(9, 9))
+        np.fill_diagonal(matrix, np.inf)
+        _, length = MultiStartSolver(restarts=8).solve(matrix.copy(), 0)
+        _, optimal_length = LittleAlgorithm().solve(matrix.copy(), 0)
+        assert math.isclose(length, optimal_length, abs_tol=1e-5)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("workers", [1, 2])
+def test_float32_matrix(sample_matrix: np.ndarray, workers: int) -> None:
+    """
+    Test that float32 matrix is shared with workers and gives route as short as float64 one.
+
+    Rounded distances may lead local search to other local optimum,
+    so lengths are compared with tolerance of heuristic.
+    """
+    _, length = MultiStartSolver(restarts=4).solve(sample_matrix.copy(), 0)
+    compact = sample_matrix.astype(np.float32)
+    routes, compact_length = MultiStartSolver(workers=workers, restarts=4).solve(compact.copy(), 0)
+    assert len(routes) == 1
+    assert sorted(routes[0][1:]) == list(range(sample_matrix.shape[0]))
+    route_length = sum(float(compact[a, b]) for a, b in itertools.pairwise(routes[0]))
+    assert math.isclose(compact_length, route_length, rel_tol=1e-9)
+    assert math.isclose(compact_length, length, rel_tol=0.05)
+
+
+@pytest.mark.fast
+def test_symmetric_matrix_restarts() -> None:
+    """
+    Test that restarts of symmetric matrix are not worse than single local search.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(200, 2))
+    matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    _, length = MultiStartSolver(restarts=8).solve(matrix.copy(), 0)
+    _, local_search_length = LocalSearchSolver().solve(matrix.copy(), 0)
+    assert length < local_search_length
@@ -0,0 +1,121 @@
+"""Tests for multi-vehicle algorithm of TSP."""
+import itertools
+import math
+import time
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.heuristics import tour_length
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+from tsp_algorithms.multi_vehicle import MultiVehicleSolver
+
+
+@pytest.fixture
+def sample_matrix() -> np.ndarray:
+    """
+    Fixture for asymmetric matrix of distances between random points of plane.
+    """
+    rng = np.random.default_rng(seed=42)
+    points = rng.uniform(0, 1000, size=(300, 2))
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    return distances * rng.uniform(1, 1.5, size=distances.shape)
+
+
+def _check_routes(matrix: np.ndarray, routes: list[list[int]], length: float, start: int) -> None:
+    """
+    Check that every point is visited once and length of routes is correct.
+    """
+    assert all(route[0] == route[-1] == start and len(route) > 2 for route in routes)
+    visited = sorted(vertex for route in routes for vertex in route[1:-1])
+    assert visited == [i for i in range(matrix.shape[0]) if i != start]
+    route_length = sum(
+        matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route))
+    )
+    assert math.isclose(length, route_length, abs_tol=1e-5)
+
+@pytest.mark.fast
+@pytest.mark.parametrize("salesmen_count", [1, 3, 12])
+def test_routes_visit_every_point(sample_matrix: np.ndarray, salesmen_count: int) -> None:
+    """
+    Test that every salesman gets non-empty route and every point is visited once.
+    """
+    solver = MultiVehicleSolver()
+    started = time.perf_counter()
+    routes, length = solver.solve(sample_matrix.copy(), 5, salesmen_count)
+    assert time.perf_counter() - started < 5
+    assert len(routes) == salesmen_count
+    _check_routes(sample_matrix, routes, length, 5)
+    assert solver.lower_bound <= length
+
+@pytest.mark.fast
+def test_too_many_salesmen() -> None:
+    """
+    Test that every point gets its own salesman if there are more salesmen than points.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(5, 5))
+    routes, length = MultiVehicleSolver().solve(matrix.copy(), 2, 10)
+    assert len(routes) == 4
+    _check_routes(matrix, routes, length, 2)
+
+@pytest.mark.fast
+def test_optimal_split() -> None:
+    """
+    Test that split of tour is the best split into consecutive non-empty routes.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(10, 10))
+    tour = list(range(1, 10))
+    for routes_count in range(1, 6):
+        routes = MultiVehicleSolver._split(matrix, 0, tour, routes_count)  # noqa: SLF001
+        assert len(routes) == routes_count
+        assert [vertex for route in routes for vertex in route] == tour
+        best = min(
+            sum(
+                tour_length(matrix, [0, *tour[first:last]])
+                for first, last in itertools.pairwise((0, *cuts, len(tour)))
+            )
+            for cuts in itertools.combinations(range(1, len(tour)), routes_count - 1)
+        )
+        length = sum(tour_length(matrix, [0, *route]) for route in routes)
+        assert math.isclose(length, best)
+
+@pytest.mark.fast
+@pytest.mark.parametrize("symmetric", [True, False])
+def test_close_to_optimal(symmetric: bool) -> None:  # noqa: FBT001
+    """
+    Test that routes of small problems are close to optimal ones.
+    """
+    rng = np.random.default_rng(seed=42)
+    for _ in range(5):
+        points = rng.uniform(0, 100, size=(11, 2))
+        matrix = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+        if not symmetric:
+            matrix *= rng.uniform(1, 1.5, size=matrix.shape)
+        _, length = MultiVehicleSolver().solve(matrix.copy(), 0, 3)
+        _, optimal_length = LittleAlgorithm().solve(matrix.copy(), 0, 3)
+        assert length <= 1.05 * optimal_length
+
+@pytest.mark.fast
+def test_forbidden_edges() -> None:
+    """
+    Test that routes do not use forbidden edges.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(30, 30))
+    matrix[rng.uniform(size=matrix.shape) < 0.3] = -1
+    routes, length = MultiVehicleSolver().solve(matrix.copy(), 0, 4)
+    assert length < np.inf
+    assert all(matrix[route[i - 1], route[i]] != -1 for route in routes for i in range(1, len(route)))
+
+
+@pytest.mark.fast
+def test_float32_matrix(sample_matrix: np.ndarray) -> None:
+    """
+    Test that float32 matrix gives valid routes with length summed in float64.
+    """
+    compact = sample_matrix.astype(np.float32)
+    routes, length = MultiVehicleSolver().solve(compact.copy(), 0, 4)
+    _check_routes(compact.astype(np.float64), routes, length, 0)
+    assert isinstance(length, float)
@@ -0,0 +1,116 @@
+"""Tests for Or-3opt algorithm of asymmetric TSP."""
+import math
+import time
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.heuristics import nearest_neighbour_tour, tour_length
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+from tsp_algorithms.or_3opt import Or3OptSolver
+
+
+def asymmetric_matrix(points_count: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Build matrix of distances between random points of plane with direction costs.
+    """
+    points = rng.uniform(0, 1000, size=(points_count, 2))
+    distances = np.linalg.norm(points[:, np.newaxis] - points[np.newaxis], axis=2)
+    return distances * rng.uniform(1, 1.5, size=(points_count, points_count))
+
+
+@pytest.fixture
+def sample_solver() -> Or3OptSolver:
+    """
+    Fixture for Or-3opt solver.
+    """
+    return Or3OptSolver()
+
+@pytest.mark.fast
+@pytest.mark.parametrize(
+    ("matrix_size", "salesmen_count", "start_vertex"),
+    [
+        (2, 1, 0),
+        (4, 1, 2),
+        (5, 2, 0),
+        (30, 1, 7),
+        (40, 3, 0),
+    ]
+)
+def test_routes_visit_every_point(
+        matrix_size: int,
+        salesmen_count: int,
+        start_vertex: int,
+        sample_solver: Or3OptSolver
+    ) -> None:
+    """
+    Test that every point is visited once and length of routes is correct.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(matrix_size, matrix_size))
+    np.fill_diagonal(matrix, np.inf)
+
+    routes, length = sample_solver.solve(matrix.copy(), start_vertex, salesmen_count)
+    assert len(routes) == salesmen_count
+    assert all(route[0] == route[-1] == start_vertex for route in routes)
+    visited = sorted(vertex for route in routes for vertex in route[1:-1])
+    assert visited == [i for i in range(matrix_size) if i != start_vertex]
+    route_length = sum(
+        matrix[route[i - 1], route[i]] for route in routes for i in range(1, len(route))
+    )
+    assert math.isclose(length, route_length, abs_tol=1e-5)
+
+def check_quality(matrix_size: int, tests_count: int) -> None:
+    """
+    Compare lengths of routes to optimal ones found by Little's algorithm.
+    """
+    rng = np.random.default_rng(seed=42)
+    gaps = []
+    for _ in range(tests_count):
+        matrix = asymmetric_matrix(matrix_size, rng)
+        _, length = Or3OptSolver().solve(matrix.copy(), 0)
+        _, optimal_length = LittleAlgorithm().solve(matrix.copy(), 0)
+        assert length >= optimal_length - 1e-5
+        gaps.append(length / optimal_length - 1)
+    assert np.mean(gaps) < 0.03
+    assert np.max(gaps) < 0.1
+
+@pytest.mark.fast
+def test_quality_compared_to_little_algorithm() -> None:
+    """
+    Test that routes of small asymmetric problems are close to optimal.
+    """
+    check_quality(10, 10)
+
+@pytest.mark.slow
+@pytest.mark.parametrize("matrix_size", [15, 20])
+def test_quality_compared_to_little_algorithm_slow(matrix_size: int) -> None:
+    """
+    Test that routes of larger asymmetric problems are close to optimal.
+    """
+    check_quality(matrix_size, 10)
+
+@pytest.mark.fast
+def test_time_limit() -> None:
+    """
+    Test that solver stops kicks when time is over.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = asymmetric_matrix(300, rng)
+    solver = Or3OptSolver(max_kicks=10**6)
+    solve_start = time.perf_counter()
+    _, length = solver.solve(matrix.copy(), 0, time_limit=0.2)
+    assert time.perf_counter() - solve_start < 2
+    assert 0 < solver.kicks < 10**6
+    assert length < tour_length(matrix, nearest_neighbour_tour(matrix, 0))
+
+@pytest.mark.fast
+def test_same_seed_gives_same_route() -> None:
+    """
+    Test that result depends only on seed of random kicks.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = asymmetric_matrix(50, rng)
+    first = Or3OptSolver(seed=1).solve(matrix.copy(), 0)
+    second = Or3OptSolver(seed=1).solve(matrix.copy(), 0)
+    assert first == second
@@ -0,0 +1,98 @@
+"""Tests for choice of TSP solver."""
+import math
+
+import numpy as np
+import pytest
+
+from tsp_algorithms.bounds import assignment_bound
+from tsp_algorithms.little_algorithm import LittleAlgorithm
+from tsp_algorithms.local_search import LocalSearchSolver
+from tsp_algorithms.selection import SOLVERS, choose_solver
+
+
+def _euclidean_matrix(rng: np.random.Generator, size: int) -> np.ndarray:
+    """
+    Build symmetric matrix of distances between random points.
+    """
+    points = rng.uniform(0, 100, size=(size, 2))
+    return np.linalg.norm(points[:, None] - points[None, :], axis=2)
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize(("size", "symmetric", "expected"), [
+    (6, True, "brute_force"),
+    (15, True, "held_karp"),
+    (15, False, "held_karp"),
+    (22, True, "little"),
+    (40, False, "little"),
+    (60, True, "multi_start"),
+])
+def test_choice_by_size_and_symmetry(size: int, symmetric: bool, expected: str) -> None:  # noqa: FBT001
+    """
+    Test that exact solver is chosen while it is expected to fit into default budget.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = _euclidean_matrix(rng, size) if symmetric else rng.uniform(1, 100, size=(size, size))
+    choice = choose_solver(matrix)
+    assert choice.name == expected
+    assert choice.name in SOLVERS
+    assert choice.expected_time > 0
+    assert choice.reason
+
+
+@pytest.mark.fast
+def test_choice_depends_on_time_limit() -> None:
+    """
+    Test that smaller time budget leads to faster solver.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(40, 40))
+    assert choose_solver(matrix, time_limit=10).name == "little"
+    assert choose_solver(matrix, time_limit=0.5).name == "multi_start"
+    assert choose_solver(matrix, time_limit=1e-4).name == "local_search"
+
+
+@pytest.mark.fast
+def test_choice_counts_salesmen() -> None:
+    """
+    Test that every extra salesman is counted as extra vertex.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = _euclidean_matrix(rng, 8)
+    assert choose_solver(matrix).name == "brute_force"
+    assert choose_solver(matrix, salesmen_count=4).name == "held_karp"
+    matrix = _euclidean_matrix(rng, 200)
+    assert choose_solver(matrix).name == "multi_start"
+    assert choose_solver(matrix, salesmen_count=10).name == "multi_vehicle"
+
+
+@pytest.mark.fast
+def test_created_solver() -> None:
+    """
+    Test that chosen solver is created with its options and finds optimal route.
+    """
+    rng = np.random.default_rng(seed=42)
+    matrix = rng.uniform(1, 100, size=(22, 22))
+    matrix[3, 5] = -1
+    choice = choose_solver(matrix, time_limit=1)
+    solver = choice.create()
+    assert isinstance(solver, LittleAlgorithm)
+    assert choice.options == {"bound": assignment_bound}
+    _, length = solver.solve(matrix.copy(), 0)
+    _, expected_length = LittleAlgorithm().solve(matrix.copy(), 0)
+    assert math.isclose(length, expected_length)
+    assert choice.to_dict()["solver"] == "little"
+
+
+@pytest.mark.fast
+@pytest.mark.parametrize("size", [60, 200])
+def test_heuristic_choice_is_not_worse_than_local_search(size: int) -> None:
+    """
+    Test that heuristic chosen for symmetric matrix finds route not longer than single local search.
+    """
+    matrix = _euclidean_matrix(np.random.default_rng(seed=42), size)
+    choice = choose_solver(matrix)
+    assert choice.name == "multi_start"
+    _, length = choice.create().solve(matrix.copy(), 0)
+    _, local_search_length = LocalSearchSolver().solve(matrix.copy(), 0)
+    assert length <= local_search_length